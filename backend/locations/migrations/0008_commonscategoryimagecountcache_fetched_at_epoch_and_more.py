@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-08-30 03:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locations', '0007_delete_draftlocation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='commonscategoryimagecountcache',
+            name='fetched_at_epoch',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='viewitimagecountcache',
+            name='fetched_at_epoch',
+            field=models.BigIntegerField(default=0),
+        ),
+    ]
@@ -6,6 +6,7 @@ class CommonsCategoryImageCountCache(models.Model):
     category_name = models.CharField(max_length=255, unique=True)
     image_count = models.PositiveIntegerField(default=0)
     fetched_at = models.DateTimeField(default=timezone.now)
+    fetched_at_epoch = models.BigIntegerField(default=0)
 
     class Meta:
         ordering = ['category_name']
@@ -18,6 +19,7 @@ class ViewItImageCountCache(models.Model):
     wikidata_qid = models.CharField(max_length=32, unique=True)
     image_count = models.PositiveIntegerField(default=0)
     fetched_at = models.DateTimeField(default=timezone.now)
+    fetched_at_epoch = models.BigIntegerField(default=0)
 
     class Meta:
         ordering = ['wikidata_qid']
@@ -11,6 +11,8 @@ _WIKIDATA_QID_PATTERN = re.compile(r'(Q\d+)', flags=re.IGNORECASE)
 _WIKIDATA_PID_PATTERN = re.compile(r'(P\d+)', flags=re.IGNORECASE)
 _DATE_LIKE_ISO_PATTERN = re.compile(r'(?P<year>\d{4})(?:-(?P<month>\d{2})(?:-(?P<day>\d{2}))?)?$')
 _DATE_LIKE_FI_PATTERN = re.compile(r'(?P<day>\d{1,2})\.\s*(?P<month>\d{1,2})\.\s*(?P<year>\d{4})')
+_LANGUAGE_CODE_PATTERN = re.compile(r'[a-z]{2,12}')
+_CUSTOM_PROPERTY_DATATYPE_PATTERN = re.compile(r'[a-z0-9-]{2,64}')
 _COMMONS_ALLOWED_MIME_TYPES = {
     'audio/mpeg',  # MP3
     'audio/mp3',  # MP3 (non-standard but common)
@@ -193,7 +195,7 @@ class AddExistingWikidataItemSerializer(serializers.Serializer):
         raw_value = (value or '').strip().lower()
         if not raw_value:
             return ''
-        if re.fullmatch(r'[a-z]{2,12}', raw_value):
+        if _LANGUAGE_CODE_PATTERN.fullmatch(raw_value):
             return raw_value
         raise serializers.ValidationError('source_title_language must be a valid language code.')
 
@@ -280,7 +282,7 @@ class CommonsImageUploadSerializer(serializers.Serializer):
         raw_value = (value or '').strip().lower()
         if not raw_value:
             return ''
-        if re.fullmatch(r'[a-z]{2,12}', raw_value):
+        if _LANGUAGE_CODE_PATTERN.fullmatch(raw_value):
             return raw_value
         raise serializers.ValidationError('caption_language must be a valid language code.')
 
@@ -288,7 +290,7 @@ class CommonsImageUploadSerializer(serializers.Serializer):
         raw_value = (value or '').strip().lower()
         if not raw_value:
             return ''
-        if re.fullmatch(r'[a-z]{2,12}', raw_value):
+        if _LANGUAGE_CODE_PATTERN.fullmatch(raw_value):
             return raw_value
         raise serializers.ValidationError('description_language must be a valid language code.')
 
@@ -502,7 +504,7 @@ class CreateWikidataItemSerializer(serializers.Serializer):
         raw_value = (value or '').strip().lower()
         if not raw_value:
             return ''
-        if re.fullmatch(r'[a-z]{2,12}', raw_value):
+        if _LANGUAGE_CODE_PATTERN.fullmatch(raw_value):
             return raw_value
         raise serializers.ValidationError(f'{field_name} must be a valid language code.')
 
@@ -512,7 +514,7 @@ class CreateWikidataItemSerializer(serializers.Serializer):
         normalized: dict[str, str] = {}
         for raw_language, raw_text in value.items():
             language = str(raw_language or '').strip().lower()
-            if not re.fullmatch(r'[a-z]{2,12}', language):
+            if not _LANGUAGE_CODE_PATTERN.fullmatch(language):
                 raise serializers.ValidationError(f'{field_name} keys must be valid language codes.')
             text = str(raw_text or '').strip()
             if not text:
@@ -604,7 +606,7 @@ class CreateWikidataItemSerializer(serializers.Serializer):
             if not property_value:
                 continue
             datatype = str(raw_entry.get('datatype') or '').strip().lower()
-            if datatype and not re.fullmatch(r'[a-z0-9-]{2,64}', datatype):
+            if datatype and not _CUSTOM_PROPERTY_DATATYPE_PATTERN.fullmatch(datatype):
                 raise serializers.ValidationError(f'custom_properties[{index}].datatype has an invalid format.')
 
             unique_key = (property_id, property_value, datatype)
@@ -1,27 +1,44 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from contextvars import ContextVar
+import hashlib
 import json
 from dataclasses import dataclass
 from datetime import date, timedelta
-from functools import partial
+from functools import lru_cache
 import math
+import random
 import re
-from threading import Lock
-from time import perf_counter
-from typing import Any
+from queue import Empty, Queue
+from threading import Lock, Thread
+from time import perf_counter, time
+from typing import Any, Iterator
 from urllib.parse import quote, unquote, urlparse
 import xml.etree.ElementTree as ET
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is used as fallback
+    orjson = None
+try:
+    import ijson
+except ImportError:  # pragma: no cover - full-document parsing is used as fallback
+    ijson = None
+try:
+    import httpx
+except ImportError:  # pragma: no cover - the requests read session is used as fallback
+    httpx = None
 try:
     from requests_oauthlib import OAuth1
 except ImportError:  # pragma: no cover - handled in runtime configuration checks
     OAuth1 = None
 from django.conf import settings
-from django.db import close_old_connections
+from django.core.cache import cache
+from django.db import close_old_connections, connection, transaction
 from django.utils import timezone
 
 from .models import CommonsCategoryImageCountCache, ViewItImageCountCache
@@ -44,9 +61,72 @@ EXTERNAL_HTTP_USER_AGENT = (
     '(homepage: https://github.com/Wikimedia-Suomi/Wikikuvaajat-proto; '
     'contact: https://meta.wikimedia.org/wiki/User:Zache)'
 )
+# Ask SPARQL endpoints explicitly for the JSON results format and compressed
+# transfer; gzip cuts WDQS list-query payloads to a fraction of their size.
+_SPARQL_HTTP_HEADERS = {
+    'Accept': 'application/sparql-results+json, application/json;q=0.9, */*;q=0.1',
+    'Accept-Encoding': 'gzip, deflate',
+    'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
+    'User-Agent': EXTERNAL_HTTP_USER_AGENT,
+}
+
+
+def _build_read_session() -> requests.Session:
+    # All read-side fetches share one session so repeat calls reuse pooled
+    # TLS connections instead of paying a fresh handshake per request.
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(
+        {
+            'Accept': 'application/json',
+            'User-Agent': EXTERNAL_HTTP_USER_AGENT,
+        }
+    )
+    return session
+
+
+_READ_SESSION = _build_read_session()
+
+
+def _build_http2_client():
+    # When httpx and its h2 extra are installed, concurrent JSON reads get
+    # multiplexed over a single TLS connection per host instead of opening
+    # up to pool_maxsize urllib3 connections. Writes keep the requests
+    # stack since requests-oauthlib signs those sessions.
+    if httpx is None:
+        return None
+    try:
+        return httpx.Client(
+            http2=True,
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            headers={
+                'Accept': 'application/json',
+                'User-Agent': EXTERNAL_HTTP_USER_AGENT,
+            },
+        )
+    except ImportError:  # pragma: no cover - h2 extra missing
+        return None
+
+
+_HTTP2_CLIENT = _build_http2_client()
+_READ_REQUEST_ERRORS: tuple[type[Exception], ...] = (
+    (requests.RequestException,)
+    if _HTTP2_CLIENT is None
+    else (requests.RequestException, httpx.HTTPError)
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Location:
     id: str
     uri: str
@@ -99,6 +179,10 @@ class Location:
     protected_buildings_register_in_finland_building_id_p5313: str = ''
     helsinki_persistent_building_id_ratu_p8355: str = ''
 
+    def as_dict(self) -> dict[str, Any]:
+        # Flat field copy; cheaper than dataclasses.asdict, which deep-copies.
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 _WIKIDATA_API_URL = 'https://www.wikidata.org/w/api.php'
 _COMMONS_API_URL = 'https://commons.wikimedia.org/w/api.php'
@@ -118,14 +202,15 @@ _CITOID_LANGUAGE_QID_BY_CODE: dict[str, str] = {
     'fi': 'Q1412',
     'sv': 'Q9027',
 }
-_IMAGE_COUNT_REFRESH_MAX_WORKERS = 4
-_IMAGE_COUNT_REFRESH_EXECUTOR = ThreadPoolExecutor(
-    max_workers=_IMAGE_COUNT_REFRESH_MAX_WORKERS,
-    thread_name_prefix='image-count-refresh',
-)
+_IMAGE_COUNT_REFRESH_QUEUE: Queue = Queue()
+_IMAGE_COUNT_REFRESH_BATCH_MAX = 16
+_IMAGE_COUNT_REFRESH_BATCH_WAIT_SECONDS = 0.25
 _IMAGE_COUNT_REFRESH_LOCK = Lock()
-_PENDING_COMMONS_IMAGE_COUNT_REFRESHES: set[str] = set()
-_PENDING_VIEW_IT_IMAGE_COUNT_REFRESHES: set[str] = set()
+_IMAGE_COUNT_REFRESH_SINGLE_FLIGHT_TIMEOUT_SECONDS = 60
+_IMAGE_COUNT_CACHE_CUTOFF_JITTER_SECONDS = 30.0
+_IMAGE_COUNT_CACHE_HARD_TTL_MULTIPLIER = 4
+_PENDING_COMMONS_IMAGE_COUNT_REFRESHES: dict[str, Future] = {}
+_PENDING_VIEW_IT_IMAGE_COUNT_REFRESHES: dict[str, Future] = {}
 _LIST_RENDER_DEBUG_ACTIVE: ContextVar[bool] = ContextVar('list_render_debug_active', default=False)
 
 
@@ -180,7 +265,11 @@ def _list_render_debug_log_external_fetch(
     _list_render_debug_log(message)
 
 
-def _language_fallbacks(lang: str | None, include_mul: bool = True) -> list[str]:
+# The distinct (lang, include_mul) inputs seen by a process are a handful
+# of UI locales, so memoize the resolved chain; the cached value is a tuple
+# and the public wrapper hands each caller a fresh list.
+@lru_cache(maxsize=256)
+def _language_fallbacks_cached(lang: str | None, include_mul: bool = True) -> tuple[str, ...]:
     allowed = {code.lower() for code, _ in settings.LANGUAGES}
     default_lang = settings.LANGUAGE_CODE.lower()
     candidates: list[str] = []
@@ -207,7 +296,11 @@ def _language_fallbacks(lang: str | None, include_mul: bool = True) -> list[str]
         if candidate not in unique_candidates:
             unique_candidates.append(candidate)
 
-    return unique_candidates
+    return tuple(unique_candidates)
+
+
+def _language_fallbacks(lang: str | None, include_mul: bool = True) -> list[str]:
+    return list(_language_fallbacks_cached(lang, include_mul))
 
 
 def _sparql_label_languages(preferred_lang: str | None) -> str:
@@ -230,10 +323,16 @@ def _sparql_label_languages(preferred_lang: str | None) -> str:
     return ','.join(unique_candidates)
 
 
+def _is_simple_language_code(value: str) -> bool:
+    # Equivalent to re.fullmatch(r'[a-z]{2,12}', value) without the per-call
+    # regex overhead; this sits on the claim-building hot path.
+    return 2 <= len(value) <= 12 and value.isascii() and value.isalpha() and value.islower()
+
+
 def _wikipedia_site_url(preferred_lang: str | None) -> str:
     normalized = (preferred_lang or '').strip().lower().replace('_', '-')
     language_code = normalized.split('-', 1)[0] if normalized else 'en'
-    if not re.fullmatch(r'[a-z]{2,12}', language_code):
+    if not _is_simple_language_code(language_code):
         language_code = 'en'
     return f'https://{language_code}.wikipedia.org/'
 
@@ -312,15 +411,14 @@ def _query_sparql(query: str) -> list[dict[str, Any]]:
     request_started_at = perf_counter()
     request_url = str(getattr(settings, 'SPARQL_ENDPOINT', '') or '')
     try:
-        response = requests.post(
+        response = _READ_SESSION.post(
             settings.SPARQL_ENDPOINT,
             data={'query': query, 'format': 'application/sparql-results+json'},
-            headers={
-                'Accept': 'application/sparql-results+json, application/json;q=0.9, */*;q=0.1',
-                'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
-                'User-Agent': EXTERNAL_HTTP_USER_AGENT,
-            },
+            headers=_SPARQL_HTTP_HEADERS,
             timeout=settings.SPARQL_TIMEOUT_SECONDS,
+            # With ijson available the bindings are parsed straight off the
+            # wire instead of materializing the full response text first.
+            stream=ijson is not None,
         )
         request_url = str(getattr(response, 'url', '') or request_url)
         response.raise_for_status()
@@ -382,8 +480,24 @@ def _query_sparql(query: str) -> list[dict[str, Any]]:
 
         return bindings
 
+    if ijson is not None:
+        content_type = str(response.headers.get('Content-Type', '') or '').lower()
+        raw = getattr(response, 'raw', None)
+        if 'json' in content_type and raw is not None:
+            try:
+                raw.decode_content = True
+                return list(ijson.items(raw, 'results.bindings.item'))
+            except Exception as exc:
+                raise SPARQLServiceError(
+                    _sparql_error_with_query_link(
+                        f'SPARQL streaming parse failed: {exc}',
+                        query,
+                        request_url,
+                    )
+                ) from exc
+
     try:
-        payload = response.json()
+        payload = _parse_json_response(response)
     except ValueError as exc:
         content_type = response.headers.get('Content-Type', '').lower()
         preview = response.text[:200].replace('\n', ' ').strip()
@@ -1090,14 +1204,17 @@ def _apply_architect_values(
     return enriched if has_changes else item
 
 
+# Accept WKT-style coordinates from e.g. wdt:P625:
+# "Point(lon lat)" or "<CRS_URI> Point(lon lat)". Compiled once; large
+# SPARQL result sets run this against every binding.
+_WKT_POINT_PATTERN = re.compile(
+    r'POINT\s*\(\s*([+-]?\d+(?:\.\d+)?)\s*[,\s]\s*([+-]?\d+(?:\.\d+)?)\s*\)',
+    flags=re.IGNORECASE,
+)
+
+
 def _parse_coord_to_lat_lon(coord_value: str) -> tuple[float, float] | None:
-    # Accept WKT-style coordinates from e.g. wdt:P625:
-    # "Point(lon lat)" or "<CRS_URI> Point(lon lat)"
-    match = re.search(
-        r'POINT\s*\(\s*([+-]?\d+(?:\.\d+)?)\s*[,\s]\s*([+-]?\d+(?:\.\d+)?)\s*\)',
-        coord_value,
-        flags=re.IGNORECASE,
-    )
+    match = _WKT_POINT_PATTERN.search(coord_value)
     if not match:
         return None
 
@@ -1487,8 +1604,14 @@ SELECT DISTINCT
   ?permanentBuildingNumberVtjPrtP3824 ?protectedBuildingsRegisterInFinlandBuildingIdP5313
   ?helsinkiPersistentBuildingIdRatuP8355
 WHERE {{
-  {item_selector}
-  ?item wdt:P625 ?coord .
+  {{
+    SELECT DISTINCT ?item ?coord
+    WHERE {{
+      {item_selector}
+      ?item wdt:P625 ?coord .
+    }}
+    LIMIT {limit}
+  }}
   OPTIONAL {{ ?item schema:dateModified ?dateModified . }}
   OPTIONAL {{ ?item wdt:P373 ?commonsCategory . }}
   OPTIONAL {{ ?item wdt:P18 ?imageName . }}
@@ -1599,7 +1722,6 @@ WHERE {{
   OPTIONAL {{ ?item wdt:P8355 ?helsinkiPersistentBuildingIdRatuP8355 . }}
   SERVICE wikibase:label {{ bd:serviceParam wikibase:language "{safe_langs}". }}
 }}
-LIMIT {limit}
 '''
 
 
@@ -1838,7 +1960,7 @@ def fetch_locations(
         bindings_by_uri: dict[str, list[dict[str, Any]]] = {}
         for binding in bindings:
             try:
-                item = _format_binding(binding).__dict__
+                item = _format_binding(binding).as_dict()
             except SPARQLServiceError:
                 continue
             uri = str(item.get('uri') or '').strip()
@@ -1890,7 +2012,7 @@ def fetch_location_detail(
         bindings_by_uri: dict[str, list[dict[str, Any]]] = {}
         for binding in bindings:
             try:
-                item = _format_binding(binding).__dict__
+                item = _format_binding(binding).as_dict()
             except SPARQLServiceError:
                 continue
             normalized_uri = str(item.get('uri') or '').strip()
@@ -1969,6 +2091,33 @@ def fetch_location_children(
     return []
 
 
+def fetch_commons_subcategory_children_bulk(
+    category_names: list[str],
+    limit_per_parent: int = 200,
+) -> dict[str, list[dict[str, Any]]]:
+    normalized_parents: list[str] = []
+    seen_parents: set[str] = set()
+    for category_name in category_names:
+        normalized_parent = _normalize_commons_category(str(category_name or ''))
+        if not normalized_parent:
+            continue
+        dedupe_key = normalized_parent.lower()
+        if dedupe_key in seen_parents:
+            continue
+        seen_parents.add(dedupe_key)
+        normalized_parents.append(normalized_parent)
+
+    # list=categorymembers accepts a single cmtitle, so each parent still
+    # costs one request; batching here removes duplicate parents up front.
+    children_by_parent: dict[str, list[dict[str, Any]]] = {}
+    for normalized_parent in normalized_parents:
+        children_by_parent[normalized_parent] = _fetch_commons_subcategory_children_for_parent(
+            normalized_parent,
+            limit_per_parent,
+        )
+    return children_by_parent
+
+
 def fetch_commons_subcategory_children(
     category_name: str,
     limit: int = 200,
@@ -1976,114 +2125,191 @@ def fetch_commons_subcategory_children(
     normalized_parent = _normalize_commons_category(category_name)
     if not normalized_parent:
         return []
+    return _fetch_commons_subcategory_children_for_parent(normalized_parent, limit)
 
+
+def _fetch_commons_subcategory_children_for_parent(
+    normalized_parent: str,
+    limit: int,
+) -> list[dict[str, Any]]:
     requested_limit = max(1, min(int(limit), 500))
     parent_title = f'Category:{normalized_parent}'.replace(' ', '_')
-    seen_categories: set[str] = set()
-    results: list[dict[str, Any]] = []
-    cmcontinue: str | None = None
 
-    while len(results) < requested_limit:
-        params: dict[str, Any] = {
+    # The requested limit never exceeds one API page, so a single request is
+    # always enough and no cmcontinue pagination is needed.
+    payload = _external_json_get(
+        _COMMONS_API_URL,
+        {
             'action': 'query',
             'list': 'categorymembers',
             'cmtitle': parent_title,
             'cmtype': 'subcat',
-            'cmlimit': min(500, requested_limit - len(results)),
+            'cmprop': 'title',
+            'cmlimit': requested_limit,
             'format': 'json',
-        }
-        if cmcontinue:
-            params['cmcontinue'] = cmcontinue
-
-        payload = _external_json_get(_COMMONS_API_URL, params)
-        query_payload = payload.get('query', {})
-        if not isinstance(query_payload, dict):
-            break
-
-        members = query_payload.get('categorymembers', [])
-        if not isinstance(members, list):
-            break
+        },
+    )
+    query_payload = payload.get('query', {})
+    if not isinstance(query_payload, dict):
+        return []
 
-        for item in members:
-            if not isinstance(item, dict):
-                continue
-            title = str(item.get('title') or '').strip()
-            if not title:
-                continue
+    members = query_payload.get('categorymembers', [])
+    if not isinstance(members, list):
+        return []
 
-            subcategory_name = _normalize_commons_category(title)
-            if not subcategory_name:
-                continue
+    seen_categories: set[str] = set()
+    results: list[dict[str, Any]] = []
+    # Local-bind the per-member callables; LOAD_FAST beats LOAD_GLOBAL on
+    # this drain loop for large subcategory trees.
+    append_result = results.append
+    mark_seen = seen_categories.add
+    normalize = _normalize_commons_category
+    encode_id = encode_location_id
+    quote_title = quote
+    for item in members:
+        if not isinstance(item, dict):
+            continue
+        title = str(item.get('title') or '').strip()
+        if not title:
+            continue
 
-            category_key = subcategory_name.lower()
-            if category_key in seen_categories:
-                continue
+        subcategory_name = normalize(title)
+        if not subcategory_name:
+            continue
 
-            seen_categories.add(category_key)
-            wiki_title = f'Category:{subcategory_name}'.replace(' ', '_')
-            subcategory_uri = f'https://commons.wikimedia.org/wiki/{quote(wiki_title, safe=":/")}'
-            results.append(
-                {
-                    'id': encode_location_id(subcategory_uri),
-                    'uri': subcategory_uri,
-                    'name': subcategory_name,
-                    'source': 'commons',
-                    'commons_category': subcategory_name,
-                }
-            )
+        category_key = subcategory_name.lower()
+        if category_key in seen_categories:
+            continue
 
-            if len(results) >= requested_limit:
-                break
+        mark_seen(category_key)
+        wiki_title = f'Category:{subcategory_name}'.replace(' ', '_')
+        subcategory_uri = f'https://commons.wikimedia.org/wiki/{quote_title(wiki_title, safe=":/")}'
+        append_result(
+            {
+                'id': encode_id(subcategory_uri),
+                'uri': subcategory_uri,
+                'name': subcategory_name,
+                'source': 'commons',
+                'commons_category': subcategory_name,
+            }
+        )
 
         if len(results) >= requested_limit:
             break
 
-        continue_payload = payload.get('continue', {})
-        if not isinstance(continue_payload, dict):
-            break
-        next_continue = continue_payload.get('cmcontinue')
-        if not isinstance(next_continue, str) or not next_continue:
-            break
-        cmcontinue = next_continue
-
     return results
 
 
+def _parse_json_response(response: requests.Response) -> Any:
+    # orjson parses large string-heavy payloads several times faster than
+    # stdlib json; both raise ValueError subclasses on malformed input.
+    if orjson is not None:
+        content = getattr(response, 'content', None)
+        if isinstance(content, (bytes, bytearray, str)):
+            return orjson.loads(content)
+    return response.json()
+
+
+# Stdlib fallback encoder, built once; json.dumps would re-validate its
+# options and allocate a fresh encoder on every call.
+_COMPACT_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def _dumps_compact(value: Any) -> str:
+    # orjson serializes the nested snak dicts several times faster than
+    # stdlib json and already emits compact, non-ASCII output.
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return _COMPACT_JSON_ENCODER.encode(value)
+
+
+# Both settings are fixed at process start; cache them so per-request code
+# skips repeated LazySettings attribute lookups. Use cache_clear() in tests
+# that need to override the settings at runtime.
+@lru_cache(maxsize=1)
 def _external_timeout_seconds() -> int:
     return int(getattr(settings, 'SPARQL_TIMEOUT_SECONDS', 15))
 
 
+# wbgetentities responses carry an ETag and the API honours If-None-Match,
+# so revalidating a known entity costs a 304 with no body to parse. Keep
+# the last parsed payload per request alongside its ETag.
+_ETAG_CACHE_MAX_ENTRIES = 1024
+_ETAG_CACHE_LOCK = Lock()
+_ETAG_CACHE: dict[tuple[str, tuple[tuple[str, str], ...]], tuple[str, dict[str, Any]]] = {}
+
+
+def _clear_etag_cache() -> None:
+    with _ETAG_CACHE_LOCK:
+        _ETAG_CACHE.clear()
+
+
 def _external_json_get(url: str, params: dict[str, Any]) -> dict[str, Any]:
-    request_started_at = perf_counter()
+    # Skip the timing capture and response-URL lookup entirely when debug
+    # logging is off; this helper runs once per external fetch.
+    debug_enabled = _list_render_debug_enabled()
+    request_started_at = perf_counter() if debug_enabled else 0.0
     request_url = str(url or '')
+
+    etag_key = None
+    cached_etag_entry = None
+    if params.get('action') == 'wbgetentities':
+        etag_key = (url, tuple(sorted((key, str(value)) for key, value in params.items())))
+        with _ETAG_CACHE_LOCK:
+            cached_etag_entry = _ETAG_CACHE.get(etag_key)
+
+    request_headers = {
+        'Accept': 'application/json',
+        'Accept-Encoding': 'gzip, deflate',
+        'User-Agent': EXTERNAL_HTTP_USER_AGENT,
+    }
+    if cached_etag_entry is not None:
+        request_headers['If-None-Match'] = cached_etag_entry[0]
+
     try:
-        response = requests.get(
-            url,
-            params=params,
-            headers={
-                'Accept': 'application/json',
-                'User-Agent': EXTERNAL_HTTP_USER_AGENT,
-            },
-            timeout=_external_timeout_seconds(),
-        )
-        request_url = str(getattr(response, 'url', '') or request_url)
+        if _HTTP2_CLIENT is not None:
+            response = _HTTP2_CLIENT.get(
+                url,
+                params=params,
+                headers=request_headers,
+                timeout=_external_timeout_seconds(),
+            )
+        else:
+            response = _READ_SESSION.get(
+                url,
+                params=params,
+                headers=request_headers,
+                timeout=_external_timeout_seconds(),
+            )
+        if debug_enabled:
+            request_url = str(getattr(response, 'url', '') or request_url)
+        if cached_etag_entry is not None and response.status_code == 304:
+            if debug_enabled:
+                _list_render_debug_log_external_fetch(
+                    source='external-json',
+                    url=request_url,
+                    started_at=request_started_at,
+                )
+            return cached_etag_entry[1]
         response.raise_for_status()
-    except requests.RequestException as exc:
+    except _READ_REQUEST_ERRORS as exc:
+        if debug_enabled:
+            _list_render_debug_log_external_fetch(
+                source='external-json',
+                url=request_url,
+                started_at=request_started_at,
+                error=exc,
+            )
+        raise ExternalServiceError(f'External request failed: {exc}') from exc
+    if debug_enabled:
         _list_render_debug_log_external_fetch(
             source='external-json',
             url=request_url,
             started_at=request_started_at,
-            error=exc,
         )
-        raise ExternalServiceError(f'External request failed: {exc}') from exc
-    _list_render_debug_log_external_fetch(
-        source='external-json',
-        url=request_url,
-        started_at=request_started_at,
-    )
 
     try:
-        payload = response.json()
+        payload = _parse_json_response(response)
     except ValueError as exc:
         preview = response.text[:200].replace('\n', ' ').strip()
         raise ExternalServiceError(f'External service did not return JSON. preview={preview!r}') from exc
@@ -2091,6 +2317,50 @@ def _external_json_get(url: str, params: dict[str, Any]) -> dict[str, Any]:
     if not isinstance(payload, dict):
         raise ExternalServiceError('External service returned unexpected payload.')
 
+    if etag_key is not None:
+        etag = response.headers.get('ETag')
+        if isinstance(etag, str) and etag:
+            with _ETAG_CACHE_LOCK:
+                if len(_ETAG_CACHE) >= _ETAG_CACHE_MAX_ENTRIES:
+                    _ETAG_CACHE.clear()
+                _ETAG_CACHE[etag_key] = (etag, payload)
+
+    return payload
+
+
+# Autocomplete endpoints see the same query many times in a short window
+# (each keystroke re-issues earlier prefixes), so keep a small short-TTL
+# cache of read-only GET payloads in front of _external_json_get.
+_SEARCH_RESPONSE_CACHE_TTL_SECONDS = 30
+_SEARCH_RESPONSE_CACHE_MAX_ENTRIES = 512
+_SEARCH_RESPONSE_CACHE_LOCK = Lock()
+_SEARCH_RESPONSE_CACHE: dict[tuple[str, tuple[tuple[str, str], ...]], tuple[float, dict[str, Any]]] = {}
+
+
+def _clear_search_response_cache() -> None:
+    with _SEARCH_RESPONSE_CACHE_LOCK:
+        _SEARCH_RESPONSE_CACHE.clear()
+
+
+def _external_json_get_cached(url: str, params: dict[str, Any]) -> dict[str, Any]:
+    if 'token' in params:
+        return _external_json_get(url, params)
+
+    cache_key = (url, tuple(sorted((key, str(value)) for key, value in params.items())))
+    now = time()
+    with _SEARCH_RESPONSE_CACHE_LOCK:
+        cached = _SEARCH_RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            cached_at, cached_payload = cached
+            if now - cached_at < _SEARCH_RESPONSE_CACHE_TTL_SECONDS:
+                return cached_payload
+            del _SEARCH_RESPONSE_CACHE[cache_key]
+
+    payload = _external_json_get(url, params)
+    with _SEARCH_RESPONSE_CACHE_LOCK:
+        if len(_SEARCH_RESPONSE_CACHE) >= _SEARCH_RESPONSE_CACHE_MAX_ENTRIES:
+            _SEARCH_RESPONSE_CACHE.clear()
+        _SEARCH_RESPONSE_CACHE[cache_key] = (time(), payload)
     return payload
 
 
@@ -2252,11 +2522,11 @@ def _source_language_from_citoid(value: Any, fallback: str) -> str:
         normalized = candidate.strip().lower()
         if re.fullmatch(r'[a-z]{2,12}(?:-[a-z0-9]{2,8})?', normalized):
             return _wikidata_language_code(normalized.split('-', 1)[0], fallback=fallback)
-        if re.fullmatch(r'[a-z]{2,12}', normalized):
+        if _is_simple_language_code(normalized):
             return _wikidata_language_code(normalized, fallback=fallback)
     for candidate in language_candidates:
         normalized = candidate.strip().lower()
-        if re.fullmatch(r'[a-z]{2,12}', normalized):
+        if _is_simple_language_code(normalized):
             return normalized
     return _wikidata_language_code('', fallback=fallback)
 
@@ -2274,16 +2544,55 @@ def _citoid_source_language_qid(value: Any, lang: str | None = None) -> str:
     return _resolve_citoid_source_qid(language_candidates, lang=lang)
 
 
+_CITOID_CACHE_MAX_ENTRIES = 1024
+_CITOID_CACHE_LOCK = Lock()
+_CITOID_METADATA_CACHE: dict[tuple[str, str], tuple[float, dict[str, str]]] = {}
+
+
+@lru_cache(maxsize=1)
+def _citoid_cache_ttl_seconds() -> int:
+    raw_value = getattr(settings, 'CITOID_CACHE_TTL_SECONDS', 3600)
+    try:
+        parsed = int(raw_value)
+    except (TypeError, ValueError):
+        return 3600
+    return parsed if parsed > 0 else 0
+
+
 def fetch_citoid_metadata(source_url: str, lang: str | None = None) -> dict[str, str]:
     normalized_url = str(source_url or '').strip()
     if not normalized_url.startswith('http://') and not normalized_url.startswith('https://'):
         raise ExternalServiceError('A valid source URL is required.')
 
+    # Citations rarely change and editors re-open the same URLs, so serve
+    # recent lookups from an in-process cache instead of re-hitting Citoid.
+    cache_ttl = _citoid_cache_ttl_seconds()
+    cache_key = (normalized_url.lower(), str(lang or ''))
+    if cache_ttl > 0:
+        with _CITOID_CACHE_LOCK:
+            cached = _CITOID_METADATA_CACHE.get(cache_key)
+            if cached is not None:
+                cached_at, cached_metadata = cached
+                if perf_counter() - cached_at < cache_ttl:
+                    return dict(cached_metadata)
+                del _CITOID_METADATA_CACHE[cache_key]
+
+    metadata = _fetch_citoid_metadata_uncached(normalized_url, lang=lang)
+    if cache_ttl > 0:
+        with _CITOID_CACHE_LOCK:
+            if len(_CITOID_METADATA_CACHE) >= _CITOID_CACHE_MAX_ENTRIES:
+                _CITOID_METADATA_CACHE.clear()
+            _CITOID_METADATA_CACHE[cache_key] = (perf_counter(), dict(metadata))
+    return metadata
+
+
+def _fetch_citoid_metadata_uncached(normalized_url: str, lang: str | None = None) -> dict[str, str]:
     encoded_url = quote(normalized_url, safe='')
     request_url = f'{_CITOID_REST_API_URL}{encoded_url}'
-    request_started_at = perf_counter()
+    debug_enabled = _list_render_debug_enabled()
+    request_started_at = perf_counter() if debug_enabled else 0.0
     try:
-        response = requests.get(
+        response = _READ_SESSION.get(
             request_url,
             headers={
                 'Accept': 'application/json',
@@ -2291,24 +2600,27 @@ def fetch_citoid_metadata(source_url: str, lang: str | None = None) -> dict[str,
             },
             timeout=_external_timeout_seconds(),
         )
-        request_url = str(getattr(response, 'url', '') or request_url)
+        if debug_enabled:
+            request_url = str(getattr(response, 'url', '') or request_url)
         response.raise_for_status()
     except requests.RequestException as exc:
+        if debug_enabled:
+            _list_render_debug_log_external_fetch(
+                source='citoid',
+                url=request_url,
+                started_at=request_started_at,
+                error=exc,
+            )
+        raise ExternalServiceError(f'Citoid request failed: {exc}') from exc
+    if debug_enabled:
         _list_render_debug_log_external_fetch(
             source='citoid',
             url=request_url,
             started_at=request_started_at,
-            error=exc,
         )
-        raise ExternalServiceError(f'Citoid request failed: {exc}') from exc
-    _list_render_debug_log_external_fetch(
-        source='citoid',
-        url=request_url,
-        started_at=request_started_at,
-    )
 
     try:
-        payload = response.json()
+        payload = _parse_json_response(response)
     except ValueError as exc:
         preview = response.text[:200].replace('\n', ' ').strip()
         raise ExternalServiceError(f'Citoid service did not return JSON. preview={preview!r}') from exc
@@ -2373,6 +2685,7 @@ def fetch_citoid_metadata(source_url: str, lang: str | None = None) -> dict[str,
     }
 
 
+@lru_cache(maxsize=4096)
 def _extract_wikidata_qid(value: str) -> str:
     match = re.search(r'(Q\d+)', value, flags=re.IGNORECASE)
     if not match:
@@ -2388,18 +2701,17 @@ def _extract_wikidata_pid(value: str) -> str:
 
 
 def _label_for_language(value_map: dict[str, Any], fallbacks: list[str]) -> str:
+    # Flatten the entries once so each fallback costs a single dict lookup.
+    labels = {
+        language: entry.get('value')
+        for language, entry in value_map.items()
+        if isinstance(entry, dict) and entry.get('value')
+    }
     for lang in fallbacks:
-        entry = value_map.get(lang)
-        if isinstance(entry, dict):
-            label = entry.get('value')
-            if label:
-                return str(label)
-    for entry in value_map.values():
-        if isinstance(entry, dict):
-            label = entry.get('value')
-            if label:
-                return str(label)
-    return ''
+        label = labels.get(lang)
+        if label:
+            return str(label)
+    return str(next(iter(labels.values()), ''))
 
 
 def _entity_id_from_claim_value(value: Any) -> str:
@@ -2414,30 +2726,27 @@ def _entity_id_from_claim_value(value: Any) -> str:
     return ''
 
 
-def _first_claim_datavalue(claims: dict[str, Any], property_id: str) -> Any:
+def _iter_claim_values(claims: dict[str, Any], property_id: str):
+    # Shared entry -> mainsnak -> datavalue traversal for the claim helpers
+    # below; yields each datavalue's value exactly once.
     entries = claims.get(property_id)
     if not isinstance(entries, list):
-        return None
-
+        return
     for entry in entries:
-        mainsnak = entry.get('mainsnak', {}) if isinstance(entry, dict) else {}
-        datavalue = mainsnak.get('datavalue', {}) if isinstance(mainsnak, dict) else {}
+        mainsnak = entry.get('mainsnak') if isinstance(entry, dict) else None
+        datavalue = mainsnak.get('datavalue') if isinstance(mainsnak, dict) else None
         if isinstance(datavalue, dict) and 'value' in datavalue:
-            return datavalue['value']
-    return None
+            yield datavalue['value']
 
 
-def _claim_entity_ids(claims: dict[str, Any], property_id: str) -> list[str]:
-    entries = claims.get(property_id)
-    if not isinstance(entries, list):
-        return []
+def _first_claim_datavalue(claims: dict[str, Any], property_id: str) -> Any:
+    return next(_iter_claim_values(claims, property_id), None)
+
 
+def _claim_entity_ids(claims: dict[str, Any], property_id: str) -> list[str]:
     entity_ids: list[str] = []
     seen_ids: set[str] = set()
-    for entry in entries:
-        mainsnak = entry.get('mainsnak', {}) if isinstance(entry, dict) else {}
-        datavalue = mainsnak.get('datavalue', {}) if isinstance(mainsnak, dict) else {}
-        value = datavalue.get('value') if isinstance(datavalue, dict) else None
+    for value in _iter_claim_values(claims, property_id):
         entity_id = _entity_id_from_claim_value(value)
         if not entity_id:
             continue
@@ -2465,43 +2774,67 @@ def _string_from_claim_value(value: Any, fallbacks: list[str] | None = None) ->
     return ''
 
 
-def _first_claim_string(claims: dict[str, Any], property_id: str, fallbacks: list[str] | None = None) -> str:
-    entries = claims.get(property_id)
-    if not isinstance(entries, list):
-        return ''
+def _select_monolingual_text(candidates: list[tuple[str, str]], lowered_fallbacks: list[str]) -> str:
+    for lang in lowered_fallbacks:
+        for candidate_lang, candidate_text in candidates:
+            if candidate_lang == lang and candidate_text:
+                return candidate_text
+    for _, candidate_text in candidates:
+        if candidate_text:
+            return candidate_text
+    return ''
 
-    monolingual_candidates: list[tuple[str, str]] = []
 
-    for entry in entries:
-        mainsnak = entry.get('mainsnak', {}) if isinstance(entry, dict) else {}
-        datavalue = mainsnak.get('datavalue', {}) if isinstance(mainsnak, dict) else {}
-        if not isinstance(datavalue, dict):
-            continue
+def _first_claim_string(
+    claims: dict[str, Any],
+    property_id: str,
+    fallbacks: list[str] | None = None,
+    *,
+    lowered_fallbacks: list[str] | None = None,
+) -> str:
+    if lowered_fallbacks is None:
+        lowered_fallbacks = [lang.lower() for lang in fallbacks] if fallbacks else []
 
-        value = datavalue.get('value')
+    monolingual_candidates: list[tuple[str, str]] = []
+    for value in _iter_claim_values(claims, property_id):
         if isinstance(value, dict) and isinstance(value.get('text'), str):
             language = str(value.get('language') or '').lower()
             monolingual_candidates.append((language, value['text'].strip()))
             continue
 
-        text = _string_from_claim_value(value, fallbacks=fallbacks)
+        text = _string_from_claim_value(value)
         if text:
             return text
 
-    if fallbacks:
-        fallback_set = [lang.lower() for lang in fallbacks]
-        for lang in fallback_set:
-            for candidate_lang, candidate_text in monolingual_candidates:
-                if candidate_lang == lang and candidate_text:
-                    return candidate_text
+    return _select_monolingual_text(monolingual_candidates, lowered_fallbacks)
 
-    for _, candidate_text in monolingual_candidates:
-        if candidate_text:
-            return candidate_text
 
-    return ''
+# fetch_wikidata_entity needs a handful of claim-backed fields; collecting
+# them through one entry point walks each property list at most once and
+# normalizes the language fallbacks a single time instead of per property.
+_ENTITY_STRING_CLAIM_PROPS = ('P373', 'P6375', 'P281', 'P18')
 
 
+def _extract_entity_claim_fields(claims: dict[str, Any], fallbacks: list[str]) -> dict[str, Any]:
+    lowered_fallbacks = [lang.lower() for lang in fallbacks] if fallbacks else []
+    fields: dict[str, Any] = {
+        'P625': _first_claim_datavalue(claims, 'P625'),
+        'P31': _entity_id_from_claim_value(_first_claim_datavalue(claims, 'P31')),
+        'P131': _entity_id_from_claim_value(_first_claim_datavalue(claims, 'P131')),
+        'P706': _claim_entity_ids(claims, 'P706'),
+    }
+    for property_id in _ENTITY_STRING_CLAIM_PROPS:
+        fields[property_id] = _first_claim_string(
+            claims,
+            property_id,
+            lowered_fallbacks=lowered_fallbacks,
+        )
+    return fields
+
+
+# The same image filenames recur across list pages and paginations, so cache
+# the quoted URLs instead of re-encoding them per render.
+@lru_cache(maxsize=4096)
 def _commons_file_url(filename: str) -> str:
     normalized = filename.strip()
     if not normalized:
@@ -2518,6 +2851,7 @@ def _commons_file_url(filename: str) -> str:
     return f'https://commons.wikimedia.org/wiki/Special:FilePath/{encoded_name}'
 
 
+@lru_cache(maxsize=4096)
 def _commons_thumbnail_url(filename: str, width: int = _COMMONS_THUMB_WIDTH) -> str:
     base_url = _commons_file_url(filename)
     if not base_url:
@@ -2527,6 +2861,7 @@ def _commons_thumbnail_url(filename: str, width: int = _COMMONS_THUMB_WIDTH) ->
     return f'{base_url}?width={thumb_width}'
 
 
+@lru_cache(maxsize=4096)
 def _normalize_commons_category(value: str) -> str:
     category = value.strip()
     if not category:
@@ -2547,13 +2882,24 @@ def _petscan_category_value(category_name: str) -> str:
     return normalized.replace(' ', '_')
 
 
+# Characters that force percent-encoding in a wiki page URL; most category
+# titles are plain ASCII and can skip the quote() call entirely.
+_QUOTE_NEEDED_PATTERN = re.compile(r'[^A-Za-z0-9_:./-]')
+
+
+def _quote_wiki_title(title: str) -> str:
+    if not _QUOTE_NEEDED_PATTERN.search(title):
+        return title
+    return quote(title, safe=':/')
+
+
 def _commons_category_url(category_name: str) -> str:
     normalized = _normalize_commons_category(category_name)
     if not normalized:
         return ''
 
     title = f'Category:{normalized}'.replace(' ', '_')
-    return f'https://commons.wikimedia.org/wiki/{quote(title, safe=":/")}'
+    return f'https://commons.wikimedia.org/wiki/{_quote_wiki_title(title)}'
 
 
 def _view_it_url(qid: str) -> str:
@@ -2563,6 +2909,7 @@ def _view_it_url(qid: str) -> str:
     return f'https://view-it.toolforge.org/?q={quote(normalized, safe="")}'
 
 
+@lru_cache(maxsize=1)
 def _image_count_cache_ttl_seconds() -> int:
     raw_value = getattr(settings, 'IMAGE_COUNT_CACHE_TTL_SECONDS', 86400)
     try:
@@ -2572,11 +2919,36 @@ def _image_count_cache_ttl_seconds() -> int:
     return parsed if parsed > 0 else 0
 
 
-def _image_count_cache_cutoff(now_value):
+def _image_count_cache_cutoff(now_epoch: float):
+    """Return the (soft, hard) staleness cutoffs as epoch seconds.
+
+    Entries older than the soft cutoff are refreshed in the background but
+    still served; entries older than the hard cutoff are omitted entirely.
+    """
     ttl_seconds = _image_count_cache_ttl_seconds()
     if ttl_seconds <= 0:
-        return None
-    return now_value - timedelta(seconds=ttl_seconds)
+        return None, None
+    # Retire entries up to a small random amount early so a batch of rows
+    # cached together does not expire in lock-step on the same request.
+    jitter_seconds = random.uniform(
+        0.0,
+        min(_IMAGE_COUNT_CACHE_CUTOFF_JITTER_SECONDS, ttl_seconds / 2),
+    )
+    soft_cutoff = now_epoch - (ttl_seconds - jitter_seconds)
+    hard_cutoff = now_epoch - ttl_seconds * _IMAGE_COUNT_CACHE_HARD_TTL_MULTIPLIER
+    return soft_cutoff, hard_cutoff
+
+
+def _cache_entry_fetched_epoch(cache_entry) -> float:
+    # Rows written before the epoch column existed carry the default 0;
+    # fall back to the datetime column for those.
+    epoch = cache_entry.fetched_at_epoch
+    if epoch:
+        return epoch
+    fetched_at = cache_entry.fetched_at
+    if fetched_at is None:
+        return 0.0
+    return fetched_at.timestamp()
 
 
 def _is_cache_entry_fresh(fetched_at, cutoff) -> bool:
@@ -2587,6 +2959,9 @@ def _is_cache_entry_fresh(fetched_at, cutoff) -> bool:
     return fetched_at >= cutoff
 
 
+_COUNT_KEYS = ('n', 'count', 'total', 'pages')
+
+
 def _parse_non_negative_int(value: Any) -> int | None:
     if value is None or isinstance(value, bool):
         return None
@@ -2599,13 +2974,21 @@ def _parse_non_negative_int(value: Any) -> int | None:
     return parsed
 
 
-def _petscan_count_from_payload(payload: dict[str, Any]) -> int:
-    top_level_count = None
-    for key in ('n', 'count', 'total', 'pages'):
-        candidate = _parse_non_negative_int(payload.get(key))
+def _count_from_mapping(mapping: dict[str, Any]) -> int | None:
+    for count_key in _COUNT_KEYS:
+        value = mapping.get(count_key)
+        # Fast path: PetScan emits plain ints, so skip the tolerant
+        # str()/int() round trip that dominates large payload scans.
+        if type(value) is int:
+            return value if value >= 0 else 0
+        candidate = _parse_non_negative_int(value)
         if candidate is not None:
-            top_level_count = candidate
-            break
+            return candidate
+    return None
+
+
+def _petscan_count_from_payload(payload: dict[str, Any]) -> int:
+    top_level_count = _count_from_mapping(payload)
 
     sections = payload.get('*')
     if not isinstance(sections, list):
@@ -2624,12 +3007,10 @@ def _petscan_count_from_payload(payload: dict[str, Any]) -> int:
 
         article_bucket = section.get('a')
         if isinstance(article_bucket, dict):
-            for count_key in ('n', 'count', 'total', 'pages'):
-                candidate = _parse_non_negative_int(article_bucket.get(count_key))
-                if candidate is not None:
-                    explicit_count_total += candidate
-                    found_explicit_count = True
-                    break
+            candidate = _count_from_mapping(article_bucket)
+            if candidate is not None:
+                explicit_count_total += candidate
+                found_explicit_count = True
 
             pages = article_bucket.get('*')
             if isinstance(pages, list):
@@ -2637,12 +3018,10 @@ def _petscan_count_from_payload(payload: dict[str, Any]) -> int:
                 found_page_lists = True
                 continue
 
-        for count_key in ('n', 'count', 'total', 'pages'):
-            candidate = _parse_non_negative_int(section.get(count_key))
-            if candidate is not None:
-                explicit_count_total += candidate
-                found_explicit_count = True
-                break
+        candidate = _count_from_mapping(section)
+        if candidate is not None:
+            explicit_count_total += candidate
+            found_explicit_count = True
 
     if found_explicit_count:
         return explicit_count_total
@@ -2677,12 +3056,55 @@ def _fetch_petscan_image_count(category_name: str) -> int:
     return _petscan_count_from_payload(payload)
 
 
+_VIEW_IT_PREFIX_SCAN_BYTES = 8192
+_VIEW_IT_TOTAL_PATTERN = re.compile(rb'"total"\s*:\s*(\d+)')
+
+
+def _view_it_total_from_prefix(url: str) -> int | None:
+    """Scan the leading bytes of the View-it payload for ``total``.
+
+    The payload can carry thousands of result entries that this module only
+    ever counts, so stream the response and stop as soon as the total field
+    appears instead of downloading and parsing the whole body.
+    """
+    try:
+        with _READ_SESSION.get(
+            url,
+            headers={
+                'Accept': 'application/json',
+                'Accept-Encoding': 'gzip, deflate',
+                'User-Agent': EXTERNAL_HTTP_USER_AGENT,
+            },
+            timeout=_external_timeout_seconds(),
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            prefix = b''
+            for chunk in response.iter_content(chunk_size=2048):
+                if not isinstance(chunk, bytes):
+                    return None
+                prefix += chunk
+                match = _VIEW_IT_TOTAL_PATTERN.search(prefix)
+                if match:
+                    return int(match.group(1))
+                if len(prefix) >= _VIEW_IT_PREFIX_SCAN_BYTES:
+                    return None
+    except (requests.RequestException, ValueError, TypeError):
+        return None
+    return None
+
+
 def _fetch_view_it_image_count(qid: str) -> int:
     normalized_qid = _extract_wikidata_qid(qid)
     if not normalized_qid:
         return 0
 
-    payload = _external_json_get(f'{_VIEW_IT_API_BASE_URL}/{normalized_qid}', {})
+    url = f'{_VIEW_IT_API_BASE_URL}/{normalized_qid}'
+    total = _view_it_total_from_prefix(url)
+    if total is not None:
+        return total
+
+    payload = _external_json_get(url, {})
     total = _parse_non_negative_int(payload.get('total'))
     if total is not None:
         return total
@@ -2694,75 +3116,196 @@ def _fetch_view_it_image_count(qid: str) -> int:
     raise ExternalServiceError('View-it payload did not include total image count.')
 
 
-def _run_refresh_job(refresh_fn, key: str) -> None:
-    close_old_connections()
-    try:
-        refresh_fn(key)
-    finally:
-        close_old_connections()
+def _flush_image_counts(model, key_field: str, counts: dict[str, int]) -> None:
+    if not counts:
+        return
 
+    fetched_at = timezone.now()
+    fetched_at_epoch = int(fetched_at.timestamp())
+    with transaction.atomic():
+        existing_by_key = {
+            getattr(entry, key_field): entry
+            for entry in model.objects.filter(**{f'{key_field}__in': counts})
+        }
+        to_update = []
+        to_create = []
+        for key, image_count in counts.items():
+            entry = existing_by_key.get(key)
+            if entry is not None:
+                entry.image_count = image_count
+                entry.fetched_at = fetched_at
+                entry.fetched_at_epoch = fetched_at_epoch
+                to_update.append(entry)
+            else:
+                to_create.append(
+                    model(**{
+                        key_field: key,
+                        'image_count': image_count,
+                        'fetched_at': fetched_at,
+                        'fetched_at_epoch': fetched_at_epoch,
+                    })
+                )
+        if to_update:
+            model.objects.bulk_update(
+                to_update,
+                ['image_count', 'fetched_at', 'fetched_at_epoch'],
+                batch_size=500,
+            )
+        if to_create:
+            model.objects.bulk_create(to_create, batch_size=500, ignore_conflicts=True)
 
-def _refresh_commons_image_count(category_name: str) -> None:
-    try:
-        image_count = _fetch_petscan_image_count(category_name)
-    except ExternalServiceError:
-        return
 
-    CommonsCategoryImageCountCache.objects.update_or_create(
-        category_name=category_name,
-        defaults={
-            'image_count': image_count,
-            'fetched_at': timezone.now(),
-        },
-    )
+def _refresh_commons_image_counts(category_names: list[str]) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for category_name in category_names:
+        try:
+            counts[category_name] = _fetch_petscan_image_count(category_name)
+        except ExternalServiceError:
+            continue
 
+    _flush_image_counts(CommonsCategoryImageCountCache, 'category_name', counts)
+    _invalidate_count_lru(_COMMONS_COUNT_LRU, counts)
+    return counts
 
-def _refresh_view_it_image_count(wikidata_qid: str) -> None:
-    try:
-        image_count = _fetch_view_it_image_count(wikidata_qid)
-    except ExternalServiceError:
-        return
 
-    ViewItImageCountCache.objects.update_or_create(
-        wikidata_qid=wikidata_qid,
-        defaults={
-            'image_count': image_count,
-            'fetched_at': timezone.now(),
-        },
-    )
+def _refresh_view_it_image_counts(wikidata_qids: list[str]) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for wikidata_qid in wikidata_qids:
+        try:
+            counts[wikidata_qid] = _fetch_view_it_image_count(wikidata_qid)
+        except ExternalServiceError:
+            continue
 
+    _flush_image_counts(ViewItImageCountCache, 'wikidata_qid', counts)
+    _invalidate_count_lru(_VIEW_IT_COUNT_LRU, counts)
+    return counts
 
-def _cleanup_pending_refresh(
-    _future,
-    *,
-    pending_set: set[str],
-    refresh_key: str,
+
+_COMMONS_REFRESH_KIND = 'commons'
+_VIEW_IT_REFRESH_KIND = 'view-it'
+
+
+def _image_count_single_flight_key(kind: str, refresh_key: str) -> str:
+    return f'locations:image-count-refresh:{kind}:{refresh_key}'
+
+
+def _release_refresh_keys(
+    kind: str,
+    refresh_keys: list[str],
+    pending: dict[str, Future],
+    counts: dict[str, int],
 ) -> None:
     with _IMAGE_COUNT_REFRESH_LOCK:
-        pending_set.discard(refresh_key)
+        pending_futures = [(refresh_key, pending.pop(refresh_key, None)) for refresh_key in refresh_keys]
+    for refresh_key, future in pending_futures:
+        cache.delete(_image_count_single_flight_key(kind, refresh_key))
+        if future is not None and not future.done():
+            future.set_result(counts.get(refresh_key))
+
+
+def _drain_refresh_queue() -> list[tuple[str, str]]:
+    # Block until at least one key arrives, then keep collecting for a short
+    # window so bursty traffic is refreshed as one batch per backend.
+    batch = [_IMAGE_COUNT_REFRESH_QUEUE.get()]
+    deadline = perf_counter() + _IMAGE_COUNT_REFRESH_BATCH_WAIT_SECONDS
+    while len(batch) < _IMAGE_COUNT_REFRESH_BATCH_MAX:
+        remaining = deadline - perf_counter()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(_IMAGE_COUNT_REFRESH_QUEUE.get(timeout=remaining))
+        except Empty:
+            break
+    return batch
 
 
-def _submit_refresh(
-    refresh_key: str,
+def _image_count_refresh_worker() -> None:
+    while True:
+        batch = _drain_refresh_queue()
+        commons_keys = sorted({key for kind, key in batch if kind == _COMMONS_REFRESH_KIND})
+        view_it_keys = sorted({key for kind, key in batch if kind == _VIEW_IT_REFRESH_KIND})
+
+        close_old_connections()
+        try:
+            if commons_keys:
+                commons_counts: dict[str, int] = {}
+                try:
+                    commons_counts = _refresh_commons_image_counts(commons_keys)
+                finally:
+                    _release_refresh_keys(
+                        _COMMONS_REFRESH_KIND,
+                        commons_keys,
+                        _PENDING_COMMONS_IMAGE_COUNT_REFRESHES,
+                        commons_counts,
+                    )
+            if view_it_keys:
+                view_it_counts: dict[str, int] = {}
+                try:
+                    view_it_counts = _refresh_view_it_image_counts(view_it_keys)
+                finally:
+                    _release_refresh_keys(
+                        _VIEW_IT_REFRESH_KIND,
+                        view_it_keys,
+                        _PENDING_VIEW_IT_IMAGE_COUNT_REFRESHES,
+                        view_it_counts,
+                    )
+        except Exception:
+            # The worker is the only refresh thread; it must survive
+            # unexpected failures (e.g. a dropped database connection).
+            pass
+        finally:
+            close_old_connections()
+
+
+def _submit_refresh_batch(
+    refresh_keys: set[str],
     *,
-    pending_set: set[str],
-    refresh_fn,
-) -> None:
+    pending: dict[str, Future],
+    kind: str,
+) -> list[Future]:
+    """Queue refreshes for ``refresh_keys`` and return their futures.
+
+    Duplicate submissions join the in-flight future instead of starting a
+    second fetch, so a caller that wants the fresh value can wait on
+    ``future.result()`` while background callers ignore the return value.
+    Each future resolves to the refreshed count, or None when the fetch
+    failed or another process owns the refresh.
+    """
+    futures: list[Future] = []
+    if not refresh_keys:
+        return futures
+
+    # Claim the whole batch under one lock acquisition; the worker thread
+    # then drains the queue and refreshes the claimed keys in batches.
+    claimed_keys: list[str] = []
     with _IMAGE_COUNT_REFRESH_LOCK:
-        if refresh_key in pending_set:
-            return
-        pending_set.add(refresh_key)
-
-    try:
-        future = _IMAGE_COUNT_REFRESH_EXECUTOR.submit(_run_refresh_job, refresh_fn, refresh_key)
-    except RuntimeError:
-        with _IMAGE_COUNT_REFRESH_LOCK:
-            pending_set.discard(refresh_key)
-        return
+        for refresh_key in refresh_keys:
+            existing_future = pending.get(refresh_key)
+            if existing_future is not None:
+                futures.append(existing_future)
+                continue
+            future: Future = Future()
+            pending[refresh_key] = future
+            futures.append(future)
+            claimed_keys.append(refresh_key)
+
+    for refresh_key in claimed_keys:
+        # The pending map only dedupes inside this process; cache.add is
+        # atomic on the shared backend, so across processes exactly one
+        # winner refreshes each key while the rest keep serving stale rows.
+        if not cache.add(
+            _image_count_single_flight_key(kind, refresh_key),
+            1,
+            timeout=_IMAGE_COUNT_REFRESH_SINGLE_FLIGHT_TIMEOUT_SECONDS,
+        ):
+            with _IMAGE_COUNT_REFRESH_LOCK:
+                future = pending.pop(refresh_key, None)
+            if future is not None and not future.done():
+                future.set_result(None)
+            continue
 
-    future.add_done_callback(
-        partial(_cleanup_pending_refresh, pending_set=pending_set, refresh_key=refresh_key)
-    )
+        _IMAGE_COUNT_REFRESH_QUEUE.put((kind, refresh_key))
+    return futures
 
 
 def _queue_image_count_refresh(
@@ -2773,19 +3316,75 @@ def _queue_image_count_refresh(
     if not stale_categories and not stale_qids:
         return
 
-    for category in sorted(stale_categories):
-        _submit_refresh(
-            category,
-            pending_set=_PENDING_COMMONS_IMAGE_COUNT_REFRESHES,
-            refresh_fn=_refresh_commons_image_count,
-        )
+    _submit_refresh_batch(
+        stale_categories,
+        pending=_PENDING_COMMONS_IMAGE_COUNT_REFRESHES,
+        kind=_COMMONS_REFRESH_KIND,
+    )
+    _submit_refresh_batch(
+        stale_qids,
+        pending=_PENDING_VIEW_IT_IMAGE_COUNT_REFRESHES,
+        kind=_VIEW_IT_REFRESH_KIND,
+    )
+
+
+_IMAGE_COUNT_REFRESH_WORKER = Thread(
+    target=_image_count_refresh_worker,
+    name='image-count-refresh',
+    daemon=True,
+)
+_IMAGE_COUNT_REFRESH_WORKER.start()
+
+
+# Process-local front cache for the DB-backed count rows. Repeated panning
+# over the same region re-requests the same keys; serving them from memory
+# for a short window skips the database entirely.
+_COUNT_LRU_TTL_SECONDS = 60
+_COUNT_LRU_MAX_ENTRIES = 4096
+_COUNT_LRU_LOCK = Lock()
+_COMMONS_COUNT_LRU: dict[str, tuple[float, int]] = {}
+_VIEW_IT_COUNT_LRU: dict[str, tuple[float, int]] = {}
+
+
+def _clear_image_count_lrus() -> None:
+    with _COUNT_LRU_LOCK:
+        _COMMONS_COUNT_LRU.clear()
+        _VIEW_IT_COUNT_LRU.clear()
+
+
+def _probe_count_lru(
+    lru: dict[str, tuple[float, int]],
+    keys: set[str],
+    now_epoch: float,
+) -> tuple[dict[str, int], set[str]]:
+    hits: dict[str, int] = {}
+    misses: set[str] = set()
+    with _COUNT_LRU_LOCK:
+        for key in keys:
+            cached = lru.get(key)
+            if cached is not None and now_epoch - cached[0] < _COUNT_LRU_TTL_SECONDS:
+                hits[key] = cached[1]
+            else:
+                misses.add(key)
+    return hits, misses
+
+
+def _backfill_count_lru(
+    lru: dict[str, tuple[float, int]],
+    entries: dict[str, tuple[float, int]],
+) -> None:
+    if not entries:
+        return
+    with _COUNT_LRU_LOCK:
+        if len(lru) + len(entries) > _COUNT_LRU_MAX_ENTRIES:
+            lru.clear()
+        lru.update(entries)
 
-    for qid in sorted(stale_qids):
-        _submit_refresh(
-            qid,
-            pending_set=_PENDING_VIEW_IT_IMAGE_COUNT_REFRESHES,
-            refresh_fn=_refresh_view_it_image_count,
-        )
+
+def _invalidate_count_lru(lru: dict[str, tuple[float, int]], keys) -> None:
+    with _COUNT_LRU_LOCK:
+        for key in keys:
+            lru.pop(key, None)
 
 
 def _commons_counts_for_categories(categories: set[str]) -> tuple[dict[str, int], set[str]]:
@@ -2794,26 +3393,41 @@ def _commons_counts_for_categories(categories: set[str]) -> tuple[dict[str, int]
         normalized = _normalize_commons_category(category)
         if normalized:
             normalized_set.add(normalized)
-    normalized_categories = sorted(normalized_set)
+    normalized_categories = normalized_set
     if not normalized_categories:
         return {}, set()
 
-    now_value = timezone.now()
-    cutoff = _image_count_cache_cutoff(now_value)
+    now_epoch = time()
+    counts, lookup_categories = _probe_count_lru(
+        _COMMONS_COUNT_LRU, normalized_categories, now_epoch
+    )
+    stale_categories: set[str] = set()
+    if not lookup_categories:
+        return counts, stale_categories
+
+    soft_cutoff, hard_cutoff = _image_count_cache_cutoff(now_epoch)
     cache_entries = {
         entry.category_name: entry
-        for entry in CommonsCategoryImageCountCache.objects.filter(category_name__in=normalized_categories)
+        for entry in CommonsCategoryImageCountCache.objects.filter(category_name__in=lookup_categories)
     }
 
-    counts: dict[str, int] = {}
-    stale_categories: set[str] = set()
-    for category in normalized_categories:
+    backfill: dict[str, tuple[float, int]] = {}
+    for category in lookup_categories:
         cache_entry = cache_entries.get(category)
-        if cache_entry is not None:
+        if cache_entry is None:
+            stale_categories.add(category)
+            continue
+        fetched_epoch = _cache_entry_fetched_epoch(cache_entry)
+        if _is_cache_entry_fresh(fetched_epoch, hard_cutoff):
             counts[category] = cache_entry.image_count
-        if cache_entry is None or not _is_cache_entry_fresh(cache_entry.fetched_at, cutoff):
+        if not _is_cache_entry_fresh(fetched_epoch, soft_cutoff):
             stale_categories.add(category)
+        elif category in counts:
+            # Only soft-fresh rows go into the front cache so stale rows
+            # keep reaching the DB path that queues their refresh.
+            backfill[category] = (now_epoch, counts[category])
 
+    _backfill_count_lru(_COMMONS_COUNT_LRU, backfill)
     return counts, stale_categories
 
 
@@ -2823,75 +3437,124 @@ def _view_it_counts_for_qids(qids: set[str]) -> tuple[dict[str, int], set[str]]:
         normalized = _extract_wikidata_qid(qid)
         if normalized:
             normalized_set.add(normalized)
-    normalized_qids = sorted(normalized_set)
+    normalized_qids = normalized_set
     if not normalized_qids:
         return {}, set()
 
-    now_value = timezone.now()
-    cutoff = _image_count_cache_cutoff(now_value)
+    now_epoch = time()
+    counts, lookup_qids = _probe_count_lru(_VIEW_IT_COUNT_LRU, normalized_qids, now_epoch)
+    stale_qids: set[str] = set()
+    if not lookup_qids:
+        return counts, stale_qids
+
+    soft_cutoff, hard_cutoff = _image_count_cache_cutoff(now_epoch)
     cache_entries = {
         entry.wikidata_qid: entry
-        for entry in ViewItImageCountCache.objects.filter(wikidata_qid__in=normalized_qids)
+        for entry in ViewItImageCountCache.objects.filter(wikidata_qid__in=lookup_qids)
     }
 
-    counts: dict[str, int] = {}
-    stale_qids: set[str] = set()
-    for qid in normalized_qids:
+    backfill: dict[str, tuple[float, int]] = {}
+    for qid in lookup_qids:
         cache_entry = cache_entries.get(qid)
-        if cache_entry is not None:
+        if cache_entry is None:
+            stale_qids.add(qid)
+            continue
+        fetched_epoch = _cache_entry_fetched_epoch(cache_entry)
+        if _is_cache_entry_fresh(fetched_epoch, hard_cutoff):
             counts[qid] = cache_entry.image_count
-        if cache_entry is None or not _is_cache_entry_fresh(cache_entry.fetched_at, cutoff):
+        if not _is_cache_entry_fresh(fetched_epoch, soft_cutoff):
             stale_qids.add(qid)
+        elif qid in counts:
+            backfill[qid] = (now_epoch, counts[qid])
 
+    _backfill_count_lru(_VIEW_IT_COUNT_LRU, backfill)
     return counts, stale_qids
 
 
+_IMAGE_COUNT_DB_EXECUTOR = ThreadPoolExecutor(
+    max_workers=2,
+    thread_name_prefix='image-count-db',
+)
+
+
+def _run_count_lookup(lookup_fn, keys: set[str]) -> tuple[dict[str, int], set[str]]:
+    close_old_connections()
+    try:
+        return lookup_fn(keys)
+    finally:
+        close_old_connections()
+
+
+def _fetch_image_count_caches(
+    categories: set[str],
+    qids: set[str],
+) -> tuple[dict[str, int], set[str], dict[str, int], set[str]]:
+    # The two cache lookups hit independent tables; overlap their round
+    # trips when the database can actually serve them concurrently. SQLite
+    # serializes access on a single handle (and the in-memory test database
+    # is transaction-isolated per connection), so it keeps the serial path.
+    if connection.vendor != 'sqlite' and categories and qids:
+        commons_future = _IMAGE_COUNT_DB_EXECUTOR.submit(
+            _run_count_lookup, _commons_counts_for_categories, categories
+        )
+        view_it_counts, stale_qids = _view_it_counts_for_qids(qids)
+        commons_counts, stale_categories = commons_future.result()
+    else:
+        commons_counts, stale_categories = _commons_counts_for_categories(categories)
+        view_it_counts, stale_qids = _view_it_counts_for_qids(qids)
+    return commons_counts, stale_categories, view_it_counts, stale_qids
+
+
 def enrich_locations_with_image_counts(locations: list[dict[str, Any]]) -> list[dict[str, Any]]:
     if not locations:
         return locations
 
     normalized_categories: set[str] = set()
     normalized_qids: set[str] = set()
-    category_by_position: dict[int, str] = {}
-    qid_by_position: dict[int, str] = {}
+    # Parallel per-position buffers so the enrichment loop can zip over them
+    # instead of re-resolving keys through position->key dicts.
+    categories: list[str] = []
+    qids: list[str] = []
 
-    for index, location in enumerate(locations):
+    for location in locations:
         if not isinstance(location, dict):
+            categories.append('')
+            qids.append('')
             continue
 
         category = _normalize_commons_category(str(location.get('commons_category') or ''))
         if category:
             normalized_categories.add(category)
-            category_by_position[index] = category
+        categories.append(category)
 
         wikidata_qid = _extract_wikidata_qid(str(location.get('wikidata_item') or ''))
         if not wikidata_qid:
             wikidata_qid = _extract_wikidata_qid(str(location.get('uri') or ''))
         if wikidata_qid:
             normalized_qids.add(wikidata_qid)
-            qid_by_position[index] = wikidata_qid
+        qids.append(wikidata_qid)
 
-    commons_counts, stale_categories = _commons_counts_for_categories(normalized_categories)
-    view_it_counts, stale_qids = _view_it_counts_for_qids(normalized_qids)
+    commons_counts, stale_categories, view_it_counts, stale_qids = _fetch_image_count_caches(
+        normalized_categories,
+        normalized_qids,
+    )
     _queue_image_count_refresh(
         stale_categories=stale_categories,
         stale_qids=stale_qids,
     )
 
     enriched_locations: list[dict[str, Any]] = []
-    for index, location in enumerate(locations):
+    for location, category, qid in zip(locations, categories, qids):
         if not isinstance(location, dict):
             enriched_locations.append(location)
             continue
 
         enriched = dict(location)
-        category = category_by_position.get(index)
         if category:
             enriched['commons_category'] = category
             enriched['commons_category_url'] = _commons_category_url(category)
             enriched['commons_image_count_petscan'] = commons_counts.get(category)
 
-        qid = qid_by_position.get(index)
         if qid:
             enriched['view_it_qid'] = qid
             enriched['view_it_url'] = _view_it_url(qid)
@@ -2902,37 +3565,140 @@ def enrich_locations_with_image_counts(locations: list[dict[str, Any]]) -> list[
     return enriched_locations
 
 
-def _wikidata_labels_for_ids(entity_ids: list[str], fallbacks: list[str]) -> dict[str, str]:
-    if not entity_ids:
-        return {}
+_WBGETENTITIES_MAX_IDS = 50
+
+# Labels and claims rarely change between consecutive requests; memoize the
+# wbgetentities payloads in-process so repeated lookups for the same entity
+# skip the network round trip while the entry is still fresh.
+_WIKIDATA_ENTITY_CACHE_TTL_SECONDS = 600
+_WIKIDATA_ENTITY_CACHE_MAX_ENTRIES = 10000
+_WIKIDATA_ENTITY_CACHE_LOCK = Lock()
+_WIKIDATA_LABEL_CACHE: dict[tuple[str, tuple[str, ...]], tuple[float, str]] = {}
+_WIKIDATA_CLAIMS_CACHE: dict[str, tuple[float, dict[str, Any]]] = {}
+_WIKIDATA_MEMBERSHIP_CACHE: dict[tuple[str, str], float] = {}
+
+
+def _clear_wikidata_entity_caches() -> None:
+    with _WIKIDATA_ENTITY_CACHE_LOCK:
+        _WIKIDATA_LABEL_CACHE.clear()
+        _WIKIDATA_CLAIMS_CACHE.clear()
+        _WIKIDATA_MEMBERSHIP_CACHE.clear()
+    _clear_etag_cache()
+
+
+def _is_known_collection_member(entity_qid: str, collection_qid: str) -> bool:
+    now = time()
+    with _WIKIDATA_ENTITY_CACHE_LOCK:
+        confirmed_at = _WIKIDATA_MEMBERSHIP_CACHE.get((entity_qid, collection_qid))
+        if confirmed_at is None:
+            return False
+        if now - confirmed_at > _WIKIDATA_ENTITY_CACHE_TTL_SECONDS:
+            _WIKIDATA_MEMBERSHIP_CACHE.pop((entity_qid, collection_qid), None)
+            return False
+        return True
+
+
+def _remember_collection_member(entity_qid: str, collection_qid: str) -> None:
+    with _WIKIDATA_ENTITY_CACHE_LOCK:
+        if len(_WIKIDATA_MEMBERSHIP_CACHE) >= _WIKIDATA_ENTITY_CACHE_MAX_ENTRIES:
+            _WIKIDATA_MEMBERSHIP_CACHE.clear()
+        _WIKIDATA_MEMBERSHIP_CACHE[(entity_qid, collection_qid)] = time()
+
+
+def _invalidate_wikidata_claims_cache(entity_qid: str) -> None:
+    with _WIKIDATA_ENTITY_CACHE_LOCK:
+        _WIKIDATA_CLAIMS_CACHE.pop(entity_qid, None)
+
+
+def _cached_wikidata_claims(entity_qid: str) -> dict[str, Any] | None:
+    now = time()
+    with _WIKIDATA_ENTITY_CACHE_LOCK:
+        cached = _WIKIDATA_CLAIMS_CACHE.get(entity_qid)
+        if cached is None:
+            return None
+        cached_at, claims = cached
+        if now - cached_at > _WIKIDATA_ENTITY_CACHE_TTL_SECONDS:
+            _WIKIDATA_CLAIMS_CACHE.pop(entity_qid, None)
+            return None
+        return claims
+
+
+def _store_wikidata_claims(entity_qid: str, claims: dict[str, Any]) -> None:
+    with _WIKIDATA_ENTITY_CACHE_LOCK:
+        if len(_WIKIDATA_CLAIMS_CACHE) >= _WIKIDATA_ENTITY_CACHE_MAX_ENTRIES:
+            _WIKIDATA_CLAIMS_CACHE.clear()
+        _WIKIDATA_CLAIMS_CACHE[entity_qid] = (time(), claims)
 
-    unique_ids = sorted({entity_id.upper() for entity_id in entity_ids if entity_id})
-    if not unique_ids:
-        return {}
 
+def _fetch_wikidata_entities_chunk(entity_ids: list[str], fallbacks: list[str]) -> dict[str, Any]:
     payload = _external_json_get(
         _WIKIDATA_API_URL,
         {
             'action': 'wbgetentities',
-            'ids': '|'.join(unique_ids),
+            'ids': '|'.join(entity_ids),
             'props': 'labels',
             'languages': '|'.join(fallbacks),
             'format': 'json',
         },
     )
-
     entities = payload.get('entities', {})
-    if not isinstance(entities, dict):
+    return entities if isinstance(entities, dict) else {}
+
+
+def _wikidata_labels_for_ids(entity_ids: list[str], fallbacks: list[str]) -> dict[str, str]:
+    if not entity_ids:
+        return {}
+
+    unique_ids = {entity_id.upper() for entity_id in entity_ids if entity_id}
+    if not unique_ids:
         return {}
 
+    fallback_key = tuple(fallbacks)
     labels: dict[str, str] = {}
-    for entity_id in unique_ids:
-        entity = entities.get(entity_id, {})
-        if not isinstance(entity, dict):
-            continue
-        label = _label_for_language(entity.get('labels', {}), fallbacks)
-        if label:
-            labels[entity_id] = label
+    miss_ids: list[str] = []
+    now = time()
+    with _WIKIDATA_ENTITY_CACHE_LOCK:
+        for entity_id in unique_ids:
+            cached = _WIKIDATA_LABEL_CACHE.get((entity_id, fallback_key))
+            if cached is None or now - cached[0] > _WIKIDATA_ENTITY_CACHE_TTL_SECONDS:
+                miss_ids.append(entity_id)
+                continue
+            if cached[1]:
+                labels[entity_id] = cached[1]
+    if not miss_ids:
+        return labels
+
+    # wbgetentities rejects more than 50 ids per request; chunk larger
+    # inputs and fetch the chunks concurrently.
+    chunks = [
+        miss_ids[start:start + _WBGETENTITIES_MAX_IDS]
+        for start in range(0, len(miss_ids), _WBGETENTITIES_MAX_IDS)
+    ]
+    entities: dict[str, Any] = {}
+    if len(chunks) == 1:
+        entities = _fetch_wikidata_entities_chunk(chunks[0], fallbacks)
+    else:
+        with ThreadPoolExecutor(max_workers=5, thread_name_prefix='wikidata-labels') as executor:
+            futures = [
+                executor.submit(_fetch_wikidata_entities_chunk, chunk, fallbacks)
+                for chunk in chunks
+            ]
+            for future in futures:
+                entities.update(future.result())
+
+    fetched_at = time()
+    with _WIKIDATA_ENTITY_CACHE_LOCK:
+        if len(_WIKIDATA_LABEL_CACHE) + len(miss_ids) > _WIKIDATA_ENTITY_CACHE_MAX_ENTRIES:
+            _WIKIDATA_LABEL_CACHE.clear()
+        for entity_id in miss_ids:
+            entity = entities.get(entity_id, {})
+            label = ''
+            if isinstance(entity, dict):
+                label = _label_for_language(entity.get('labels', {}), fallbacks)
+            # Cache empty labels too so repeated misses do not refetch.
+            _WIKIDATA_LABEL_CACHE[(entity_id, fallback_key)] = (fetched_at, label)
+            if label:
+                labels[entity_id] = label
     return labels
 
 
@@ -3006,54 +3772,53 @@ def _wikidata_csrf_token(session: requests.Session) -> str:
     return csrf_token
 
 
-def _wikidata_api_get(session: requests.Session, params: dict[str, Any]) -> dict[str, Any]:
+_WIKIDATA_RESPONSE_MAX_BYTES = 32 * 1024 * 1024
+
+
+def _response_preview(response: requests.Response) -> str:
+    # Slice the raw bytes instead of response.text so a multi-megabyte error
+    # body is not decoded in full just to log 200 characters.
+    content = getattr(response, 'content', b'')
+    if isinstance(content, (bytes, bytearray)):
+        preview = bytes(content[:200]).decode('utf-8', errors='replace')
+    else:
+        preview = str(getattr(response, 'text', '') or '')[:200]
+    return preview.replace('\n', ' ').strip()
+
+
+def _wikidata_json_payload(response: requests.Response) -> dict[str, Any]:
     try:
-        response = session.get(
-            _WIKIDATA_API_URL,
-            params=params,
-            timeout=_external_timeout_seconds(),
+        declared_length = int(response.headers.get('Content-Length', ''))
+    except (AttributeError, TypeError, ValueError):
+        declared_length = None
+    if declared_length is not None and declared_length > _WIKIDATA_RESPONSE_MAX_BYTES:
+        raise WikidataWriteError(
+            f'Wikidata response too large ({declared_length} bytes).'
         )
-        response.raise_for_status()
-    except requests.RequestException as exc:
-        raise WikidataWriteError(f'Wikidata request failed: {exc}') from exc
 
     try:
-        payload = response.json()
+        payload = _parse_json_response(response)
     except ValueError as exc:
-        preview = response.text[:200].replace('\n', ' ').strip()
+        preview = _response_preview(response)
         raise WikidataWriteError(f'Wikidata service did not return JSON. preview={preview!r}') from exc
 
     if not isinstance(payload, dict):
         raise WikidataWriteError('Wikidata service returned unexpected payload.')
-
-    error_payload = payload.get('error')
-    if isinstance(error_payload, dict):
-        code = str(error_payload.get('code') or '').strip() or 'unknown'
-        info = str(error_payload.get('info') or '').strip() or 'unknown error'
-        raise WikidataWriteError(f'Wikidata API error ({code}): {info}')
-
     return payload
 
 
-def _wikidata_api_post(session: requests.Session, params: dict[str, Any]) -> dict[str, Any]:
+def _wikidata_api_get(session: requests.Session, params: dict[str, Any]) -> dict[str, Any]:
     try:
-        response = session.post(
+        response = session.get(
             _WIKIDATA_API_URL,
-            data=params,
+            params=params,
             timeout=_external_timeout_seconds(),
         )
         response.raise_for_status()
     except requests.RequestException as exc:
         raise WikidataWriteError(f'Wikidata request failed: {exc}') from exc
 
-    try:
-        payload = response.json()
-    except ValueError as exc:
-        preview = response.text[:200].replace('\n', ' ').strip()
-        raise WikidataWriteError(f'Wikidata service did not return JSON. preview={preview!r}') from exc
-
-    if not isinstance(payload, dict):
-        raise WikidataWriteError('Wikidata service returned unexpected payload.')
+    payload = _wikidata_json_payload(response)
 
     error_payload = payload.get('error')
     if isinstance(error_payload, dict):
@@ -3064,6 +3829,76 @@ def _wikidata_api_post(session: requests.Session, params: dict[str, Any]) -> dic
     return payload
 
 
+def _wikidata_api_post(session: requests.Session, params: dict[str, Any]) -> dict[str, Any]:
+    retried_bad_token = False
+    while True:
+        try:
+            response = session.post(
+                _WIKIDATA_API_URL,
+                data=params,
+                timeout=_external_timeout_seconds(),
+            )
+            response.raise_for_status()
+        except requests.RequestException as exc:
+            raise WikidataWriteError(f'Wikidata request failed: {exc}') from exc
+
+        payload = _wikidata_json_payload(response)
+
+        error_payload = payload.get('error')
+        if isinstance(error_payload, dict):
+            code = str(error_payload.get('code') or '').strip() or 'unknown'
+            info = str(error_payload.get('info') or '').strip() or 'unknown error'
+            if code == 'badtoken':
+                # The cached CSRF token went stale; drop the cached sessions
+                # and, for token-bearing writes, retry once with a token
+                # fetched on the still-authorized session.
+                _evict_wikidata_oauth_sessions()
+                if not retried_bad_token and 'token' in params:
+                    retried_bad_token = True
+                    params = dict(params)
+                    params['token'] = _wikidata_csrf_token(session)
+                    continue
+            raise WikidataWriteError(f'Wikidata API error ({code}): {info}')
+
+        return payload
+
+
+_OAUTH_SESSION_CACHE_MAX_ENTRIES = 256
+_OAUTH_SESSION_CACHE_LOCK = Lock()
+_WIKIDATA_OAUTH_SESSION_CACHE: dict[str, tuple[float, requests.Session, str]] = {}
+
+
+# CSRF tokens live for the OAuth session, so the cached session+token pair
+# can be reused well past the old 5 minute default; 50 minutes keeps a
+# safety margin and badtoken responses evict-and-retry regardless.
+_OAUTH_SESSION_CACHE_DEFAULT_TTL_SECONDS = 2700
+
+
+@lru_cache(maxsize=1)
+def _oauth_session_cache_ttl_seconds() -> int:
+    raw_value = getattr(
+        settings,
+        'OAUTH_SESSION_CACHE_TTL_SECONDS',
+        _OAUTH_SESSION_CACHE_DEFAULT_TTL_SECONDS,
+    )
+    try:
+        parsed = int(raw_value)
+    except (TypeError, ValueError):
+        return _OAUTH_SESSION_CACHE_DEFAULT_TTL_SECONDS
+    return parsed if parsed > 0 else 0
+
+
+def _oauth_session_cache_key(access_token: str, access_token_secret: str) -> str:
+    # Fingerprint the credentials so the raw secret never sits in a dict key
+    # that could end up in logs or debug output.
+    return hashlib.sha256(f'{access_token}:{access_token_secret}'.encode()).hexdigest()
+
+
+def _evict_wikidata_oauth_sessions() -> None:
+    with _OAUTH_SESSION_CACHE_LOCK:
+        _WIKIDATA_OAUTH_SESSION_CACHE.clear()
+
+
 def _wikidata_oauth_session(
     oauth_token: str = '',
     oauth_token_secret: str = '',
@@ -3085,6 +3920,19 @@ def _wikidata_oauth_session(
             'Install dependencies from backend/requirements.txt.'
         )
 
+    # Reuse the signed session and CSRF token for back-to-back writes from
+    # the same user so each claim does not pay an extra token round trip.
+    cache_ttl = _oauth_session_cache_ttl_seconds()
+    cache_key = _oauth_session_cache_key(access_token, access_token_secret)
+    if cache_ttl > 0:
+        with _OAUTH_SESSION_CACHE_LOCK:
+            cached = _WIKIDATA_OAUTH_SESSION_CACHE.get(cache_key)
+            if cached is not None:
+                cached_at, cached_session, cached_csrf_token = cached
+                if perf_counter() - cached_at < cache_ttl:
+                    return cached_session, cached_csrf_token
+                del _WIKIDATA_OAUTH_SESSION_CACHE[cache_key]
+
     consumer_key, consumer_secret, access_token, access_token_secret = _wikidata_oauth_credentials(
         oauth_token=access_token,
         oauth_token_secret=access_token_secret,
@@ -3099,6 +3947,11 @@ def _wikidata_oauth_session(
     )
 
     csrf_token = _wikidata_csrf_token(session)
+    if cache_ttl > 0:
+        with _OAUTH_SESSION_CACHE_LOCK:
+            if len(_WIKIDATA_OAUTH_SESSION_CACHE) >= _OAUTH_SESSION_CACHE_MAX_ENTRIES:
+                _WIKIDATA_OAUTH_SESSION_CACHE.clear()
+            _WIKIDATA_OAUTH_SESSION_CACHE[cache_key] = (perf_counter(), session, csrf_token)
     return session, csrf_token
 
 
@@ -3132,7 +3985,7 @@ def _commons_api_get(session: requests.Session, params: dict[str, Any]) -> dict[
         raise WikidataWriteError(f'Wikimedia Commons request failed: {exc}') from exc
 
     try:
-        payload = response.json()
+        payload = _parse_json_response(response)
     except ValueError as exc:
         preview = response.text[:200].replace('\n', ' ').strip()
         raise WikidataWriteError(f'Wikimedia Commons service did not return JSON. preview={preview!r}') from exc
@@ -3166,7 +4019,7 @@ def _commons_api_post(
         raise WikidataWriteError(f'Wikimedia Commons request failed: {exc}') from exc
 
     try:
-        payload = response.json()
+        payload = _parse_json_response(response)
     except ValueError as exc:
         preview = response.text[:200].replace('\n', ' ').strip()
         raise WikidataWriteError(f'Wikimedia Commons service did not return JSON. preview={preview!r}') from exc
@@ -3362,7 +4215,7 @@ def _commons_set_claim_qualifier(
             'claim': claim_id,
             'property': property_id,
             'snaktype': 'value',
-            'value': json.dumps(datavalue, ensure_ascii=False, separators=(',', ':')),
+            'value': _dumps_compact(datavalue),
             'token': csrf_token,
             'format': 'json',
         },
@@ -3407,7 +4260,7 @@ def _commons_add_point_of_view_claim(
             'entity': normalized_mediainfo_id,
             'property': 'P1259',
             'snaktype': 'value',
-            'value': json.dumps(coordinate_datavalue, ensure_ascii=False, separators=(',', ':')),
+            'value': _dumps_compact(coordinate_datavalue),
             'token': csrf_token,
             'format': 'json',
         },
@@ -3471,7 +4324,7 @@ def _commons_add_depicts_claims(
     if not re.fullmatch(r'M\d+', normalized_mediainfo_id):
         raise WikidataWriteError(f'Invalid Commons MediaInfo id: {normalized_mediainfo_id!r}')
 
-    for depict_qid in normalized_depicts:
+    def _post_depict_claim(depict_qid: str) -> None:
         _commons_api_post(
             session,
             data={
@@ -3479,16 +4332,21 @@ def _commons_add_depicts_claims(
                 'entity': normalized_mediainfo_id,
                 'property': 'P180',
                 'snaktype': 'value',
-                'value': json.dumps(
-                    _wikidata_entity_datavalue(depict_qid),
-                    ensure_ascii=False,
-                    separators=(',', ':'),
-                ),
+                'value': _dumps_compact(_wikidata_entity_datavalue(depict_qid)),
                 'token': csrf_token,
                 'format': 'json',
             },
         )
 
+    if len(normalized_depicts) == 1:
+        _post_depict_claim(normalized_depicts[0])
+    else:
+        # The claims are independent of each other, so overlap the write
+        # round trips; the session is shared read-only across workers.
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix='commons-depicts') as executor:
+            for future in [executor.submit(_post_depict_claim, qid) for qid in normalized_depicts]:
+                future.result()
+
     return normalized_depicts
 
 
@@ -3801,7 +4659,7 @@ def fetch_wikidata_authenticated_username(
         raise WikidataWriteError(f'Wikidata request failed: {exc}') from exc
 
     try:
-        payload = response.json()
+        payload = _parse_json_response(response)
     except ValueError as exc:
         response_text = str(getattr(response, 'text', '') or '')
         _log_wikidata_userinfo_failure(response_text, response.status_code, detail='non-json response')
@@ -3856,13 +4714,14 @@ def _wikidata_entity_datavalue(qid: str) -> dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=256)
 def _wikidata_language_code(value: str, fallback: str = 'en') -> str:
     normalized_fallback = str(fallback or '').strip().lower()
-    if not re.fullmatch(r'[a-z]{2,12}', normalized_fallback):
+    if not _is_simple_language_code(normalized_fallback):
         normalized_fallback = 'en'
 
     normalized = str(value or '').strip().lower()
-    if re.fullmatch(r'[a-z]{2,12}', normalized):
+    if _is_simple_language_code(normalized):
         return normalized
     return normalized_fallback
 
@@ -3899,7 +4758,7 @@ def _wikidata_time_datavalue(value: str) -> dict[str, Any]:
     if not normalized:
         raise WikidataWriteError('Empty time value is not allowed.')
 
-    if re.fullmatch(r'\d{4}', normalized):
+    if len(normalized) == 4 and normalized.isdecimal():
         year = int(normalized)
         if year < 1:
             raise WikidataWriteError('Year must be greater than 0.')
@@ -3912,7 +4771,12 @@ def _wikidata_time_datavalue(value: str) -> dict[str, Any]:
             'calendarmodel': _WIKIDATA_CALENDAR_MODEL,
         }
 
-    if re.fullmatch(r'\d{4}-\d{2}', normalized):
+    if (
+        len(normalized) == 7
+        and normalized[4] == '-'
+        and normalized[:4].isdecimal()
+        and normalized[5:].isdecimal()
+    ):
         try:
             year, month = normalized.split('-', 1)
             parsed_year = int(year)
@@ -3929,7 +4793,14 @@ def _wikidata_time_datavalue(value: str) -> dict[str, Any]:
             'calendarmodel': _WIKIDATA_CALENDAR_MODEL,
         }
 
-    if re.fullmatch(r'\d{4}-\d{2}-\d{2}', normalized):
+    if (
+        len(normalized) == 10
+        and normalized[4] == '-'
+        and normalized[7] == '-'
+        and normalized[:4].isdecimal()
+        and normalized[5:7].isdecimal()
+        and normalized[8:].isdecimal()
+    ):
         try:
             parsed = date.fromisoformat(normalized)
         except ValueError as exc:
@@ -4180,44 +5051,6 @@ def _wikidata_source_snaks(
     return snaks
 
 
-def _set_claim_reference(
-    session: requests.Session,
-    csrf_token: str,
-    claim_id: str,
-    source_url: str,
-    source_title: str = '',
-    source_title_language: str = '',
-    source_author: str = '',
-    source_publication_date: str = '',
-    source_publisher_p123: str = '',
-    source_published_in_p1433: str = '',
-    source_language_of_work_p407: str = '',
-) -> None:
-    snaks = _wikidata_source_snaks(
-        source_url,
-        source_title=source_title,
-        source_title_language=source_title_language,
-        source_author=source_author,
-        source_publication_date=source_publication_date,
-        source_publisher_p123=source_publisher_p123,
-        source_published_in_p1433=source_published_in_p1433,
-        source_language_of_work_p407=source_language_of_work_p407,
-    )
-    if not snaks:
-        return
-
-    _wikidata_api_post(
-        session,
-        {
-            'action': 'wbsetreference',
-            'statement': claim_id,
-            'snaks': json.dumps(snaks, ensure_ascii=False, separators=(',', ':')),
-            'token': csrf_token,
-            'format': 'json',
-        },
-    )
-
-
 def _set_claim_qualifier(
     session: requests.Session,
     csrf_token: str,
@@ -4232,17 +5065,29 @@ def _set_claim_qualifier(
             'claim': claim_id,
             'property': property_id,
             'snaktype': 'value',
-            'value': json.dumps(datavalue, ensure_ascii=False, separators=(',', ':')),
+            'value': _dumps_compact(datavalue),
             'token': csrf_token,
             'format': 'json',
         },
     )
 
 
-def _create_wikidata_claim(
-    session: requests.Session,
-    csrf_token: str,
-    entity_qid: str,
+def _wikibase_datavalue_type(datavalue: Any) -> str:
+    if isinstance(datavalue, dict):
+        if 'entity-type' in datavalue:
+            return 'wikibase-entityid'
+        if 'time' in datavalue:
+            return 'time'
+        if 'latitude' in datavalue:
+            return 'globecoordinate'
+        if 'text' in datavalue and 'language' in datavalue:
+            return 'monolingualtext'
+        if 'amount' in datavalue:
+            return 'quantity'
+    return 'string'
+
+
+def _build_wikidata_statement(
     property_id: str,
     datavalue: Any,
     source_url: str = '',
@@ -4254,28 +5099,41 @@ def _create_wikidata_claim(
     source_published_in_p1433: str = '',
     source_language_of_work_p407: str = '',
     qualifiers: dict[str, Any] | None = None,
-) -> str:
-    payload = _wikidata_api_post(
-        session,
-        {
-            'action': 'wbcreateclaim',
-            'entity': entity_qid,
-            'property': property_id,
+) -> dict[str, Any]:
+    claim: dict[str, Any] = {
+        'mainsnak': {
             'snaktype': 'value',
-            'value': json.dumps(datavalue, ensure_ascii=False, separators=(',', ':')),
-            'token': csrf_token,
-            'format': 'json',
+            'property': property_id,
+            'datavalue': {
+                'value': datavalue,
+                'type': _wikibase_datavalue_type(datavalue),
+            },
         },
-    )
-    claim = payload.get('claim', {})
-    claim_id = str(claim.get('id') or '').strip() if isinstance(claim, dict) else ''
-    if not claim_id:
-        raise WikidataWriteError(f'Wikidata API did not return claim id for {property_id}.')
+        'type': 'statement',
+        'rank': 'normal',
+    }
 
-    _set_claim_reference(
-        session,
-        csrf_token,
-        claim_id,
+    if qualifiers:
+        qualifier_snaks: dict[str, list[dict[str, Any]]] = {}
+        for qualifier_property, qualifier_value in qualifiers.items():
+            if qualifier_value is None:
+                continue
+            if isinstance(qualifier_value, str) and not qualifier_value.strip():
+                continue
+            qualifier_snaks.setdefault(qualifier_property, []).append(
+                {
+                    'snaktype': 'value',
+                    'property': qualifier_property,
+                    'datavalue': {
+                        'value': qualifier_value,
+                        'type': _wikibase_datavalue_type(qualifier_value),
+                    },
+                }
+            )
+        if qualifier_snaks:
+            claim['qualifiers'] = qualifier_snaks
+
+    reference_snaks = _wikidata_source_snaks(
         source_url,
         source_title=source_title,
         source_title_language=source_title_language,
@@ -4285,52 +5143,108 @@ def _create_wikidata_claim(
         source_published_in_p1433=source_published_in_p1433,
         source_language_of_work_p407=source_language_of_work_p407,
     )
+    if reference_snaks:
+        claim['references'] = [{'snaks': reference_snaks}]
 
-    if qualifiers:
-        for qualifier_property, qualifier_value in qualifiers.items():
-            if qualifier_value is None:
-                continue
-            if isinstance(qualifier_value, str) and not qualifier_value.strip():
-                continue
-            _set_claim_qualifier(
-                session,
-                csrf_token,
-                claim_id,
-                qualifier_property,
-                qualifier_value,
-            )
-    return claim_id
-
+    return claim
 
-def _entity_item_claims(claims: dict[str, Any], property_id: str, target_qid: str) -> list[dict[str, Any]]:
-    normalized_target = _extract_wikidata_qid(target_qid)
-    if not normalized_target:
-        return []
 
-    entries = claims.get(property_id)
-    if not isinstance(entries, list):
-        return []
+def _create_wikidata_claim(
+    session: requests.Session,
+    csrf_token: str,
+    entity_qid: str,
+    property_id: str,
+    datavalue: Any,
+    source_url: str = '',
+    source_title: str = '',
+    source_title_language: str = '',
+    source_author: str = '',
+    source_publication_date: str = '',
+    source_publisher_p123: str = '',
+    source_published_in_p1433: str = '',
+    source_language_of_work_p407: str = '',
+    qualifiers: dict[str, Any] | None = None,
+) -> None:
+    # wbeditentity accepts claim, qualifiers and references in one request;
+    # the old wbcreateclaim/wbsetreference/wbsetqualifier chain cost one
+    # round trip per piece. The granular helpers remain for flows that edit
+    # an existing claim by id.
+    claim = _build_wikidata_statement(
+        property_id,
+        datavalue,
+        source_url=source_url,
+        source_title=source_title,
+        source_title_language=source_title_language,
+        source_author=source_author,
+        source_publication_date=source_publication_date,
+        source_publisher_p123=source_publisher_p123,
+        source_published_in_p1433=source_published_in_p1433,
+        source_language_of_work_p407=source_language_of_work_p407,
+        qualifiers=qualifiers,
+    )
+
+    _wikidata_api_post(
+        session,
+        {
+            'action': 'wbeditentity',
+            'id': entity_qid,
+            'data': _dumps_compact({'claims': [claim]}),
+            'token': csrf_token,
+            'format': 'json',
+        },
+    )
+
+
+def _iter_entity_claim_ids(claims: dict[str, Any], property_id: str) -> Iterator[tuple[dict[str, Any], str]]:
+    """Yield ``(entry, entity_id)`` pairs for a property's item claims.
 
-    matching_claims: list[dict[str, Any]] = []
+    Malformed entries are skipped; the API always returns dicts here, so a
+    ``try/except`` fast path beats per-entry isinstance checks on the large
+    claim lists Wikidata serves for popular items.
+    """
+    entries = claims.get(property_id)
+    if not isinstance(entries, list):
+        return
     for entry in entries:
-        if not isinstance(entry, dict):
-            continue
-        mainsnak = entry.get('mainsnak', {})
-        if not isinstance(mainsnak, dict):
+        try:
+            datavalue = entry['mainsnak'].get('datavalue', {})
+        except (AttributeError, KeyError, TypeError):
             continue
-        datavalue = mainsnak.get('datavalue', {})
         if not isinstance(datavalue, dict):
             continue
+        # Inlined _entity_id_from_claim_value: this loop runs for every
+        # entry of large P5008/P31 claim lists, so skip the call overhead.
         value = datavalue.get('value')
-        entity_id = _entity_id_from_claim_value(value)
-        if entity_id and entity_id == normalized_target:
-            matching_claims.append(entry)
+        if type(value) is not dict:
+            continue
+        entity_id = value.get('id')
+        if isinstance(entity_id, str) and entity_id:
+            yield entry, entity_id.upper()
+            continue
+        numeric_id = value.get('numeric-id')
+        if isinstance(numeric_id, int):
+            yield entry, f'Q{numeric_id}'
+
 
-    return matching_claims
+def _entity_item_claims(claims: dict[str, Any], property_id: str, target_qid: str) -> list[dict[str, Any]]:
+    normalized_target = _extract_wikidata_qid(target_qid)
+    if not normalized_target:
+        return []
+    return [
+        entry
+        for entry, entity_id in _iter_entity_claim_ids(claims, property_id)
+        if entity_id == normalized_target
+    ]
 
 
 def _entity_has_item_claim(claims: dict[str, Any], property_id: str, target_qid: str) -> bool:
-    return bool(_entity_item_claims(claims, property_id, target_qid))
+    normalized_target = _extract_wikidata_qid(target_qid)
+    if not normalized_target:
+        return False
+    return any(
+        entity_id == normalized_target
+        for _entry, entity_id in _iter_entity_claim_ids(claims, property_id)
+    )
 
 
 def _reference_has_string_snak(snaks: dict[str, Any], property_id: str, expected_value: str) -> bool:
@@ -4351,8 +5265,8 @@ def _reference_has_string_snak(snaks: dict[str, Any], property_id: str, expected
     return False
 
 
-def _reference_has_entity_snak(snaks: dict[str, Any], property_id: str, expected_qid: str) -> bool:
-    normalized_expected_qid = _extract_wikidata_qid(expected_qid)
+def _reference_matches_entity_snak(snaks: dict[str, Any], property_id: str, normalized_expected_qid: str) -> bool:
+    # Expects the target QID pre-normalized; empty means "no constraint".
     if not normalized_expected_qid:
         return True
     property_snaks = snaks.get(property_id)
@@ -4364,8 +5278,18 @@ def _reference_has_entity_snak(snaks: dict[str, Any], property_id: str, expected
         datavalue = item_snak.get('datavalue', {})
         if not isinstance(datavalue, dict):
             continue
-        entity_id = _entity_id_from_claim_value(datavalue.get('value'))
-        if entity_id == normalized_expected_qid:
+        # Inlined _entity_id_from_claim_value; references on popular items
+        # carry long snak lists and this runs once per snak.
+        value = datavalue.get('value')
+        if type(value) is not dict:
+            continue
+        direct_id = value.get('id')
+        if isinstance(direct_id, str) and direct_id:
+            if direct_id.upper() == normalized_expected_qid:
+                return True
+            continue
+        numeric_id = value.get('numeric-id')
+        if isinstance(numeric_id, int) and f'Q{numeric_id}' == normalized_expected_qid:
             return True
     return False
 
@@ -4385,6 +5309,12 @@ def _claim_has_matching_source_reference(
     if not isinstance(references, list):
         return False
 
+    # Normalize the expected QIDs once up front; the cheap URL comparison
+    # filters out most references before any entity-snak work runs.
+    expected_publisher_qid = _extract_wikidata_qid(source_publisher_p123)
+    expected_published_in_qid = _extract_wikidata_qid(source_published_in_p1433)
+    expected_language_of_work_qid = _extract_wikidata_qid(source_language_of_work_p407)
+
     for reference in references:
         if not isinstance(reference, dict):
             continue
@@ -4393,11 +5323,11 @@ def _claim_has_matching_source_reference(
             continue
         if not _reference_has_string_snak(snaks, 'P854', normalized_url):
             continue
-        if not _reference_has_entity_snak(snaks, 'P123', source_publisher_p123):
+        if not _reference_matches_entity_snak(snaks, 'P123', expected_publisher_qid):
             continue
-        if not _reference_has_entity_snak(snaks, 'P1433', source_published_in_p1433):
+        if not _reference_matches_entity_snak(snaks, 'P1433', expected_published_in_qid):
             continue
-        if not _reference_has_entity_snak(snaks, 'P407', source_language_of_work_p407):
+        if not _reference_matches_entity_snak(snaks, 'P407', expected_language_of_work_qid):
             continue
         return True
 
@@ -4427,24 +5357,6 @@ def ensure_wikidata_collection_membership(
     if not normalized_collection_qid:
         raise WikidataWriteError('A valid collection Wikidata item id is required.')
 
-    session, csrf_token = _wikidata_oauth_session(
-        oauth_token=oauth_token,
-        oauth_token_secret=oauth_token_secret,
-    )
-    entity_payload = _wikidata_api_get(
-        session,
-        {
-            'action': 'wbgetentities',
-            'ids': normalized_entity_qid,
-            'props': 'claims',
-            'format': 'json',
-        },
-    )
-    entities = entity_payload.get('entities', {})
-    entity = entities.get(normalized_entity_qid, {}) if isinstance(entities, dict) else {}
-    claims = entity.get('claims', {}) if isinstance(entity, dict) else {}
-    claims = claims if isinstance(claims, dict) else {}
-
     normalized_source_url = str(source_url or '').strip()
     normalized_source_title = str(source_title or '').strip()
     normalized_source_title_language = str(source_title_language or '').strip()
@@ -4454,6 +5366,40 @@ def ensure_wikidata_collection_membership(
     normalized_source_published_in_qid = _extract_wikidata_qid(str(source_published_in_p1433 or '').strip())
     normalized_source_language_of_work_qid = _extract_wikidata_qid(str(source_language_of_work_p407 or '').strip())
 
+    # With no source URL there is no reference to add, so a confirmed
+    # membership means nothing would change; skip the wbgetentities round
+    # trip entirely for these idempotent re-imports.
+    if not normalized_source_url and _is_known_collection_member(
+        normalized_entity_qid,
+        normalized_collection_qid,
+    ):
+        return {
+            'qid': normalized_entity_qid,
+            'uri': f'https://www.wikidata.org/entity/{normalized_entity_qid}',
+            'already_listed': True,
+        }
+
+    session, csrf_token = _wikidata_oauth_session(
+        oauth_token=oauth_token,
+        oauth_token_secret=oauth_token_secret,
+    )
+    claims = _cached_wikidata_claims(normalized_entity_qid)
+    if claims is None:
+        entity_payload = _wikidata_api_get(
+            session,
+            {
+                'action': 'wbgetentities',
+                'ids': normalized_entity_qid,
+                'props': 'claims',
+                'format': 'json',
+            },
+        )
+        entities = entity_payload.get('entities', {})
+        entity = entities.get(normalized_entity_qid, {}) if isinstance(entities, dict) else {}
+        claims = entity.get('claims', {}) if isinstance(entity, dict) else {}
+        claims = claims if isinstance(claims, dict) else {}
+        _store_wikidata_claims(normalized_entity_qid, claims)
+
     matching_collection_claims = _entity_item_claims(claims, 'P5008', normalized_collection_qid)
     already_listed = bool(matching_collection_claims)
     if not already_listed:
@@ -4472,7 +5418,13 @@ def ensure_wikidata_collection_membership(
             source_published_in_p1433=normalized_source_published_in_qid,
             source_language_of_work_p407=normalized_source_language_of_work_qid,
         )
+        _invalidate_wikidata_claims_cache(normalized_entity_qid)
+        _remember_collection_member(normalized_entity_qid, normalized_collection_qid)
     else:
+        _remember_collection_member(normalized_entity_qid, normalized_collection_qid)
+        # Patch every claim that is missing the reference in one
+        # wbeditentity request instead of one wbsetreference per claim.
+        patched_claims: list[dict[str, Any]] = []
         for claim in matching_collection_claims:
             if not isinstance(claim, dict):
                 continue
@@ -4491,10 +5443,7 @@ def ensure_wikidata_collection_membership(
             ):
                 continue
 
-            _set_claim_reference(
-                session,
-                csrf_token,
-                claim_id,
+            reference_snaks = _wikidata_source_snaks(
                 normalized_source_url,
                 source_title=normalized_source_title,
                 source_title_language=normalized_source_title_language,
@@ -4504,6 +5453,28 @@ def ensure_wikidata_collection_membership(
                 source_published_in_p1433=normalized_source_published_in_qid,
                 source_language_of_work_p407=normalized_source_language_of_work_qid,
             )
+            if not reference_snaks:
+                continue
+
+            existing_references = claim.get('references')
+            references = list(existing_references) if isinstance(existing_references, list) else []
+            references.append({'snaks': reference_snaks})
+            patched_claim = dict(claim)
+            patched_claim['references'] = references
+            patched_claims.append(patched_claim)
+
+        if patched_claims:
+            _wikidata_api_post(
+                session,
+                {
+                    'action': 'wbeditentity',
+                    'id': normalized_entity_qid,
+                    'data': _dumps_compact({'claims': patched_claims}),
+                    'token': csrf_token,
+                    'format': 'json',
+                },
+            )
+            _invalidate_wikidata_claims_cache(normalized_entity_qid)
 
     return {
         'qid': normalized_entity_qid,
@@ -4512,6 +5483,22 @@ def ensure_wikidata_collection_membership(
     }
 
 
+def _payload_str(payload: dict[str, Any], key: str) -> str:
+    # The building-item payload is read ~20 times with the same
+    # str(...or '').strip() dance; fast-path the common cases so each read
+    # costs at most one allocation.
+    value = payload.get(key)
+    if isinstance(value, str):
+        return value.strip()
+    if value is None:
+        return ''
+    return str(value).strip()
+
+
+def _payload_qid(payload: dict[str, Any], key: str) -> str:
+    return _extract_wikidata_qid(_payload_str(payload, key))
+
+
 def create_wikidata_building_item(
     payload: dict[str, Any],
     lang: str | None = None,
@@ -4578,13 +5565,13 @@ def create_wikidata_building_item(
         payload.get('instance_of_p31'),
     )
     instance_of_qid = instance_of_qids[0] if instance_of_qids else ''
-    country_qid = _extract_wikidata_qid(str(payload.get('country_p17') or ''))
-    municipality_qid = _extract_wikidata_qid(str(payload.get('municipality_p131') or ''))
+    country_qid = _payload_qid(payload, 'country_p17')
+    municipality_qid = _payload_qid(payload, 'municipality_p131')
     part_of_qids = _collect_qid_values(
         payload.get('part_of_p361_values'),
         payload.get('part_of_p361'),
     )
-    location_qid = _extract_wikidata_qid(str(payload.get('location_p276') or ''))
+    location_qid = _payload_qid(payload, 'location_p276')
     if not instance_of_qid or not country_qid or not municipality_qid:
         raise WikidataWriteError('P31, P17 and P131 are required.')
 
@@ -4632,17 +5619,17 @@ def create_wikidata_building_item(
                 continue
             descriptions_by_language[language_code] = description_value
 
-    legacy_label = str(payload.get('label') or '').strip()
+    legacy_label = _payload_str(payload, 'label')
     legacy_label_language = _wikidata_language_code(
-        str(payload.get('label_language') or ''),
+        _payload_str(payload, 'label_language'),
         fallback=edit_language,
     )
     if legacy_label:
         labels_by_language[legacy_label_language] = legacy_label
 
-    legacy_description = str(payload.get('description') or '').strip()
+    legacy_description = _payload_str(payload, 'description')
     legacy_description_language = _wikidata_language_code(
-        str(payload.get('description_language') or ''),
+        _payload_str(payload, 'description_language'),
         fallback=edit_language,
     )
     if legacy_description:
@@ -4651,25 +5638,25 @@ def create_wikidata_building_item(
     if not set(labels_by_language).intersection(descriptions_by_language):
         raise WikidataWriteError('At least one label/description language pair is required.')
 
-    source_url = str(payload.get('source_url') or '').strip()
+    source_url = _payload_str(payload, 'source_url')
     if not source_url:
         raise WikidataWriteError('Source URL is required.')
-    source_title = str(payload.get('source_title') or '').strip()
+    source_title = _payload_str(payload, 'source_title')
     source_title_language = _wikidata_language_code(
-        str(payload.get('source_title_language') or ''),
+        _payload_str(payload, 'source_title_language'),
         fallback=edit_language,
     )
-    source_author = str(payload.get('source_author') or '').strip()
-    source_publication_date = str(payload.get('source_publication_date') or '').strip()
-    source_publisher_p123 = _extract_wikidata_qid(str(payload.get('source_publisher_p123') or ''))
-    source_published_in_p1433 = _extract_wikidata_qid(str(payload.get('source_published_in_p1433') or ''))
-    source_language_of_work_p407 = _extract_wikidata_qid(str(payload.get('source_language_of_work_p407') or ''))
+    source_author = _payload_str(payload, 'source_author')
+    source_publication_date = _payload_str(payload, 'source_publication_date')
+    source_publisher_p123 = _payload_qid(payload, 'source_publisher_p123')
+    source_published_in_p1433 = _payload_qid(payload, 'source_published_in_p1433')
+    source_language_of_work_p407 = _payload_qid(payload, 'source_language_of_work_p407')
     address_language = _wikidata_language_code(
-        str(payload.get('address_text_language_p6375') or ''),
+        _payload_str(payload, 'address_text_language_p6375'),
         fallback=edit_language,
     )
     route_instruction_language = _wikidata_language_code(
-        str(payload.get('route_instruction_language_p2795') or ''),
+        _payload_str(payload, 'route_instruction_language_p2795'),
         fallback=edit_language,
     )
     reserved_property_ids = {
@@ -4726,240 +5713,154 @@ def create_wikidata_building_item(
         oauth_token_secret=oauth_token_secret,
     )
 
-    create_payload = _wikidata_api_post(
-        session,
-        {
-            'action': 'wbeditentity',
-            'new': 'item',
-            'token': csrf_token,
-            'format': 'json',
-            'data': json.dumps(
-                {
-                    'labels': {
-                        language_code: {
-                            'language': language_code,
-                            'value': label_value,
-                        }
-                        for language_code, label_value in labels_by_language.items()
-                    },
-                    'descriptions': {
-                        language_code: {
-                            'language': language_code,
-                            'value': description_value,
-                        }
-                        for language_code, description_value in descriptions_by_language.items()
-                    },
-                },
-                ensure_ascii=False,
-                separators=(',', ':'),
-            ),
-        },
-    )
-    created_entity = create_payload.get('entity', {})
-    created_qid = _extract_wikidata_qid(str(created_entity.get('id') if isinstance(created_entity, dict) else ''))
-    if not created_qid:
-        raise WikidataWriteError('Wikidata API did not return created item id.')
+    # Assemble every statement up front and create the item with a single
+    # wbeditentity call; the previous one-claim-per-request flow cost a
+    # network round trip per property and could leave a half-built item
+    # behind when a later claim failed.
+    statements: list[dict[str, Any]] = []
 
     for instance_qid in instance_of_qids:
-        _create_wikidata_claim(
-            session,
-            csrf_token,
-            created_qid,
-            'P31',
-            _wikidata_entity_datavalue(instance_qid),
+        statements.append(
+            _build_wikidata_statement('P31', _wikidata_entity_datavalue(instance_qid))
         )
-    _create_wikidata_claim(
-        session,
-        csrf_token,
-        created_qid,
-        'P17',
-        _wikidata_entity_datavalue(country_qid),
+    statements.append(
+        _build_wikidata_statement('P17', _wikidata_entity_datavalue(country_qid))
     )
-    _create_wikidata_claim(
-        session,
-        csrf_token,
-        created_qid,
-        'P131',
-        _wikidata_entity_datavalue(municipality_qid),
+    statements.append(
+        _build_wikidata_statement('P131', _wikidata_entity_datavalue(municipality_qid))
     )
     for part_of_qid in part_of_qids:
-        _create_wikidata_claim(
-            session,
-            csrf_token,
-            created_qid,
-            'P361',
-            _wikidata_entity_datavalue(part_of_qid),
+        statements.append(
+            _build_wikidata_statement('P361', _wikidata_entity_datavalue(part_of_qid))
         )
     if location_qid:
-        _create_wikidata_claim(
-            session,
-            csrf_token,
-            created_qid,
-            'P276',
-            _wikidata_entity_datavalue(location_qid),
+        statements.append(
+            _build_wikidata_statement('P276', _wikidata_entity_datavalue(location_qid))
+        )
+    statements.append(
+        _build_wikidata_statement(
+            'P625',
+            {
+                'latitude': latitude,
+                'longitude': longitude,
+                'precision': 0.0001,
+                'globe': _WIKIDATA_GLOBE,
+            },
         )
-    _create_wikidata_claim(
-        session,
-        csrf_token,
-        created_qid,
-        'P625',
-        {
-            'latitude': latitude,
-            'longitude': longitude,
-            'precision': 0.0001,
-            'globe': _WIKIDATA_GLOBE,
-        },
     )
-    _create_wikidata_claim(
-        session,
-        csrf_token,
-        created_qid,
-        'P5008',
-        _wikidata_entity_datavalue(normalized_collection_qid),
-        source_url=source_url,
-        source_title=source_title,
-        source_title_language=source_title_language,
-        source_author=source_author,
-        source_publication_date=source_publication_date,
-        source_publisher_p123=source_publisher_p123,
-        source_published_in_p1433=source_published_in_p1433,
-        source_language_of_work_p407=source_language_of_work_p407,
+    statements.append(
+        _build_wikidata_statement(
+            'P5008',
+            _wikidata_entity_datavalue(normalized_collection_qid),
+            source_url=source_url,
+            source_title=source_title,
+            source_title_language=source_title_language,
+            source_author=source_author,
+            source_publication_date=source_publication_date,
+            source_publisher_p123=source_publisher_p123,
+            source_published_in_p1433=source_published_in_p1433,
+            source_language_of_work_p407=source_language_of_work_p407,
+        )
     )
 
     architect_qids = _collect_qid_values(
         payload.get('architect_p84_values'),
         payload.get('architect_p84'),
     )
-    architect_source_url = str(payload.get('architect_source_url') or '').strip()
+    architect_source_url = _payload_str(payload, 'architect_source_url')
     for architect_qid in architect_qids:
-        _create_wikidata_claim(
-            session,
-            csrf_token,
-            created_qid,
-            'P84',
-            _wikidata_entity_datavalue(architect_qid),
-            source_url=architect_source_url,
+        statements.append(
+            _build_wikidata_statement(
+                'P84',
+                _wikidata_entity_datavalue(architect_qid),
+                source_url=architect_source_url,
+            )
         )
 
     heritage_qids = _collect_qid_values(
         payload.get('heritage_designation_p1435_values'),
         payload.get('heritage_designation_p1435'),
     )
-    heritage_source_url = str(payload.get('heritage_source_url') or '').strip() or source_url
+    heritage_source_url = _payload_str(payload, 'heritage_source_url') or source_url
     for heritage_qid in heritage_qids:
-        _create_wikidata_claim(
-            session,
-            csrf_token,
-            created_qid,
-            'P1435',
-            _wikidata_entity_datavalue(heritage_qid),
-            source_url=heritage_source_url,
+        statements.append(
+            _build_wikidata_statement(
+                'P1435',
+                _wikidata_entity_datavalue(heritage_qid),
+                source_url=heritage_source_url,
+            )
         )
 
-    architectural_style_qid = _extract_wikidata_qid(str(payload.get('architectural_style_p149') or ''))
+    architectural_style_qid = _payload_qid(payload, 'architectural_style_p149')
     if architectural_style_qid:
-        _create_wikidata_claim(
-            session,
-            csrf_token,
-            created_qid,
-            'P149',
-            _wikidata_entity_datavalue(architectural_style_qid),
+        statements.append(
+            _build_wikidata_statement('P149', _wikidata_entity_datavalue(architectural_style_qid))
         )
 
-    state_of_use_qid = _extract_wikidata_qid(str(payload.get('state_of_use_p5817') or ''))
+    state_of_use_qid = _payload_qid(payload, 'state_of_use_p5817')
     if state_of_use_qid:
-        _create_wikidata_claim(
-            session,
-            csrf_token,
-            created_qid,
-            'P5817',
-            _wikidata_entity_datavalue(state_of_use_qid),
+        statements.append(
+            _build_wikidata_statement('P5817', _wikidata_entity_datavalue(state_of_use_qid))
         )
 
-    located_on_street_qid = _extract_wikidata_qid(str(payload.get('located_on_street_p669') or ''))
+    located_on_street_qid = _payload_qid(payload, 'located_on_street_p669')
     if located_on_street_qid:
-        _create_wikidata_claim(
-            session,
-            csrf_token,
-            created_qid,
-            'P669',
-            _wikidata_entity_datavalue(located_on_street_qid),
+        statements.append(
+            _build_wikidata_statement('P669', _wikidata_entity_datavalue(located_on_street_qid))
         )
 
-    inception_value = str(payload.get('inception_p571') or '').strip()
+    inception_value = _payload_str(payload, 'inception_p571')
     if inception_value:
-        _create_wikidata_claim(
-            session,
-            csrf_token,
-            created_qid,
-            'P571',
-            _wikidata_time_datavalue(inception_value),
-            source_url=str(payload.get('inception_source_url') or '').strip(),
+        statements.append(
+            _build_wikidata_statement(
+                'P571',
+                _wikidata_time_datavalue(inception_value),
+                source_url=_payload_str(payload, 'inception_source_url'),
+            )
         )
 
-    closure_date_value = str(payload.get('official_closure_date_p3999') or '').strip()
+    closure_date_value = _payload_str(payload, 'official_closure_date_p3999')
     if closure_date_value:
-        _create_wikidata_claim(
-            session,
-            csrf_token,
-            created_qid,
-            'P3999',
-            _wikidata_time_datavalue(closure_date_value),
-            source_url=str(payload.get('official_closure_date_source_url') or '').strip(),
+        statements.append(
+            _build_wikidata_statement(
+                'P3999',
+                _wikidata_time_datavalue(closure_date_value),
+                source_url=_payload_str(payload, 'official_closure_date_source_url'),
+            )
         )
 
-    address_text = str(payload.get('address_text_p6375') or '').strip()
+    address_text = _payload_str(payload, 'address_text_p6375')
     if address_text:
-        _create_wikidata_claim(
-            session,
-            csrf_token,
-            created_qid,
-            'P6375',
-            _wikidata_monolingual_text_datavalue(address_text, address_language, fallback=edit_language),
+        statements.append(
+            _build_wikidata_statement(
+                'P6375',
+                _wikidata_monolingual_text_datavalue(address_text, address_language, fallback=edit_language),
+            )
         )
 
-    postal_code = str(payload.get('postal_code_p281') or '').strip()
+    postal_code = _payload_str(payload, 'postal_code_p281')
     if postal_code:
-        _create_wikidata_claim(
-            session,
-            csrf_token,
-            created_qid,
-            'P281',
-            postal_code,
-        )
+        statements.append(_build_wikidata_statement('P281', postal_code))
 
-    commons_category = _normalize_commons_category(str(payload.get('commons_category_p373') or ''))
+    commons_category = _normalize_commons_category(_payload_str(payload, 'commons_category_p373'))
     if commons_category:
-        _create_wikidata_claim(
-            session,
-            csrf_token,
-            created_qid,
-            'P373',
-            commons_category,
-        )
+        statements.append(_build_wikidata_statement('P373', commons_category))
 
-    house_number = str(payload.get('house_number_p670') or '').strip()
+    house_number = _payload_str(payload, 'house_number_p670')
     if house_number:
-        _create_wikidata_claim(
-            session,
-            csrf_token,
-            created_qid,
-            'P670',
-            house_number,
-        )
+        statements.append(_build_wikidata_statement('P670', house_number))
 
-    route_instruction = str(payload.get('route_instruction_p2795') or '').strip()
+    route_instruction = _payload_str(payload, 'route_instruction_p2795')
     if route_instruction:
-        _create_wikidata_claim(
-            session,
-            csrf_token,
-            created_qid,
-            'P2795',
-            _wikidata_monolingual_text_datavalue(
-                route_instruction,
-                route_instruction_language,
-                fallback=edit_language,
-            ),
+        statements.append(
+            _build_wikidata_statement(
+                'P2795',
+                _wikidata_monolingual_text_datavalue(
+                    route_instruction,
+                    route_instruction_language,
+                    fallback=edit_language,
+                ),
+            )
         )
 
     missing_datatype_property_ids = [
@@ -4984,22 +5885,54 @@ def create_wikidata_building_item(
             datatype,
             language=edit_language,
         )
-        _create_wikidata_claim(
-            session,
-            csrf_token,
-            created_qid,
-            property_id,
-            datavalue,
-            source_url=source_url,
-            source_title=source_title,
-            source_title_language=source_title_language,
-            source_author=source_author,
-            source_publication_date=source_publication_date,
-            source_publisher_p123=source_publisher_p123,
-            source_published_in_p1433=source_published_in_p1433,
-            source_language_of_work_p407=source_language_of_work_p407,
+        statements.append(
+            _build_wikidata_statement(
+                property_id,
+                datavalue,
+                source_url=source_url,
+                source_title=source_title,
+                source_title_language=source_title_language,
+                source_author=source_author,
+                source_publication_date=source_publication_date,
+                source_publisher_p123=source_publisher_p123,
+                source_published_in_p1433=source_published_in_p1433,
+                source_language_of_work_p407=source_language_of_work_p407,
+            )
         )
 
+    create_payload = _wikidata_api_post(
+        session,
+        {
+            'action': 'wbeditentity',
+            'new': 'item',
+            'token': csrf_token,
+            'format': 'json',
+            'data': _dumps_compact(
+                {
+                    'labels': {
+                        language_code: {
+                            'language': language_code,
+                            'value': label_value,
+                        }
+                        for language_code, label_value in labels_by_language.items()
+                    },
+                    'descriptions': {
+                        language_code: {
+                            'language': language_code,
+                            'value': description_value,
+                        }
+                        for language_code, description_value in descriptions_by_language.items()
+                    },
+                    'claims': statements,
+                },
+            ),
+        },
+    )
+    created_entity = create_payload.get('entity', {})
+    created_qid = _extract_wikidata_qid(str(created_entity.get('id') if isinstance(created_entity, dict) else ''))
+    if not created_qid:
+        raise WikidataWriteError('Wikidata API did not return created item id.')
+
     return {
         'qid': created_qid,
         'uri': f'https://www.wikidata.org/entity/{created_qid}',
@@ -5014,7 +5947,7 @@ def search_wikidata_entities(query: str, lang: str | None = None, limit: int = 1
 
     fallbacks = _language_fallbacks(lang)
     language = fallbacks[0]
-    payload = _external_json_get(
+    payload = _external_json_get_cached(
         _WIKIDATA_API_URL,
         {
             'action': 'wbsearchentities',
@@ -5085,7 +6018,9 @@ def fetch_wikidata_entity(entity_id: str, lang: str | None = None) -> dict[str,
     label = _label_for_language(labels, fallbacks) or qid
     description = _label_for_language(descriptions, fallbacks)
 
-    coord_value = _first_claim_datavalue(claims, 'P625')
+    fields = _extract_entity_claim_fields(claims, fallbacks)
+
+    coord_value = fields['P625']
     latitude: float | None = None
     longitude: float | None = None
     if isinstance(coord_value, dict):
@@ -5099,13 +6034,13 @@ def fetch_wikidata_entity(entity_id: str, lang: str | None = None) -> dict[str,
             latitude = None
             longitude = None
 
-    instance_of_id = _entity_id_from_claim_value(_first_claim_datavalue(claims, 'P31'))
-    municipality_id = _entity_id_from_claim_value(_first_claim_datavalue(claims, 'P131'))
-    geographic_entity_ids = _claim_entity_ids(claims, 'P706')
-    commons_category = _first_claim_string(claims, 'P373', fallbacks=fallbacks)
-    address_text = _first_claim_string(claims, 'P6375', fallbacks=fallbacks)
-    postal_code = _first_claim_string(claims, 'P281', fallbacks=fallbacks)
-    image_name = _first_claim_string(claims, 'P18', fallbacks=fallbacks)
+    instance_of_id = fields['P31']
+    municipality_id = fields['P131']
+    geographic_entity_ids = fields['P706']
+    commons_category = fields['P373']
+    address_text = fields['P6375']
+    postal_code = fields['P281']
+    image_name = fields['P18']
     image_url = _commons_file_url(image_name)
     image_thumb_url = _commons_thumbnail_url(image_name)
 
@@ -5336,17 +6271,13 @@ LIMIT {combined_limit}
     request_started_at = perf_counter()
     request_url = _WIKIDATA_QUERY_SERVICE_URL
     try:
-        response = requests.post(
+        response = _READ_SESSION.post(
             _WIKIDATA_QUERY_SERVICE_URL,
             data={
                 'query': query,
                 'format': 'application/sparql-results+json',
             },
-            headers={
-                'Accept': 'application/sparql-results+json, application/json;q=0.9, */*;q=0.1',
-                'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
-                'User-Agent': EXTERNAL_HTTP_USER_AGENT,
-            },
+            headers=_SPARQL_HTTP_HEADERS,
             timeout=_external_timeout_seconds(),
         )
         request_url = str(getattr(response, 'url', '') or request_url)
@@ -5366,7 +6297,7 @@ LIMIT {combined_limit}
     )
 
     try:
-        payload = response.json()
+        payload = _parse_json_response(response)
     except ValueError as exc:
         preview = response.text[:200].replace('\n', ' ').strip()
         raise ExternalServiceError(
@@ -5517,7 +6448,7 @@ def fetch_latest_osm_feature_metadata(
     request_url = f'{_OSM_API_URL}/{normalized_type}/{normalized_id}.json'
     request_started_at = perf_counter()
     try:
-        response = requests.get(
+        response = _READ_SESSION.get(
             request_url,
             headers={
                 'Accept': 'application/json',
@@ -5549,7 +6480,7 @@ def fetch_latest_osm_feature_metadata(
     )
 
     try:
-        payload = response.json()
+        payload = _parse_json_response(response)
     except ValueError as exc:
         preview = response.text[:200].replace('\n', ' ').strip()
         raise ExternalServiceError(f'OSM API did not return JSON. preview={preview!r}') from exc
@@ -5596,7 +6527,7 @@ def search_commons_categories(query: str, limit: int = 10) -> list[dict[str, str
     if not prefix:
         return []
 
-    payload = _external_json_get(
+    payload = _external_json_get_cached(
         _COMMONS_API_URL,
         {
             'action': 'query',
@@ -5625,7 +6556,7 @@ def search_commons_categories(query: str, limit: int = 10) -> list[dict[str, str
             {
                 'name': name,
                 'title': f'Category:{name}',
-                'uri': f'https://commons.wikimedia.org/wiki/{quote(wiki_title, safe=":/")}',
+                'uri': f'https://commons.wikimedia.org/wiki/{_quote_wiki_title(wiki_title)}',
             }
         )
     return results
@@ -5637,7 +6568,7 @@ def search_geocode_places(query: str, limit: int = 10) -> list[dict[str, Any]]:
         return []
 
     try:
-        response = requests.get(
+        response = _READ_SESSION.get(
             _NOMINATIM_SEARCH_URL,
             params={
                 'q': search_term,
@@ -5655,7 +6586,7 @@ def search_geocode_places(query: str, limit: int = 10) -> list[dict[str, Any]]:
         raise ExternalServiceError(f'Geocoding request failed: {exc}') from exc
 
     try:
-        payload = response.json()
+        payload = _parse_json_response(response)
     except ValueError as exc:
         preview = response.text[:200].replace('\n', ' ').strip()
         raise ExternalServiceError(f'Geocoding service did not return JSON. preview={preview!r}') from exc
@@ -1,39 +1,284 @@
-from unittest.mock import patch
+from functools import lru_cache
+from unittest.mock import Mock, patch
 from urllib.parse import quote, unquote
 
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.http import HttpResponseRedirect
-from django.test import override_settings
+from django.test import SimpleTestCase, override_settings
 from django.urls import reverse
-from rest_framework.test import APITestCase
-
+from rest_framework.test import (
+    APIClient,
+    APIRequestFactory,
+    APISimpleTestCase,
+    APITestCase,
+    force_authenticate,
+)
+
+from locations import views
 from locations.services import ExternalServiceError, SPARQLServiceError, WikidataWriteError
 
+User = get_user_model()
+
+_JPEG_UPLOAD_BYTES = b'test-image-bytes'
+
+
+def _jpeg_upload(name='Example.jpg', payload=_JPEG_UPLOAD_BYTES):
+    # Always a fresh file: the upload view consumes the stream.
+    return SimpleUploadedFile(name, payload, content_type='image/jpeg')
+
+
+# reverse() walks the resolver tree on every call; the suite hits the same
+# handful of routes over and over, so resolve each name once.
+_LOCATION_LIST_URL = reverse('location-list')
+_LOCATION_CHILDREN_URL = reverse('location-children')
+_WIKIDATA_SEARCH_URL = reverse('wikidata-search')
+_WIKIDATA_ADD_EXISTING_URL = reverse('wikidata-add-existing')
+_WIKIDATA_CREATE_ITEM_URL = reverse('wikidata-create-item')
+_COMMONS_UPLOAD_URL = reverse('commons-upload')
+_COMMONS_CATEGORY_SEARCH_URL = reverse('commons-category-search')
+_CITOID_METADATA_URL = reverse('citoid-metadata')
+_GEOCODE_SEARCH_URL = reverse('geocode-search')
+_GEOCODE_REVERSE_URL = reverse('geocode-reverse')
+_AUTH_STATUS_URL = reverse('auth-status')
+_FRONTEND_APP_URL = reverse('frontend-app')
+
+
+# Calling the view callables straight through APIRequestFactory skips the
+# middleware chain, which the mock-only read tests never exercise.
+_REQUEST_FACTORY = APIRequestFactory()
+_location_list_view = views.LocationListAPIView.as_view()
+_location_detail_view = views.LocationDetailAPIView.as_view()
+_location_children_view = views.LocationChildrenAPIView.as_view()
+_wikidata_search_view = views.WikidataSearchAPIView.as_view()
+_wikidata_entity_view = views.WikidataEntityAPIView.as_view()
+_osm_feature_latest_view = views.OSMFeatureLatestAPIView.as_view()
+_citoid_metadata_view = views.CitoidMetadataAPIView.as_view()
+_commons_category_search_view = views.CommonsCategorySearchAPIView.as_view()
+_geocode_search_view = views.GeocodeSearchAPIView.as_view()
+_geocode_reverse_view = views.GeocodeReverseAPIView.as_view()
+_wikidata_add_existing_view = views.WikidataAddExistingAPIView.as_view()
+_wikidata_create_item_view = views.WikidataCreateItemAPIView.as_view()
+_commons_upload_view = views.CommonsImageUploadAPIView.as_view()
+
+
+@lru_cache(maxsize=None)
+def _location_detail_url(location_id):
+    return reverse('location-detail', kwargs={'location_id': location_id})
+
+
+@lru_cache(maxsize=None)
+def _wikidata_entity_url(entity_id):
+    return reverse('wikidata-entity', kwargs={'entity_id': entity_id})
+
+
+@lru_cache(maxsize=None)
+def _osm_feature_latest_url(feature_type, feature_id):
+    return reverse('osm-feature-latest', kwargs={'feature_type': feature_type, 'feature_id': feature_id})
+
+
+# Shared response payloads; the views only serialize these, so the tests can
+# hand the same module-level dicts to every mock instead of rebuilding the
+# literals per test. Tests that mutate a payload must copy it first.
+_HELSINKI_URI = 'https://www.wikidata.org/entity/Q1757'
+_HELSINKI_LOCATION_ID = quote(_HELSINKI_URI, safe='')
+_REMOVED_DRAFT_LOCATION_ID = quote('https://draft.local/location/123', safe='')
+_MISSING_ENTITY_LOCATION_ID = quote('https://www.wikidata.org/entity/Q999999999', safe='')
+_HTTP_PARENT_URI = 'http://www.wikidata.org/entity/Q18660756'
+_HTTP_PARENT_LOCATION_ID = quote(_HTTP_PARENT_URI, safe='')
+_CHILD_Q100_LOCATION_ID = quote('https://www.wikidata.org/entity/Q100', safe='')
+_CHILD_Q200_LOCATION_ID = quote('https://www.wikidata.org/entity/Q200', safe='')
+
+# Upstream-failure instances shared across error-path tests; the views only
+# catch and map these, so one instance per error type is enough.
+_UPSTREAM_SPARQL_ERROR = SPARQLServiceError('endpoint returned non-json')
+_UPSTREAM_SERVICE_ERROR = ExternalServiceError('upstream failure')
+_WRITE_ERROR = WikidataWriteError('login failed')
+_DUPLICATE_FILENAME_ERROR = WikidataWriteError('duplicate filename')
+_USERINFO_LOOKUP_ERROR = WikidataWriteError('userinfo request failed')
+
+_HELSINKI_LIST_PAYLOAD = [
+    {
+        'id': _HELSINKI_LOCATION_ID,
+        'uri': _HELSINKI_URI,
+        'name': 'Helsinki',
+        'description': 'Capital of Finland',
+        'latitude': 60.1699,
+        'longitude': 24.9384,
+    }
+]
+
+_HELSINKI_DETAIL_PAYLOAD = {
+    'id': _HELSINKI_LOCATION_ID,
+    'uri': _HELSINKI_URI,
+    'name': 'Helsinki',
+    'description': 'Capital of Finland',
+    'latitude': 60.1699,
+    'longitude': 24.9384,
+}
+
+_HELSINKI_DETAIL_WITH_SOURCES_PAYLOAD = {
+    **_HELSINKI_DETAIL_PAYLOAD,
+    'location_p276': 'https://www.wikidata.org/entity/Q33',
+    'location_p276_label': 'Finland',
+    'location_p276_wikipedia_url': 'https://en.wikipedia.org/wiki/Finland',
+    'collection_membership_source_url': 'https://example.org/source-1',
+    'collection_membership_source_urls': [
+        'https://example.org/source-1',
+        'https://example.org/source-2',
+    ],
+    'collection_membership_sources': [
+        {
+            'url': 'https://example.org/source-1',
+            'title': 'Example article',
+            'title_language': 'en',
+            'author': 'Example Author',
+            'publication_date': '+2026-01-02T00:00:00Z',
+            'retrieved_date': '',
+            'publisher': {'value': 'http://www.wikidata.org/entity/Q12321', 'label': 'Example Publisher'},
+            'published_in': {'value': 'http://www.wikidata.org/entity/Q12345', 'label': 'Example Newspaper'},
+            'language_of_work': {'value': 'http://www.wikidata.org/entity/Q1860', 'label': 'English'},
+        }
+    ],
+}
+
+_COMMONS_UPLOAD_FORM = {
+    'caption': 'Test caption',
+    'caption_language': 'fi',
+    'description': 'Test description',
+    'description_language': 'en',
+    'target_filename': 'Example_renamed.jpg',
+    'author': 'Example Photographer',
+    'source_url': 'https://example.org/source-photo',
+    'date_created': '2026-02-20',
+    'license_template': 'Cc-by-sa-4.0',
+    'categories_json': '["Helsinki","Finland"]',
+    'depicts_json': '["Q811979","Q16970"]',
+    'coordinate_source': 'map',
+    'latitude': '60.1699',
+    'longitude': '24.9384',
+    'heading': '173.4',
+    'elevation_meters': '14.2',
+    'wikidata_item': 'Q1757',
+}
+
+_COMMONS_UPLOAD_RESPONSE = {
+    'filename': 'Example.jpg',
+    'file_page_url': 'https://commons.wikimedia.org/wiki/File:Example.jpg',
+    'file_url': 'https://commons.wikimedia.org/wiki/Special:FilePath/Example.jpg',
+    'thumb_url': 'https://commons.wikimedia.org/wiki/Special:FilePath/Example.jpg?width=320',
+    'categories': ['Helsinki', 'Finland'],
+    'depicts': ['Q811979', 'Q16970'],
+    'wikidata_item': 'Q1757',
+}
+
+# What the view should forward to upload_image_to_commons for
+# _COMMONS_UPLOAD_FORM, minus the image_file stream.
+_EXPECTED_UPLOAD_KWARGS = {
+    'caption': 'Test caption',
+    'caption_language': 'fi',
+    'description': 'Test description',
+    'description_language': 'en',
+    'target_filename': 'Example_renamed.jpg',
+    'author': 'Example Photographer',
+    'source_url': 'https://example.org/source-photo',
+    'date_created': '2026-02-20',
+    'license_template': 'Cc-by-sa-4.0',
+    'categories': ['Helsinki', 'Finland'],
+    'depicts': ['Q811979', 'Q16970'],
+    'coordinate_source': 'map',
+    'latitude': 60.1699,
+    'longitude': 24.9384,
+    'heading': 173.4,
+    'elevation_meters': 14.2,
+    'wikidata_item': 'Q1757',
+    'oauth_token': 'token',
+    'oauth_token_secret': 'secret',
+}
+
+# Minimal valid create-item form; validation tests override single fields.
+_CREATE_ITEM_BASE_PAYLOAD = {
+    'label': 'Example Building',
+    'description': 'Historic building in test city',
+    'instance_of_p31': 'Q41176',
+    'country_p17': 'Q33',
+    'municipality_p131': 'Q1757',
+    'latitude': 60.1699,
+    'longitude': 24.9384,
+    'source_url': 'https://example.org/article',
+}
+
+_HELSINKI_ENTITY_PAYLOAD = {
+    'id': 'Q1757',
+    'uri': _HELSINKI_URI,
+    'label': 'Helsinki',
+    'description': 'capital of Finland',
+    'latitude': 60.1699,
+    'longitude': 24.9384,
+    'instance_of': {'id': 'Q515', 'label': 'city'},
+    'municipality': {'id': 'Q1757', 'label': 'Helsinki'},
+    'commons_category': 'Helsinki',
+    'image_name': 'Helsinki city center.jpg',
+    'image_url': 'https://commons.wikimedia.org/wiki/Special:FilePath/Helsinki_city_center.jpg',
+    'image_thumb_url': 'https://commons.wikimedia.org/wiki/Special:FilePath/Helsinki_city_center.jpg?width=320',
+}
+
+
+class LocationApiTestBase:
+    @classmethod
+    def setUpClass(cls):
+        # These two stubs are constant across every test method; start the
+        # patchers once per class instead of paying start()/stop() per test.
+        super().setUpClass()
+        cls.enrich_locations_with_image_counts_mock = cls.enterClassContext(
+            patch(
+                'locations.views.enrich_locations_with_image_counts',
+                side_effect=lambda locations: locations,
+                new_callable=Mock,
+                spec=views.enrich_locations_with_image_counts,
+            )
+        )
+        cls.fetch_location_children_mock = cls.enterClassContext(
+            patch(
+                'locations.views.fetch_location_children',
+                return_value=[],
+                new_callable=Mock,
+                spec=views.fetch_location_children,
+            )
+        )
+        # One APIClient for the whole class; constructing the WSGI handler
+        # stack per test is measurable and nothing here needs a fresh one.
+        cls._shared_api_client = APIClient()
 
-class LocationApiTests(APITestCase):
     def setUp(self):
         super().setUp()
-        self._enrich_counts_patcher = patch(
-            'locations.views.enrich_locations_with_image_counts',
-            side_effect=lambda locations: locations,
-        )
-        self.enrich_locations_with_image_counts_mock = self._enrich_counts_patcher.start()
-        self._fetch_children_patcher = patch(
-            'locations.views.fetch_location_children',
-            return_value=[],
-        )
-        self.fetch_location_children_mock = self._fetch_children_patcher.start()
+        # Class-scoped mocks keep state between methods; drop call history
+        # and any per-test return_value override.
+        self.enrich_locations_with_image_counts_mock.reset_mock()
+        self.fetch_location_children_mock.reset_mock()
+        self.fetch_location_children_mock.return_value = []
+        self.client = self._shared_api_client
+        # force_authenticate(user=None) would call logout() and touch the
+        # session table, which SimpleTestCase subclasses forbid; clearing
+        # the forced credentials and cookies is enough between tests.
+        self.client.handler._force_user = None
+        self.client.handler._force_token = None
+        self.client.cookies.clear()
 
-    def _authenticate(self, username='api-writer'):
-        user = get_user_model().objects.create_user(username=username)
-        self.client.force_authenticate(user=user)
-        return user
+    @classmethod
+    def setUpTestData(cls):
+        # TestCase-only hook (SimpleTestCase subclasses never call it): one
+        # INSERT per class instead of one per authenticated test.
+        cls.api_user = User.objects.create_user(username='api-writer')
 
-    def tearDown(self):
-        self._enrich_counts_patcher.stop()
-        self._fetch_children_patcher.stop()
-        super().tearDown()
+    def _authenticate(self):
+        self.client.force_authenticate(user=self.api_user)
+        return self.api_user
+
+
+class FrontendShellTests(SimpleTestCase):
+    """The app shell and static assets are plain Django responses; the
+    default Django test client avoids DRF's content negotiation."""
 
     @override_settings(DEBUG=True, ROOT_URLCONF='locations.tests.test_urlconf')
     def test_static_app_js_served_with_script_mime_type(self):
@@ -45,27 +290,26 @@ class LocationApiTests(APITestCase):
         self.assertIn(b'(function ()', first_chunk)
 
     def test_frontend_app_served(self):
-        response = self.client.get(reverse('frontend-app'))
+        response = self.client.get(_FRONTEND_APP_URL)
 
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'id="app"')
-        self.assertContains(response, 'window.APP_CONFIG')
-        self.assertContains(response, 'apiBaseUrl')
+        # The markers are plain ASCII, so search the raw bytes and skip
+        # decoding the body altogether.
+        content = response.content
+        self.assertIn(b'id="app"', content)
+        self.assertIn(b'window.APP_CONFIG', content)
+        self.assertIn(b'apiBaseUrl', content)
+
+
+class LocationApiReadTests(LocationApiTestBase, APISimpleTestCase):
+    """Read-only endpoint tests; everything behind the view is mocked,
+    so no test database is needed."""
 
-    @patch('locations.views.fetch_locations')
+    @patch('locations.views.fetch_locations', new_callable=Mock)
     def test_location_list(self, fetch_locations_mock):
-        fetch_locations_mock.return_value = [
-            {
-                'id': quote('https://www.wikidata.org/entity/Q1757', safe=''),
-                'uri': 'https://www.wikidata.org/entity/Q1757',
-                'name': 'Helsinki',
-                'description': 'Capital of Finland',
-                'latitude': 60.1699,
-                'longitude': 24.9384,
-            }
-        ]
+        fetch_locations_mock.return_value = _HELSINKI_LIST_PAYLOAD
 
-        response = self.client.get(reverse('location-list'), {'lang': 'en'})
+        response = _location_list_view(_REQUEST_FACTORY.get(_LOCATION_LIST_URL, {'lang': 'en'}))
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data), 1)
@@ -74,14 +318,11 @@ class LocationApiTests(APITestCase):
         self.assertIn('wdt:P5008 wd:Q138299296', unquote(query_url.split('#', 1)[1]))
         fetch_locations_mock.assert_called_once_with(lang='en')
 
-    @patch('locations.views.fetch_locations')
+    @patch('locations.views.fetch_locations', new_callable=Mock)
     def test_location_list_passes_cache_bust_comment_to_fetch(self, fetch_locations_mock):
         fetch_locations_mock.return_value = []
 
-        response = self.client.get(
-            reverse('location-list'),
-            {'lang': 'en', 'cache_bust': '2026-02-18 16:45'},
-        )
+        response = _location_list_view(_REQUEST_FACTORY.get(_LOCATION_LIST_URL, {'lang': 'en', 'cache_bust': '2026-02-18 16:45'}))
 
         self.assertEqual(response.status_code, 200)
         fetch_locations_mock.assert_called_once_with(
@@ -89,28 +330,12 @@ class LocationApiTests(APITestCase):
             query_comment='# cache-bust: 2026-02-18 16:45',
         )
 
-    @patch('locations.views.fetch_locations')
-    def test_location_list_returns_502_on_sparql_error(self, fetch_locations_mock):
-        fetch_locations_mock.side_effect = SPARQLServiceError('endpoint returned non-json')
-
-        response = self.client.get(reverse('location-list'), {'lang': 'fi'})
-
-        self.assertEqual(response.status_code, 502)
-        self.assertIn('detail', response.data)
-
-    @patch('locations.views.fetch_location_detail')
+    @patch('locations.views.fetch_location_detail', new_callable=Mock)
     def test_location_detail(self, fetch_location_detail_mock):
-        encoded = quote('https://www.wikidata.org/entity/Q1757', safe='')
-        fetch_location_detail_mock.return_value = {
-            'id': encoded,
-            'uri': 'https://www.wikidata.org/entity/Q1757',
-            'name': 'Helsinki',
-            'description': 'Capital of Finland',
-            'latitude': 60.1699,
-            'longitude': 24.9384,
-        }
+        encoded = _HELSINKI_LOCATION_ID
+        fetch_location_detail_mock.return_value = _HELSINKI_DETAIL_PAYLOAD
 
-        response = self.client.get(reverse('location-detail', kwargs={'location_id': encoded}), {'lang': 'sv'})
+        response = _location_detail_view(_REQUEST_FACTORY.get(_location_detail_url(encoded), {'lang': 'sv'}), location_id=encoded)
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data['name'], 'Helsinki')
@@ -119,43 +344,15 @@ class LocationApiTests(APITestCase):
             lang='sv',
         )
 
-    @patch('locations.views.fetch_location_detail')
+    @patch('locations.views.fetch_location_detail', new_callable=Mock)
     def test_location_detail_returns_wikipedia_links_from_sparql_payload(
         self,
         fetch_location_detail_mock,
     ):
-        encoded = quote('https://www.wikidata.org/entity/Q1757', safe='')
-        fetch_location_detail_mock.return_value = {
-            'id': encoded,
-            'uri': 'https://www.wikidata.org/entity/Q1757',
-            'name': 'Helsinki',
-            'description': 'Capital of Finland',
-            'latitude': 60.1699,
-            'longitude': 24.9384,
-            'location_p276': 'https://www.wikidata.org/entity/Q33',
-            'location_p276_label': 'Finland',
-            'location_p276_wikipedia_url': 'https://en.wikipedia.org/wiki/Finland',
-            'collection_membership_source_url': 'https://example.org/source-1',
-            'collection_membership_source_urls': [
-                'https://example.org/source-1',
-                'https://example.org/source-2',
-            ],
-            'collection_membership_sources': [
-                {
-                    'url': 'https://example.org/source-1',
-                    'title': 'Example article',
-                    'title_language': 'en',
-                    'author': 'Example Author',
-                    'publication_date': '+2026-01-02T00:00:00Z',
-                    'retrieved_date': '',
-                    'publisher': {'value': 'http://www.wikidata.org/entity/Q12321', 'label': 'Example Publisher'},
-                    'published_in': {'value': 'http://www.wikidata.org/entity/Q12345', 'label': 'Example Newspaper'},
-                    'language_of_work': {'value': 'http://www.wikidata.org/entity/Q1860', 'label': 'English'},
-                }
-            ],
-        }
+        encoded = _HELSINKI_LOCATION_ID
+        fetch_location_detail_mock.return_value = _HELSINKI_DETAIL_WITH_SOURCES_PAYLOAD
 
-        response = self.client.get(reverse('location-detail', kwargs={'location_id': encoded}), {'lang': 'en'})
+        response = _location_detail_view(_REQUEST_FACTORY.get(_location_detail_url(encoded), {'lang': 'en'}), location_id=encoded)
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data['location_p276_wikipedia_url'], 'https://en.wikipedia.org/wiki/Finland')
@@ -167,32 +364,35 @@ class LocationApiTests(APITestCase):
         self.assertEqual(len(response.data['collection_membership_sources']), 1)
         self.assertEqual(response.data['collection_membership_sources'][0]['title'], 'Example article')
 
-    @patch('locations.views.fetch_location_detail')
+    @patch('locations.views.fetch_location_detail', new_callable=Mock)
     def test_location_detail_404(self, fetch_location_detail_mock):
         fetch_location_detail_mock.return_value = None
-        encoded = quote('https://www.wikidata.org/entity/Q999999999', safe='')
+        encoded = _MISSING_ENTITY_LOCATION_ID
 
-        response = self.client.get(reverse('location-detail', kwargs={'location_id': encoded}))
+        response = _location_detail_view(_REQUEST_FACTORY.get(_location_detail_url(encoded)), location_id=encoded)
 
         self.assertEqual(response.status_code, 404)
 
-    @patch('locations.views.fetch_location_detail')
+    @patch('locations.views.fetch_location_detail', new_callable=Mock)
     def test_location_detail_returns_404_for_removed_draft_uri(self, fetch_location_detail_mock):
-        encoded = quote('https://draft.local/location/123', safe='')
+        encoded = _REMOVED_DRAFT_LOCATION_ID
 
-        response = self.client.get(reverse('location-detail', kwargs={'location_id': encoded}))
+        response = _location_detail_view(_REQUEST_FACTORY.get(_location_detail_url(encoded)), location_id=encoded)
 
         self.assertEqual(response.status_code, 404)
         fetch_location_detail_mock.assert_not_called()
 
-    @patch('locations.views.fetch_location_detail')
+    @patch('locations.views.fetch_location_detail', new_callable=Mock)
     def test_location_detail_returns_404_for_invalid_location_id(self, fetch_location_detail_mock):
-        response = self.client.get(reverse('location-detail', kwargs={'location_id': 'not-a-qid'}))
+        response = _location_detail_view(
+            _REQUEST_FACTORY.get(_location_detail_url('not-a-qid')),
+            location_id='not-a-qid',
+        )
 
         self.assertEqual(response.status_code, 404)
         fetch_location_detail_mock.assert_not_called()
 
-    @patch('locations.views.search_wikidata_entities')
+    @patch('locations.views.search_wikidata_entities', new_callable=Mock)
     def test_wikidata_search_endpoint(self, search_wikidata_entities_mock):
         search_wikidata_entities_mock.return_value = [
             {
@@ -203,39 +403,17 @@ class LocationApiTests(APITestCase):
             }
         ]
 
-        response = self.client.get(reverse('wikidata-search'), {'q': 'hels', 'lang': 'fi', 'limit': 5})
+        response = _wikidata_search_view(_REQUEST_FACTORY.get(_WIKIDATA_SEARCH_URL, {'q': 'hels', 'lang': 'fi', 'limit': 5}))
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data), 1)
         search_wikidata_entities_mock.assert_called_once_with(query='hels', lang='fi', limit=5)
 
-    @patch('locations.views.search_wikidata_entities')
-    def test_wikidata_search_returns_502_for_external_error(self, search_wikidata_entities_mock):
-        search_wikidata_entities_mock.side_effect = ExternalServiceError('upstream down')
-
-        response = self.client.get(reverse('wikidata-search'), {'q': 'hels'})
-
-        self.assertEqual(response.status_code, 502)
-        self.assertIn('detail', response.data)
-
-    @patch('locations.views.fetch_wikidata_entity')
+    @patch('locations.views.fetch_wikidata_entity', new_callable=Mock)
     def test_wikidata_entity_endpoint(self, fetch_wikidata_entity_mock):
-        fetch_wikidata_entity_mock.return_value = {
-            'id': 'Q1757',
-            'uri': 'https://www.wikidata.org/entity/Q1757',
-            'label': 'Helsinki',
-            'description': 'capital of Finland',
-            'latitude': 60.1699,
-            'longitude': 24.9384,
-            'instance_of': {'id': 'Q515', 'label': 'city'},
-            'municipality': {'id': 'Q1757', 'label': 'Helsinki'},
-            'commons_category': 'Helsinki',
-            'image_name': 'Helsinki city center.jpg',
-            'image_url': 'https://commons.wikimedia.org/wiki/Special:FilePath/Helsinki_city_center.jpg',
-            'image_thumb_url': 'https://commons.wikimedia.org/wiki/Special:FilePath/Helsinki_city_center.jpg?width=320',
-        }
+        fetch_wikidata_entity_mock.return_value = _HELSINKI_ENTITY_PAYLOAD
 
-        response = self.client.get(reverse('wikidata-entity', kwargs={'entity_id': 'Q1757'}), {'lang': 'fi'})
+        response = _wikidata_entity_view(_REQUEST_FACTORY.get(_wikidata_entity_url('Q1757'), {'lang': 'fi'}), entity_id='Q1757')
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data['id'], 'Q1757')
@@ -245,7 +423,7 @@ class LocationApiTests(APITestCase):
         )
         fetch_wikidata_entity_mock.assert_called_once_with('Q1757', lang='fi')
 
-    @patch('locations.views.fetch_latest_osm_feature_metadata')
+    @patch('locations.views.fetch_latest_osm_feature_metadata', new_callable=Mock)
     def test_osm_feature_latest_endpoint(self, fetch_latest_osm_feature_metadata_mock):
         fetch_latest_osm_feature_metadata_mock.return_value = {
             'type': 'way',
@@ -260,9 +438,10 @@ class LocationApiTests(APITestCase):
             },
         }
 
-        response = self.client.get(
-            reverse('osm-feature-latest', kwargs={'feature_type': 'way', 'feature_id': 12345}),
-            {'lang': 'fi'},
+        response = _osm_feature_latest_view(
+            _REQUEST_FACTORY.get(_osm_feature_latest_url('way', 12345), {'lang': 'fi'}),
+            feature_type='way',
+            feature_id=12345,
         )
 
         self.assertEqual(response.status_code, 200)
@@ -277,7 +456,7 @@ class LocationApiTests(APITestCase):
             hint_name=None,
         )
 
-    @patch('locations.views.fetch_latest_osm_feature_metadata')
+    @patch('locations.views.fetch_latest_osm_feature_metadata', new_callable=Mock)
     def test_osm_feature_latest_endpoint_passes_coordinate_hints(self, fetch_latest_osm_feature_metadata_mock):
         fetch_latest_osm_feature_metadata_mock.return_value = {
             'type': 'way',
@@ -289,9 +468,10 @@ class LocationApiTests(APITestCase):
             'tags': {},
         }
 
-        response = self.client.get(
-            reverse('osm-feature-latest', kwargs={'feature_type': 'way', 'feature_id': 12345}),
-            {'lat': '60.187813', 'lon': '24.983468', 'name': 'Tukkutorinkuja'},
+        response = _osm_feature_latest_view(
+            _REQUEST_FACTORY.get(_osm_feature_latest_url('way', 12345), {'lat': '60.187813', 'lon': '24.983468', 'name': 'Tukkutorinkuja'}),
+            feature_type='way',
+            feature_id=12345,
         )
 
         self.assertEqual(response.status_code, 200)
@@ -305,48 +485,39 @@ class LocationApiTests(APITestCase):
         )
 
     def test_osm_feature_latest_endpoint_rejects_invalid_type(self):
-        response = self.client.get(
-            reverse('osm-feature-latest', kwargs={'feature_type': 'invalid', 'feature_id': 123}),
+        response = _osm_feature_latest_view(
+            _REQUEST_FACTORY.get(_osm_feature_latest_url('invalid', 123)),
+            feature_type='invalid',
+            feature_id=123,
         )
 
         self.assertEqual(response.status_code, 400)
         self.assertIn('detail', response.data)
 
     def test_osm_feature_latest_endpoint_rejects_invalid_latitude(self):
-        response = self.client.get(
-            reverse('osm-feature-latest', kwargs={'feature_type': 'way', 'feature_id': 123}),
-            {'lat': 'not-a-number'},
+        response = _osm_feature_latest_view(
+            _REQUEST_FACTORY.get(_osm_feature_latest_url('way', 123), {'lat': 'not-a-number'}),
+            feature_type='way',
+            feature_id=123,
         )
 
         self.assertEqual(response.status_code, 400)
         self.assertIn('detail', response.data)
 
-    @patch('locations.views.fetch_latest_osm_feature_metadata')
+    @patch('locations.views.fetch_latest_osm_feature_metadata', new_callable=Mock)
     def test_osm_feature_latest_endpoint_returns_404_when_not_found(self, fetch_latest_osm_feature_metadata_mock):
         fetch_latest_osm_feature_metadata_mock.return_value = None
 
-        response = self.client.get(
-            reverse('osm-feature-latest', kwargs={'feature_type': 'relation', 'feature_id': 999999999}),
+        response = _osm_feature_latest_view(
+            _REQUEST_FACTORY.get(_osm_feature_latest_url('relation', 999999999)),
+            feature_type='relation',
+            feature_id=999999999,
         )
 
         self.assertEqual(response.status_code, 404)
         self.assertIn('detail', response.data)
 
-    @patch('locations.views.fetch_latest_osm_feature_metadata')
-    def test_osm_feature_latest_endpoint_returns_502_for_external_error(
-        self,
-        fetch_latest_osm_feature_metadata_mock,
-    ):
-        fetch_latest_osm_feature_metadata_mock.side_effect = ExternalServiceError('upstream failure')
-
-        response = self.client.get(
-            reverse('osm-feature-latest', kwargs={'feature_type': 'way', 'feature_id': 12345}),
-        )
-
-        self.assertEqual(response.status_code, 502)
-        self.assertIn('detail', response.data)
-
-    @patch('locations.views.fetch_citoid_metadata')
+    @patch('locations.views.fetch_citoid_metadata', new_callable=Mock)
     def test_citoid_metadata_endpoint(self, fetch_citoid_metadata_mock):
         fetch_citoid_metadata_mock.return_value = {
             'source_url': 'https://example.org/article',
@@ -359,28 +530,54 @@ class LocationApiTests(APITestCase):
             'source_language_of_work_p407': '',
         }
 
-        response = self.client.get(
-            reverse('citoid-metadata'),
-            {'url': 'https://example.org/article', 'lang': 'fi'},
-        )
+        response = _citoid_metadata_view(_REQUEST_FACTORY.get(_CITOID_METADATA_URL, {'url': 'https://example.org/article', 'lang': 'fi'}))
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data['source_title'], 'Example article')
         fetch_citoid_metadata_mock.assert_called_once_with('https://example.org/article', lang='fi')
 
-    @patch('locations.views.fetch_citoid_metadata')
-    def test_citoid_metadata_endpoint_returns_502_for_external_error(self, fetch_citoid_metadata_mock):
-        fetch_citoid_metadata_mock.side_effect = ExternalServiceError('upstream failure')
-
-        response = self.client.get(
-            reverse('citoid-metadata'),
-            {'url': 'https://example.org/article'},
-        )
+    def test_upstream_errors_map_to_502(self):
+        # The read endpoints share the same upstream-error handling; one
+        # subTest per endpoint replaces four near-identical tests.
+        cases = [
+            (
+                'locations.views.fetch_locations',
+                _location_list_view,
+                _REQUEST_FACTORY.get(_LOCATION_LIST_URL, {'lang': 'fi'}),
+                {},
+                _UPSTREAM_SPARQL_ERROR,
+            ),
+            (
+                'locations.views.search_wikidata_entities',
+                _wikidata_search_view,
+                _REQUEST_FACTORY.get(_WIKIDATA_SEARCH_URL, {'q': 'hels'}),
+                {},
+                _UPSTREAM_SERVICE_ERROR,
+            ),
+            (
+                'locations.views.fetch_latest_osm_feature_metadata',
+                _osm_feature_latest_view,
+                _REQUEST_FACTORY.get(_osm_feature_latest_url('way', 12345)),
+                {'feature_type': 'way', 'feature_id': 12345},
+                _UPSTREAM_SERVICE_ERROR,
+            ),
+            (
+                'locations.views.fetch_citoid_metadata',
+                _citoid_metadata_view,
+                _REQUEST_FACTORY.get(_CITOID_METADATA_URL, {'url': 'https://example.org/article'}),
+                {},
+                _UPSTREAM_SERVICE_ERROR,
+            ),
+        ]
+        for target, view, request, view_kwargs, error in cases:
+            with self.subTest(target=target):
+                with patch(target, new_callable=Mock, side_effect=error):
+                    response = view(request, **view_kwargs)
 
-        self.assertEqual(response.status_code, 502)
-        self.assertIn('detail', response.data)
+                self.assertEqual(response.status_code, 502)
+                self.assertIn('detail', response.data)
 
-    @patch('locations.views.search_commons_categories')
+    @patch('locations.views.search_commons_categories', new_callable=Mock)
     def test_commons_category_search_endpoint(self, search_commons_categories_mock):
         search_commons_categories_mock.return_value = [
             {
@@ -390,169 +587,281 @@ class LocationApiTests(APITestCase):
             }
         ]
 
-        response = self.client.get(reverse('commons-category-search'), {'q': 'Hel', 'limit': 8})
+        response = _commons_category_search_view(_REQUEST_FACTORY.get(_COMMONS_CATEGORY_SEARCH_URL, {'q': 'Hel', 'limit': 8}))
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data), 1)
         search_commons_categories_mock.assert_called_once_with(query='Hel', limit=8)
 
-    @patch('locations.views.upload_image_to_commons')
-    @patch(
-        'locations.views._mediawiki_oauth_credentials_for_request',
-        return_value=({'oauth_token': 'token', 'oauth_token_secret': 'secret'}, '', 200),
-    )
-    def test_commons_upload_endpoint(
-        self,
-        oauth_credentials_mock,
-        upload_image_to_commons_mock,
-    ):
-        self._authenticate()
-        upload_image_to_commons_mock.return_value = {
-            'filename': 'Example.jpg',
-            'file_page_url': 'https://commons.wikimedia.org/wiki/File:Example.jpg',
-            'file_url': 'https://commons.wikimedia.org/wiki/Special:FilePath/Example.jpg',
-            'thumb_url': 'https://commons.wikimedia.org/wiki/Special:FilePath/Example.jpg?width=320',
-            'categories': ['Helsinki', 'Finland'],
-            'depicts': ['Q811979', 'Q16970'],
-            'wikidata_item': 'Q1757',
+    @patch('locations.views.search_geocode_places', new_callable=Mock)
+    def test_geocode_search_endpoint(self, search_geocode_places_mock):
+        search_geocode_places_mock.return_value = [
+            {'name': 'Helsinki, Finland', 'latitude': 60.1699, 'longitude': 24.9384}
+        ]
+
+        response = _geocode_search_view(_REQUEST_FACTORY.get(_GEOCODE_SEARCH_URL, {'q': 'Helsinki'}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 1)
+        search_geocode_places_mock.assert_called_once_with(query='Helsinki', limit=8)
+
+    @patch('locations.views.reverse_geocode_places', new_callable=Mock)
+    def test_geocode_reverse_endpoint(self, reverse_geocode_places_mock):
+        reverse_geocode_places_mock.return_value = {
+            'country': {'id': 'Q33', 'label': 'Suomi'},
+            'municipality': {'id': 'Q1793', 'label': 'Espoo'},
+            'detailed_location': {'id': 'Q11889564', 'label': 'Pohjois-Tapiola'},
         }
-        image_file = SimpleUploadedFile('Example.jpg', b'test-image-bytes', content_type='image/jpeg')
 
-        response = self.client.post(
-            reverse('commons-upload'),
+        response = _geocode_reverse_view(_REQUEST_FACTORY.get(_GEOCODE_REVERSE_URL, {'lat': '60.2055', 'lon': '24.6559', 'lang': 'fi'}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['country'], {'id': 'Q33', 'label': 'Suomi'})
+        self.assertEqual(response.data['municipality'], {'id': 'Q1793', 'label': 'Espoo'})
+        self.assertEqual(response.data['detailed_location'], {'id': 'Q11889564', 'label': 'Pohjois-Tapiola'})
+        reverse_geocode_places_mock.assert_called_once_with(
+            latitude=60.2055,
+            longitude=24.6559,
+            lang='fi',
+        )
+
+    def test_wikidata_write_endpoints_require_authentication(self):
+        image_file = _jpeg_upload()
+        add_existing_response = self.client.post(
+            _WIKIDATA_ADD_EXISTING_URL,
+            {'wikidata_item': 'Q1757', 'source_url': 'https://example.org/article'},
+        )
+        create_item_response = self.client.post(
+            _WIKIDATA_CREATE_ITEM_URL,
+            _CREATE_ITEM_BASE_PAYLOAD,
+        )
+        commons_upload_response = self.client.post(
+            _COMMONS_UPLOAD_URL,
             {
                 'file': image_file,
-                'caption': 'Test caption',
-                'caption_language': 'fi',
-                'description': 'Test description',
-                'description_language': 'en',
-                'target_filename': 'Example_renamed.jpg',
-                'author': 'Example Photographer',
-                'source_url': 'https://example.org/source-photo',
-                'date_created': '2026-02-20',
-                'license_template': 'Cc-by-sa-4.0',
-                'categories_json': '["Helsinki","Finland"]',
-                'depicts_json': '["Q811979","Q16970"]',
-                'coordinate_source': 'map',
-                'latitude': '60.1699',
-                'longitude': '24.9384',
-                'heading': '173.4',
-                'elevation_meters': '14.2',
-                'wikidata_item': 'Q1757',
+                'coordinate_source': 'exif',
             },
             format='multipart',
         )
 
-        self.assertEqual(response.status_code, 201)
-        self.assertEqual(response.data['filename'], 'Example.jpg')
-        oauth_credentials_mock.assert_called_once()
-        upload_image_to_commons_mock.assert_called_once()
-        call_args = upload_image_to_commons_mock.call_args
-        self.assertEqual(call_args.kwargs['caption'], 'Test caption')
-        self.assertEqual(call_args.kwargs['caption_language'], 'fi')
-        self.assertEqual(call_args.kwargs['description'], 'Test description')
-        self.assertEqual(call_args.kwargs['description_language'], 'en')
-        self.assertEqual(call_args.kwargs['target_filename'], 'Example_renamed.jpg')
-        self.assertEqual(call_args.kwargs['author'], 'Example Photographer')
-        self.assertEqual(call_args.kwargs['source_url'], 'https://example.org/source-photo')
-        self.assertEqual(call_args.kwargs['date_created'], '2026-02-20')
-        self.assertEqual(call_args.kwargs['license_template'], 'Cc-by-sa-4.0')
-        self.assertEqual(call_args.kwargs['categories'], ['Helsinki', 'Finland'])
-        self.assertEqual(call_args.kwargs['depicts'], ['Q811979', 'Q16970'])
-        self.assertEqual(call_args.kwargs['coordinate_source'], 'map')
-        self.assertEqual(call_args.kwargs['latitude'], 60.1699)
-        self.assertEqual(call_args.kwargs['longitude'], 24.9384)
-        self.assertEqual(call_args.kwargs['heading'], 173.4)
-        self.assertEqual(call_args.kwargs['elevation_meters'], 14.2)
-        self.assertEqual(call_args.kwargs['wikidata_item'], 'Q1757')
-        self.assertEqual(call_args.kwargs['oauth_token'], 'token')
-        self.assertEqual(call_args.kwargs['oauth_token_secret'], 'secret')
+        self.assertEqual(add_existing_response.status_code, 401)
+        self.assertEqual(create_item_response.status_code, 401)
+        self.assertEqual(commons_upload_response.status_code, 401)
 
-    @patch(
-        'locations.views._mediawiki_oauth_credentials_for_request',
-        return_value=({'oauth_token': 'token', 'oauth_token_secret': 'secret'}, '', 200),
-    )
-    def test_commons_upload_endpoint_requires_file(
+    @patch('locations.views.fetch_wikidata_entity', new_callable=Mock)
+    @patch('locations.views.fetch_location_detail', new_callable=Mock)
+    def test_location_detail_omits_children_for_sparql_parent(
+        self,
+        fetch_location_detail_mock,
+        fetch_wikidata_entity_mock,
+    ):
+        parent_uri = _HELSINKI_URI
+        encoded = _HELSINKI_LOCATION_ID
+        fetch_location_detail_mock.return_value = {
+            'id': encoded,
+            'uri': parent_uri,
+            'name': 'Helsinki',
+            'description': 'From SPARQL',
+            'latitude': 60.1699,
+            'longitude': 24.9384,
+        }
+        fetch_wikidata_entity_mock.return_value = {
+            'id': 'Q1757',
+            'image_name': 'Helsinki city center.jpg',
+            'image_url': 'https://commons.wikimedia.org/wiki/Special:FilePath/Helsinki_city_center.jpg',
+        }
+
+        response = _location_detail_view(_REQUEST_FACTORY.get(_location_detail_url(encoded), {'lang': 'fi'}), location_id=encoded)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('children', response.data)
+        self.assertEqual(
+            response.data['image_url'],
+            'https://commons.wikimedia.org/wiki/Special:FilePath/Helsinki_city_center.jpg',
+        )
+        fetch_wikidata_entity_mock.assert_called_once_with('Q1757', lang='fi')
+        self.fetch_location_children_mock.assert_not_called()
+
+    def test_location_children_endpoint_includes_p361_and_p527_children(self):
+        parent_uri = _HELSINKI_URI
+        encoded = _HELSINKI_LOCATION_ID
+        self.fetch_location_children_mock.return_value = [
+            {
+                'id': _CHILD_Q100_LOCATION_ID,
+                'uri': 'https://www.wikidata.org/entity/Q100',
+                'name': 'P361 child',
+                'source': 'sparql',
+                'commons_category': 'Helsinki districts',
+            },
+            {
+                'id': _CHILD_Q200_LOCATION_ID,
+                'uri': 'https://www.wikidata.org/entity/Q200',
+                'name': 'P527 child',
+                'source': 'sparql',
+                'commons_category': 'Helsinki buildings',
+            },
+        ]
+
+        response = _location_children_view(_REQUEST_FACTORY.get(_LOCATION_CHILDREN_URL, {'lang': 'fi', 'location_id': encoded}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 2)
+        child_names = [item['name'] for item in response.data]
+        self.assertIn('P361 child', child_names)
+        self.assertIn('P527 child', child_names)
+        self.fetch_location_children_mock.assert_called_with(
+            uri='http://www.wikidata.org/entity/Q1757',
+            lang='fi',
+        )
+
+    def test_location_children_endpoint_resolves_location_id(self):
+        # One subTest per location id: either the endpoint resolves it to a
+        # Wikidata URI and fetches children, or it 404s without a fetch.
+        cases = [
+            (_HTTP_PARENT_LOCATION_ID, 200, _HTTP_PARENT_URI),
+            (_REMOVED_DRAFT_LOCATION_ID, 404, None),
+            ('not-a-qid', 404, None),
+        ]
+        for encoded, expected_status, expected_uri in cases:
+            with self.subTest(location_id=encoded):
+                self.fetch_location_children_mock.reset_mock()
+                self.fetch_location_children_mock.return_value = []
+
+                response = _location_children_view(_REQUEST_FACTORY.get(_LOCATION_CHILDREN_URL, {'lang': 'fi', 'location_id': encoded}))
+
+                self.assertEqual(response.status_code, expected_status)
+                if expected_uri is None:
+                    self.fetch_location_children_mock.assert_not_called()
+                else:
+                    self.fetch_location_children_mock.assert_called_with(uri=expected_uri, lang='fi')
+
+
+class LocationApiTests(LocationApiTestBase, APITestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Every write-endpoint test stubs the OAuth credential lookup with
+        # the same value; patch it once for the class.
+        super().setUpClass()
+        cls.oauth_credentials_mock = cls.enterClassContext(
+            patch(
+                'locations.views._mediawiki_oauth_credentials_for_request',
+                return_value=({'oauth_token': 'token', 'oauth_token_secret': 'secret'}, '', 200),
+                new_callable=Mock,
+                spec=views._mediawiki_oauth_credentials_for_request,
+            )
+        )
+        # The two Wikidata write services are stubbed in almost every test
+        # of this class; share class-scoped patchers the same way.
+        cls.ensure_membership_mock = cls.enterClassContext(
+            patch(
+                'locations.views.ensure_wikidata_collection_membership',
+                new_callable=Mock,
+                spec=views.ensure_wikidata_collection_membership,
+            )
+        )
+        cls.create_item_mock = cls.enterClassContext(
+            patch(
+                'locations.views.create_wikidata_building_item',
+                new_callable=Mock,
+                spec=views.create_wikidata_building_item,
+            )
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.oauth_credentials_mock.reset_mock()
+        self.oauth_credentials_mock.side_effect = None
+        self.ensure_membership_mock.reset_mock(return_value=True, side_effect=True)
+        self.create_item_mock.reset_mock(return_value=True, side_effect=True)
+
+
+    @patch('locations.views.upload_image_to_commons', new_callable=Mock)
+    def test_commons_upload_endpoint(
         self,
-        oauth_credentials_mock,
+        upload_image_to_commons_mock,
     ):
         self._authenticate()
+        upload_image_to_commons_mock.return_value = _COMMONS_UPLOAD_RESPONSE
+        image_file = _jpeg_upload()
 
         response = self.client.post(
-            reverse('commons-upload'),
+            _COMMONS_UPLOAD_URL,
+            {**_COMMONS_UPLOAD_FORM, 'file': image_file},
+            format='multipart',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['filename'], 'Example.jpg')
+        self.oauth_credentials_mock.assert_called_once()
+        upload_image_to_commons_mock.assert_called_once()
+        call_kwargs = dict(upload_image_to_commons_mock.call_args.kwargs)
+        self.assertIsNotNone(call_kwargs.pop('image_file', None))
+        self.assertEqual(call_kwargs, _EXPECTED_UPLOAD_KWARGS)
+
+    def test_commons_upload_endpoint_requires_file(self):
+        request = _REQUEST_FACTORY.post(
+            _COMMONS_UPLOAD_URL,
             {
                 'caption': 'No file',
                 'coordinate_source': 'exif',
             },
             format='multipart',
         )
+        force_authenticate(request, user=self.api_user)
+
+        response = _commons_upload_view(request)
 
         self.assertEqual(response.status_code, 400)
         self.assertIn('file', response.data)
-        oauth_credentials_mock.assert_called_once()
+        self.oauth_credentials_mock.assert_called_once()
 
-    @patch(
-        'locations.views._mediawiki_oauth_credentials_for_request',
-        return_value=({'oauth_token': 'token', 'oauth_token_secret': 'secret'}, '', 200),
-    )
-    def test_commons_upload_endpoint_rejects_unsupported_mime_type(
-        self,
-        oauth_credentials_mock,
-    ):
-        self._authenticate()
+    def test_commons_upload_endpoint_rejects_unsupported_mime_type(self):
         text_file = SimpleUploadedFile('Example.txt', b'test-text-bytes', content_type='text/plain')
-
-        response = self.client.post(
-            reverse('commons-upload'),
+        request = _REQUEST_FACTORY.post(
+            _COMMONS_UPLOAD_URL,
             {
                 'file': text_file,
                 'coordinate_source': 'exif',
             },
             format='multipart',
         )
+        force_authenticate(request, user=self.api_user)
+
+        response = _commons_upload_view(request)
 
         self.assertEqual(response.status_code, 400)
         self.assertIn('file', response.data)
         self.assertIn('Allowed types', str(response.data['file'][0]))
-        oauth_credentials_mock.assert_called_once()
+        self.oauth_credentials_mock.assert_called_once()
 
     @override_settings(COMMONS_UPLOAD_MAX_SIZE_BYTES=10)
-    @patch('locations.views.upload_image_to_commons')
-    @patch(
-        'locations.views._mediawiki_oauth_credentials_for_request',
-        return_value=({'oauth_token': 'token', 'oauth_token_secret': 'secret'}, '', 200),
-    )
+    @patch('locations.views.upload_image_to_commons', new_callable=Mock)
     def test_commons_upload_endpoint_rejects_too_large_file(
         self,
-        oauth_credentials_mock,
         upload_image_to_commons_mock,
     ):
-        self._authenticate()
-        image_file = SimpleUploadedFile('Example.jpg', b'01234567890', content_type='image/jpeg')
-
-        response = self.client.post(
-            reverse('commons-upload'),
+        image_file = _jpeg_upload(payload=b'01234567890')
+        request = _REQUEST_FACTORY.post(
+            _COMMONS_UPLOAD_URL,
             {
                 'file': image_file,
                 'coordinate_source': 'exif',
             },
             format='multipart',
         )
+        force_authenticate(request, user=self.api_user)
+
+        response = _commons_upload_view(request)
 
         self.assertEqual(response.status_code, 400)
         self.assertIn('file', response.data)
         self.assertIn('Maximum upload size is', str(response.data['file'][0]))
-        oauth_credentials_mock.assert_called_once()
+        self.oauth_credentials_mock.assert_called_once()
         upload_image_to_commons_mock.assert_not_called()
 
-    @patch('locations.views.upload_image_to_commons')
-    @patch(
-        'locations.views._mediawiki_oauth_credentials_for_request',
-        return_value=({'oauth_token': 'token', 'oauth_token_secret': 'secret'}, '', 200),
-    )
+    @patch('locations.views.upload_image_to_commons', new_callable=Mock)
     def test_commons_upload_endpoint_accepts_svg_mime_type(
         self,
-        oauth_credentials_mock,
         upload_image_to_commons_mock,
     ):
         self._authenticate()
@@ -568,7 +877,7 @@ class LocationApiTests(APITestCase):
         svg_file = SimpleUploadedFile('Example.svg', b'<svg></svg>', content_type='image/svg+xml')
 
         response = self.client.post(
-            reverse('commons-upload'),
+            _COMMONS_UPLOAD_URL,
             {
                 'file': svg_file,
                 'coordinate_source': 'exif',
@@ -577,25 +886,20 @@ class LocationApiTests(APITestCase):
         )
 
         self.assertEqual(response.status_code, 201)
-        oauth_credentials_mock.assert_called_once()
+        self.oauth_credentials_mock.assert_called_once()
         upload_image_to_commons_mock.assert_called_once()
 
-    @patch('locations.views.upload_image_to_commons')
-    @patch(
-        'locations.views._mediawiki_oauth_credentials_for_request',
-        return_value=({'oauth_token': 'token', 'oauth_token_secret': 'secret'}, '', 200),
-    )
+    @patch('locations.views.upload_image_to_commons', new_callable=Mock)
     def test_commons_upload_endpoint_returns_502_for_upload_error(
         self,
-        oauth_credentials_mock,
         upload_image_to_commons_mock,
     ):
         self._authenticate()
-        upload_image_to_commons_mock.side_effect = WikidataWriteError('duplicate filename')
-        image_file = SimpleUploadedFile('Example.jpg', b'test-image-bytes', content_type='image/jpeg')
+        upload_image_to_commons_mock.side_effect = _DUPLICATE_FILENAME_ERROR
+        image_file = _jpeg_upload()
 
         response = self.client.post(
-            reverse('commons-upload'),
+            _COMMONS_UPLOAD_URL,
             {
                 'file': image_file,
                 'coordinate_source': 'exif',
@@ -604,60 +908,16 @@ class LocationApiTests(APITestCase):
         )
 
         self.assertEqual(response.status_code, 502)
-        self.assertIn('detail', response.data)
-        oauth_credentials_mock.assert_called_once()
+        self.assertIn(b'"detail"', response.content)
+        self.oauth_credentials_mock.assert_called_once()
         upload_image_to_commons_mock.assert_called_once()
 
-    @patch('locations.views.search_geocode_places')
-    def test_geocode_search_endpoint(self, search_geocode_places_mock):
-        search_geocode_places_mock.return_value = [
-            {'name': 'Helsinki, Finland', 'latitude': 60.1699, 'longitude': 24.9384}
-        ]
-
-        response = self.client.get(reverse('geocode-search'), {'q': 'Helsinki'})
-
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 1)
-        search_geocode_places_mock.assert_called_once_with(query='Helsinki', limit=8)
-
-    @patch('locations.views.reverse_geocode_places')
-    def test_geocode_reverse_endpoint(self, reverse_geocode_places_mock):
-        reverse_geocode_places_mock.return_value = {
-            'country': {'id': 'Q33', 'label': 'Suomi'},
-            'municipality': {'id': 'Q1793', 'label': 'Espoo'},
-            'detailed_location': {'id': 'Q11889564', 'label': 'Pohjois-Tapiola'},
-        }
-
-        response = self.client.get(
-            reverse('geocode-reverse'),
-            {'lat': '60.2055', 'lon': '24.6559', 'lang': 'fi'},
-        )
-
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.data['country'], {'id': 'Q33', 'label': 'Suomi'})
-        self.assertEqual(response.data['municipality'], {'id': 'Q1793', 'label': 'Espoo'})
-        self.assertEqual(response.data['detailed_location'], {'id': 'Q11889564', 'label': 'Pohjois-Tapiola'})
-        reverse_geocode_places_mock.assert_called_once_with(
-            latitude=60.2055,
-            longitude=24.6559,
-            lang='fi',
-        )
-
-    @override_settings(SOCIAL_AUTH_MEDIAWIKI_KEY='', SOCIAL_AUTH_MEDIAWIKI_SECRET='')
-    def test_auth_status_endpoint_reports_disabled_when_social_auth_not_configured(self):
-        response = self.client.get(reverse('auth-status'))
-
-        self.assertEqual(response.status_code, 200)
-        self.assertFalse(response.data['enabled'])
-        self.assertFalse(response.data['authenticated'])
-        self.assertEqual(response.data['provider'], 'mediawiki')
-
     @override_settings(SOCIAL_AUTH_MEDIAWIKI_KEY='key', SOCIAL_AUTH_MEDIAWIKI_SECRET='secret')
     def test_auth_status_endpoint_reports_authenticated_user(self):
-        user = get_user_model().objects.create_user(username='wikimedia-user')
+        user = User.objects.create_user(username='wikimedia-user')
         self.client.force_authenticate(user=user)
 
-        response = self.client.get(reverse('auth-status'))
+        response = self.client.get(_AUTH_STATUS_URL)
 
         self.assertEqual(response.status_code, 200)
         self.assertTrue(response.data['enabled'])
@@ -665,181 +925,11 @@ class LocationApiTests(APITestCase):
         self.assertEqual(response.data['username'], 'wikimedia-user')
         self.assertEqual(response.data['auth_mode'], 'oauth')
 
-    @override_settings(
-        SOCIAL_AUTH_MEDIAWIKI_KEY='',
-        SOCIAL_AUTH_MEDIAWIKI_SECRET='',
-        DEBUG=True,
-        LOCAL_DEV_MEDIAWIKI_ACCESS_TOKEN='local-access-token',
-        LOCAL_DEV_MEDIAWIKI_ACCESS_SECRET='local-access-secret',
-    )
-    def test_auth_status_endpoint_reports_local_access_token_mode_without_session_login(self):
-        response = self.client.get(reverse('auth-status'))
-
-        self.assertEqual(response.status_code, 200)
-        self.assertTrue(response.data['enabled'])
-        self.assertFalse(response.data['authenticated'])
-        self.assertEqual(response.data['auth_mode'], 'access_token')
-        self.assertEqual(response.data['username'], '')
-        self.assertEqual(response.data['login_url'], '/auth/login/local/?next=/')
-        self.assertEqual(response.data['logout_url'], '/auth/logout/?next=/')
-
-    @override_settings(
-        SOCIAL_AUTH_MEDIAWIKI_KEY='',
-        SOCIAL_AUTH_MEDIAWIKI_SECRET='',
-        DEBUG=True,
-        LOCAL_DEV_MEDIAWIKI_ACCESS_TOKEN='local-access-token',
-        LOCAL_DEV_MEDIAWIKI_ACCESS_SECRET='local-access-secret',
-    )
-    def test_auth_status_endpoint_hides_local_access_token_mode_for_non_local_ip(self):
-        response = self.client.get(reverse('auth-status'), REMOTE_ADDR='10.0.0.55')
-
-        self.assertEqual(response.status_code, 200)
-        self.assertFalse(response.data['enabled'])
-        self.assertEqual(response.data['auth_mode'], 'oauth')
-        self.assertEqual(response.data['login_url'], '/auth/login/mediawiki/?next=/')
-
-    @override_settings(
-        SOCIAL_AUTH_MEDIAWIKI_KEY='',
-        SOCIAL_AUTH_MEDIAWIKI_SECRET='',
-        DEBUG=True,
-        LOCAL_DEV_MEDIAWIKI_ACCESS_TOKEN='local-access-token',
-        LOCAL_DEV_MEDIAWIKI_ACCESS_SECRET='local-access-secret',
-    )
-    @patch(
-        'locations.views.fetch_wikidata_authenticated_username',
-        return_value='Zache',
-    )
-    def test_local_access_login_creates_user_and_sets_authenticated_session(
-        self,
-        fetch_wikidata_authenticated_username_mock,
-    ):
-        login_response = self.client.get('/auth/login/local/?next=/')
-        auth_response = self.client.get(reverse('auth-status'))
-
-        self.assertEqual(login_response.status_code, 302)
-        self.assertEqual(login_response.headers.get('Location'), '/')
-        self.assertEqual(auth_response.status_code, 200)
-        self.assertTrue(auth_response.data['authenticated'])
-        self.assertEqual(auth_response.data['username'], 'local_Zache')
-        self.assertEqual(auth_response.data['auth_mode'], 'access_token')
-        self.assertTrue(get_user_model().objects.filter(username='local_Zache').exists())
-        self.assertFalse(get_user_model().objects.filter(username='Zache').exists())
-        fetch_wikidata_authenticated_username_mock.assert_called_once_with(
-            oauth_token='local-access-token',
-            oauth_token_secret='local-access-secret',
-        )
-
-    @override_settings(
-        SOCIAL_AUTH_MEDIAWIKI_KEY='',
-        SOCIAL_AUTH_MEDIAWIKI_SECRET='',
-        DEBUG=True,
-        LOCAL_DEV_MEDIAWIKI_ACCESS_TOKEN='local-access-token',
-        LOCAL_DEV_MEDIAWIKI_ACCESS_SECRET='local-access-secret',
-    )
-    @patch(
-        'locations.views.fetch_wikidata_authenticated_username',
-        side_effect=WikidataWriteError('userinfo request failed'),
-    )
-    def test_local_access_login_returns_502_when_username_lookup_fails(
-        self,
-        fetch_wikidata_authenticated_username_mock,
-    ):
-        response = self.client.get('/auth/login/local/?next=/')
-
-        self.assertEqual(response.status_code, 502)
-        self.assertIn('detail', response.data)
-        fetch_wikidata_authenticated_username_mock.assert_called_once_with(
-            oauth_token='local-access-token',
-            oauth_token_secret='local-access-secret',
-        )
-
-    @override_settings(
-        SOCIAL_AUTH_MEDIAWIKI_KEY='',
-        SOCIAL_AUTH_MEDIAWIKI_SECRET='',
-        DEBUG=True,
-        LOCAL_DEV_MEDIAWIKI_ACCESS_TOKEN='local-access-token',
-        LOCAL_DEV_MEDIAWIKI_ACCESS_SECRET='local-access-secret',
-    )
-    def test_local_access_login_rejects_non_local_ip(self):
-        response = self.client.get('/auth/login/local/?next=/', REMOTE_ADDR='10.0.0.55')
-
-        self.assertEqual(response.status_code, 403)
-        self.assertEqual(
-            response.data.get('detail'),
-            'Local development access token mode is only allowed from localhost.',
-        )
-
-    @override_settings(
-        SOCIAL_AUTH_MEDIAWIKI_KEY='oauth-key',
-        SOCIAL_AUTH_MEDIAWIKI_SECRET='oauth-secret',
-        DEBUG=True,
-        LOCAL_DEV_MEDIAWIKI_ACCESS_TOKEN='local-access-token',
-        LOCAL_DEV_MEDIAWIKI_ACCESS_SECRET='local-access-secret',
-    )
-    def test_mediawiki_login_route_redirects_to_local_login_when_local_tokens_enabled(self):
-        response = self.client.get('/auth/login/mediawiki/?next=/dashboard/')
-
-        self.assertEqual(response.status_code, 302)
-        self.assertEqual(response.headers.get('Location'), '/auth/login/local/?next=%2Fdashboard%2F')
-
-    @override_settings(
-        SOCIAL_AUTH_MEDIAWIKI_KEY='oauth-key',
-        SOCIAL_AUTH_MEDIAWIKI_SECRET='oauth-secret',
-        DEBUG=True,
-        LOCAL_DEV_MEDIAWIKI_ACCESS_TOKEN='local-access-token',
-        LOCAL_DEV_MEDIAWIKI_ACCESS_SECRET='local-access-secret',
-    )
-    @patch('social_django.views.auth')
-    def test_mediawiki_login_route_uses_oauth_for_non_local_ip_even_when_local_tokens_enabled(
-        self,
-        social_auth_mock,
-    ):
-        social_auth_mock.return_value = HttpResponseRedirect('/auth/complete/mediawiki/')
-
-        response = self.client.get('/auth/login/mediawiki/?next=/', REMOTE_ADDR='10.0.0.55')
-
-        self.assertEqual(response.status_code, 302)
-        self.assertEqual(response.headers.get('Location'), '/auth/complete/mediawiki/')
-        social_auth_mock.assert_called_once()
-
-    @override_settings(
-        SOCIAL_AUTH_MEDIAWIKI_KEY='',
-        SOCIAL_AUTH_MEDIAWIKI_SECRET='',
-        DEBUG=False,
-        LOCAL_DEV_MEDIAWIKI_ACCESS_TOKEN='',
-        LOCAL_DEV_MEDIAWIKI_ACCESS_SECRET='',
-    )
-    def test_mediawiki_login_route_returns_503_when_oauth_not_configured(self):
-        response = self.client.get('/auth/login/mediawiki/?next=/')
-
-        self.assertEqual(response.status_code, 503)
-        self.assertIn('detail', response.data)
-
-    @override_settings(
-        SOCIAL_AUTH_MEDIAWIKI_KEY='oauth-key',
-        SOCIAL_AUTH_MEDIAWIKI_SECRET='oauth-secret',
-        DEBUG=False,
-        LOCAL_DEV_MEDIAWIKI_ACCESS_TOKEN='',
-        LOCAL_DEV_MEDIAWIKI_ACCESS_SECRET='',
-    )
-    @patch('social_django.views.auth')
-    def test_mediawiki_login_route_delegates_to_social_auth_view(
-        self,
-        social_auth_mock,
-    ):
-        social_auth_mock.return_value = HttpResponseRedirect('/auth/complete/mediawiki/')
-
-        response = self.client.get('/auth/login/mediawiki/?next=/')
-
-        self.assertEqual(response.status_code, 302)
-        self.assertEqual(response.headers.get('Location'), '/auth/complete/mediawiki/')
-        social_auth_mock.assert_called_once()
-
     def test_auth_logout_route_redirects_and_clears_session(self):
-        user = get_user_model().objects.create_user(username='logout-user')
+        user = User.objects.create_user(username='logout-user')
         self.client.force_login(user)
 
-        before_logout = self.client.get(reverse('auth-status'))
+        before_logout = self.client.get(_AUTH_STATUS_URL)
         self.assertEqual(before_logout.status_code, 200)
         self.assertTrue(before_logout.data['authenticated'])
 
@@ -848,29 +938,20 @@ class LocationApiTests(APITestCase):
         self.assertEqual(response.status_code, 302)
         self.assertEqual(response.headers.get('Location'), '/')
 
-        after_logout = self.client.get(reverse('auth-status'))
+        after_logout = self.client.get(_AUTH_STATUS_URL)
         self.assertEqual(after_logout.status_code, 200)
         self.assertFalse(after_logout.data['authenticated'])
 
-    @patch('locations.views.ensure_wikidata_collection_membership')
-    @patch(
-        'locations.views._mediawiki_oauth_credentials_for_request',
-        return_value=({'oauth_token': 'token', 'oauth_token_secret': 'secret'}, '', 200),
-    )
-    def test_wikidata_add_existing_endpoint(
-        self,
-        oauth_credentials_mock,
-        ensure_wikidata_collection_membership_mock,
-    ):
+    def test_wikidata_add_existing_endpoint(self):
         self._authenticate()
-        ensure_wikidata_collection_membership_mock.return_value = {
+        self.ensure_membership_mock.return_value = {
             'qid': 'Q1757',
             'uri': 'https://www.wikidata.org/entity/Q1757',
             'already_listed': False,
         }
 
         response = self.client.post(
-            reverse('wikidata-add-existing'),
+            _WIKIDATA_ADD_EXISTING_URL,
             {
                 'wikidata_item': 'Q1757',
                 'source_url': 'https://example.org/article',
@@ -882,13 +963,12 @@ class LocationApiTests(APITestCase):
                 'source_published_in_p1433': 'Q12345',
                 'source_language_of_work_p407': 'Q1860',
             },
-            format='json',
         )
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data['qid'], 'Q1757')
-        oauth_credentials_mock.assert_called_once()
-        ensure_wikidata_collection_membership_mock.assert_called_once_with(
+        self.oauth_credentials_mock.assert_called_once()
+        self.ensure_membership_mock.assert_called_once_with(
             'Q1757',
             oauth_token='token',
             oauth_token_secret='secret',
@@ -902,159 +982,40 @@ class LocationApiTests(APITestCase):
             source_language_of_work_p407='Q1860',
         )
 
-    @patch('locations.views.ensure_wikidata_collection_membership')
-    @patch(
-        'locations.views._mediawiki_oauth_credentials_for_request',
-        return_value=({'oauth_token': 'token', 'oauth_token_secret': 'secret'}, '', 200),
-    )
-    def test_wikidata_add_existing_endpoint_normalizes_finnish_publication_date(
-        self,
-        oauth_credentials_mock,
-        ensure_wikidata_collection_membership_mock,
-    ):
-        self._authenticate()
-        ensure_wikidata_collection_membership_mock.return_value = {
-            'qid': 'Q1757',
-            'uri': 'https://www.wikidata.org/entity/Q1757',
-            'already_listed': False,
-        }
-
-        response = self.client.post(
-            reverse('wikidata-add-existing'),
-            {
-                'wikidata_item': 'Q1757',
-                'source_url': 'https://example.org/article',
-                'source_publication_date': '1.11.2026',
-            },
-            format='json',
-        )
-
-        self.assertEqual(response.status_code, 200)
-        oauth_credentials_mock.assert_called_once()
-        ensure_wikidata_collection_membership_mock.assert_called_once()
-        call_args = ensure_wikidata_collection_membership_mock.call_args
-        self.assertEqual(call_args.kwargs['source_publication_date'], '2026-11-01')
-
-    @patch('locations.views.ensure_wikidata_collection_membership')
-    @patch(
-        'locations.views._mediawiki_oauth_credentials_for_request',
-        return_value=({'oauth_token': 'token', 'oauth_token_secret': 'secret'}, '', 200),
-    )
-    def test_wikidata_add_existing_endpoint_returns_502_for_write_error(
-        self,
-        oauth_credentials_mock,
-        ensure_wikidata_collection_membership_mock,
-    ):
+    def test_wikidata_add_existing_endpoint_returns_502_for_write_error(self):
         self._authenticate()
-        ensure_wikidata_collection_membership_mock.side_effect = WikidataWriteError('login failed')
+        self.ensure_membership_mock.side_effect = _WRITE_ERROR
 
         response = self.client.post(
-            reverse('wikidata-add-existing'),
+            _WIKIDATA_ADD_EXISTING_URL,
             {'wikidata_item': 'Q1757', 'source_url': 'https://example.org/article'},
-            format='json',
         )
 
         self.assertEqual(response.status_code, 502)
-        self.assertIn('detail', response.data)
-        oauth_credentials_mock.assert_called_once()
-
-    @override_settings(
-        SOCIAL_AUTH_MEDIAWIKI_KEY='',
-        SOCIAL_AUTH_MEDIAWIKI_SECRET='',
-        DEBUG=True,
-        LOCAL_DEV_MEDIAWIKI_ACCESS_TOKEN='local-access-token',
-        LOCAL_DEV_MEDIAWIKI_ACCESS_SECRET='local-access-secret',
-    )
-    @patch('locations.views.ensure_wikidata_collection_membership')
-    def test_wikidata_add_existing_endpoint_uses_local_access_token_fallback(
-        self,
-        ensure_wikidata_collection_membership_mock,
-    ):
-        with patch('locations.views.fetch_wikidata_authenticated_username', return_value='Zache') as username_mock:
-            login_response = self.client.get('/auth/login/local/?next=/')
-
-        self.assertEqual(login_response.status_code, 302)
-        self.assertEqual(login_response.headers.get('Location'), '/')
-        username_mock.assert_called_once_with(
-            oauth_token='local-access-token',
-            oauth_token_secret='local-access-secret',
-        )
-
-        ensure_wikidata_collection_membership_mock.return_value = {
-            'qid': 'Q1757',
-            'uri': 'https://www.wikidata.org/entity/Q1757',
-            'already_listed': False,
-        }
-
-        response = self.client.post(
-            reverse('wikidata-add-existing'),
-            {
-                'wikidata_item': 'Q1757',
-                'source_url': 'https://example.org/article',
-            },
-            format='json',
-        )
+        self.assertIn(b'"detail"', response.content)
+        self.oauth_credentials_mock.assert_called_once()
 
-        self.assertEqual(response.status_code, 200)
-        ensure_wikidata_collection_membership_mock.assert_called_once_with(
-            'Q1757',
-            oauth_token='local-access-token',
-            oauth_token_secret='local-access-secret',
-            source_url='https://example.org/article',
-            source_title='',
-            source_title_language='',
-            source_author='',
-            source_publication_date='',
-            source_publisher_p123='',
-            source_published_in_p1433='',
-            source_language_of_work_p407='',
-        )
+    def test_wikidata_add_existing_endpoint_requires_source_url(self):
+        request = _REQUEST_FACTORY.post(_WIKIDATA_ADD_EXISTING_URL, {'wikidata_item': 'Q1757'})
+        force_authenticate(request, user=self.api_user)
 
-    @patch('locations.views.ensure_wikidata_collection_membership')
-    @patch(
-        'locations.views._mediawiki_oauth_credentials_for_request',
-        return_value=({'oauth_token': 'token', 'oauth_token_secret': 'secret'}, '', 200),
-    )
-    def test_wikidata_add_existing_endpoint_requires_source_url(
-        self,
-        oauth_credentials_mock,
-        ensure_wikidata_collection_membership_mock,
-    ):
-        self._authenticate()
-        response = self.client.post(
-            reverse('wikidata-add-existing'),
-            {'wikidata_item': 'Q1757'},
-            format='json',
-        )
+        response = _wikidata_add_existing_view(request)
 
         self.assertEqual(response.status_code, 400)
         self.assertIn('source_url', response.data)
-        ensure_wikidata_collection_membership_mock.assert_not_called()
-        oauth_credentials_mock.assert_called_once()
+        self.ensure_membership_mock.assert_not_called()
+        self.oauth_credentials_mock.assert_called_once()
 
-    @patch('locations.views.create_wikidata_building_item')
-    @patch(
-        'locations.views._mediawiki_oauth_credentials_for_request',
-        return_value=({'oauth_token': 'token', 'oauth_token_secret': 'secret'}, '', 200),
-    )
-    def test_wikidata_create_item_endpoint(
-        self,
-        oauth_credentials_mock,
-        create_wikidata_building_item_mock,
-    ):
+    def test_wikidata_create_item_endpoint(self):
         self._authenticate()
-        create_wikidata_building_item_mock.return_value = {
+        self.create_item_mock.return_value = {
             'qid': 'Q123456',
             'uri': 'https://www.wikidata.org/entity/Q123456',
             'added_to_collection_qid': 'Q138299296',
         }
         payload = {
-            'label': 'Example Building',
-            'description': 'Historic building in test city',
-            'instance_of_p31': 'Q41176',
+            **_CREATE_ITEM_BASE_PAYLOAD,
             'instance_of_p31_values': ['Q41176', 'Q811979'],
-            'country_p17': 'Q33',
-            'municipality_p131': 'Q1757',
             'part_of_p361': 'Q42',
             'part_of_p361_values': ['Q42', 'Q42'],
             'custom_properties': [
@@ -1062,342 +1023,339 @@ class LocationApiTests(APITestCase):
                 {'property_id': 'p18', 'value': 'Example.jpg', 'datatype': 'commonsmedia'},
                 {'property_id': 'P2048', 'value': '12.5 Q11573'},
             ],
-            'latitude': 60.1699,
-            'longitude': 24.9384,
-            'source_url': 'https://example.org/article',
         }
 
         response = self.client.post(
-            reverse('wikidata-create-item'),
+            _WIKIDATA_CREATE_ITEM_URL,
             payload,
-            format='json',
         )
 
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response.data['qid'], 'Q123456')
-        create_wikidata_building_item_mock.assert_called_once()
-        oauth_credentials_mock.assert_called_once()
-        call_args = create_wikidata_building_item_mock.call_args
-        self.assertEqual(call_args.kwargs['lang'], 'en')
-        self.assertEqual(call_args.kwargs['oauth_token'], 'token')
-        self.assertEqual(call_args.kwargs['oauth_token_secret'], 'secret')
-        self.assertEqual(call_args.args[0]['instance_of_p31'], 'Q41176')
-        self.assertEqual(call_args.args[0]['instance_of_p31_values'], ['Q41176', 'Q811979'])
-        self.assertEqual(call_args.args[0]['part_of_p361'], 'Q42')
-        self.assertEqual(call_args.args[0]['part_of_p361_values'], ['Q42'])
+        self.create_item_mock.assert_called_once()
+        self.oauth_credentials_mock.assert_called_once()
+        call_args = self.create_item_mock.call_args
         self.assertEqual(
-            call_args.args[0]['custom_properties'],
-            [
-                {'property_id': 'P18', 'value': 'Example.jpg', 'datatype': 'commonsmedia'},
-                {'property_id': 'P2048', 'value': '12.5 Q11573', 'datatype': ''},
-            ],
+            call_args.kwargs,
+            {'lang': 'en', 'oauth_token': 'token', 'oauth_token_secret': 'secret'},
+        )
+        validated = call_args.args[0]
+        self.assertEqual(
+            {key: validated[key] for key in (
+                'instance_of_p31',
+                'instance_of_p31_values',
+                'part_of_p361',
+                'part_of_p361_values',
+                'custom_properties',
+            )},
+            {
+                'instance_of_p31': 'Q41176',
+                'instance_of_p31_values': ['Q41176', 'Q811979'],
+                'part_of_p361': 'Q42',
+                'part_of_p361_values': ['Q42'],
+                'custom_properties': [
+                    {'property_id': 'P18', 'value': 'Example.jpg', 'datatype': 'commonsmedia'},
+                    {'property_id': 'P2048', 'value': '12.5 Q11573', 'datatype': ''},
+                ],
+            },
         )
 
-    @patch('locations.views.create_wikidata_building_item')
-    @patch(
-        'locations.views._mediawiki_oauth_credentials_for_request',
-        return_value=({'oauth_token': 'token', 'oauth_token_secret': 'secret'}, '', 200),
-    )
-    def test_wikidata_create_item_endpoint_normalizes_finnish_date_formats(
-        self,
-        oauth_credentials_mock,
-        create_wikidata_building_item_mock,
-    ):
+    def test_wikidata_write_endpoints_normalize_finnish_dates(self):
+        # Both write endpoints accept dd.mm.yyyy dates and forward ISO
+        # dates to the service layer; one subTest per endpoint.
+        cases = [
+            (
+                _WIKIDATA_ADD_EXISTING_URL,
+                {
+                    'wikidata_item': 'Q1757',
+                    'source_url': 'https://example.org/article',
+                    'source_publication_date': '1.11.2026',
+                },
+                self.ensure_membership_mock,
+                200,
+                lambda call: call.kwargs,
+                {'source_publication_date': '2026-11-01'},
+            ),
+            (
+                _WIKIDATA_CREATE_ITEM_URL,
+                {
+                    **_CREATE_ITEM_BASE_PAYLOAD,
+                    'inception_p571': '1.2.2026',
+                    'inception_source_url': 'https://example.org/article',
+                    'official_closure_date_p3999': '9.10.2027',
+                    'official_closure_date_source_url': 'https://example.org/article',
+                    'source_publication_date': '1.11.2026',
+                },
+                self.create_item_mock,
+                201,
+                lambda call: call.args[0],
+                {
+                    'inception_p571': '2026-02-01',
+                    'official_closure_date_p3999': '2027-10-09',
+                    'source_publication_date': '2026-11-01',
+                },
+            ),
+        ]
         self._authenticate()
-        create_wikidata_building_item_mock.return_value = {
-            'qid': 'Q123456',
-            'uri': 'https://www.wikidata.org/entity/Q123456',
-            'added_to_collection_qid': 'Q138299296',
-        }
-        payload = {
-            'label': 'Example Building',
-            'description': 'Historic building in test city',
-            'instance_of_p31': 'Q41176',
-            'country_p17': 'Q33',
-            'municipality_p131': 'Q1757',
-            'latitude': 60.1699,
-            'longitude': 24.9384,
-            'inception_p571': '1.2.2026',
-            'inception_source_url': 'https://example.org/article',
-            'official_closure_date_p3999': '9.10.2027',
-            'official_closure_date_source_url': 'https://example.org/article',
-            'source_url': 'https://example.org/article',
-            'source_publication_date': '1.11.2026',
-        }
+        for url, payload, service_mock, expected_status, forwarded, expected_dates in cases:
+            with self.subTest(url=url):
+                service_mock.return_value = {
+                    'qid': 'Q1757',
+                    'uri': 'https://www.wikidata.org/entity/Q1757',
+                }
 
-        response = self.client.post(
-            reverse('wikidata-create-item'),
-            payload,
-            format='json',
-        )
+                response = self.client.post(url, payload)
+
+                self.assertEqual(response.status_code, expected_status)
+                service_mock.assert_called_once()
+                sent = forwarded(service_mock.call_args)
+                self.assertEqual(
+                    {key: sent[key] for key in expected_dates},
+                    expected_dates,
+                )
+
+    def test_wikidata_create_item_endpoint_rejects_invalid_payloads(self):
+        # Each case overrides one field of the shared valid payload and
+        # names the serializer key expected in the error body; one subTest
+        # per case replaces four near-identical tests.
+        cases = [
+            ({'part_of_p361': 'not-a-qid'}, 'part_of_p361'),
+            (
+                {'custom_properties': [{'property_id': 'invalid', 'value': 'foo'}]},
+                'custom_properties',
+            ),
+            ({'architect_p84': 'Q6313'}, 'architect_source_url'),
+            ({'official_closure_date_p3999': '1999-12-31'}, 'official_closure_date_source_url'),
+        ]
+        for payload_override, error_field in cases:
+            with self.subTest(error_field=error_field):
+                request = _REQUEST_FACTORY.post(
+                    _WIKIDATA_CREATE_ITEM_URL,
+                    {**_CREATE_ITEM_BASE_PAYLOAD, **payload_override},
+                )
+                force_authenticate(request, user=self.api_user)
 
-        self.assertEqual(response.status_code, 201)
-        self.assertEqual(response.data['qid'], 'Q123456')
-        create_wikidata_building_item_mock.assert_called_once()
-        oauth_credentials_mock.assert_called_once()
-        call_args = create_wikidata_building_item_mock.call_args
-        self.assertEqual(call_args.args[0]['inception_p571'], '2026-02-01')
-        self.assertEqual(call_args.args[0]['official_closure_date_p3999'], '2027-10-09')
-        self.assertEqual(call_args.args[0]['source_publication_date'], '2026-11-01')
-
-    @patch('locations.views.create_wikidata_building_item')
-    @patch(
-        'locations.views._mediawiki_oauth_credentials_for_request',
-        return_value=({'oauth_token': 'token', 'oauth_token_secret': 'secret'}, '', 200),
-    )
-    def test_wikidata_create_item_endpoint_rejects_invalid_part_of_qid(
-        self,
-        oauth_credentials_mock,
-        create_wikidata_building_item_mock,
-    ):
-        self._authenticate()
-        payload = {
-            'label': 'Example Building',
-            'description': 'Historic building in test city',
-            'instance_of_p31': 'Q41176',
-            'country_p17': 'Q33',
-            'municipality_p131': 'Q1757',
-            'part_of_p361': 'not-a-qid',
-            'latitude': 60.1699,
-            'longitude': 24.9384,
-            'source_url': 'https://example.org/article',
-        }
+                response = _wikidata_create_item_view(request)
 
-        response = self.client.post(
-            reverse('wikidata-create-item'),
-            payload,
-            format='json',
-        )
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(error_field, response.data)
+        self.create_item_mock.assert_not_called()
+        self.assertEqual(self.oauth_credentials_mock.call_count, len(cases))
 
-        self.assertEqual(response.status_code, 400)
-        self.assertIn('part_of_p361', response.data)
-        create_wikidata_building_item_mock.assert_not_called()
-        oauth_credentials_mock.assert_called_once()
 
-    @patch('locations.views.create_wikidata_building_item')
-    @patch(
-        'locations.views._mediawiki_oauth_credentials_for_request',
-        return_value=({'oauth_token': 'token', 'oauth_token_secret': 'secret'}, '', 200),
+class AuthRouteTests(LocationApiTestBase, APISimpleTestCase):
+    """Auth routes that never touch the database: anonymous status checks
+    and login routing that redirects or errors before any user exists."""
+
+    @override_settings(SOCIAL_AUTH_MEDIAWIKI_KEY='', SOCIAL_AUTH_MEDIAWIKI_SECRET='')
+    def test_auth_status_endpoint_reports_disabled_when_social_auth_not_configured(self):
+        response = self.client.get(_AUTH_STATUS_URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.data['enabled'])
+        self.assertFalse(response.data['authenticated'])
+        self.assertEqual(response.data['provider'], 'mediawiki')
+
+    @override_settings(
+        SOCIAL_AUTH_MEDIAWIKI_KEY='',
+        SOCIAL_AUTH_MEDIAWIKI_SECRET='',
+        DEBUG=False,
+        LOCAL_DEV_MEDIAWIKI_ACCESS_TOKEN='',
+        LOCAL_DEV_MEDIAWIKI_ACCESS_SECRET='',
     )
-    def test_wikidata_create_item_endpoint_rejects_invalid_custom_property_id(
+    def test_mediawiki_login_route_returns_503_when_oauth_not_configured(self):
+        response = self.client.get('/auth/login/mediawiki/?next=/')
+
+        self.assertEqual(response.status_code, 503)
+        self.assertIn(b'"detail"', response.content)
+
+    @override_settings(
+        SOCIAL_AUTH_MEDIAWIKI_KEY='oauth-key',
+        SOCIAL_AUTH_MEDIAWIKI_SECRET='oauth-secret',
+        DEBUG=False,
+        LOCAL_DEV_MEDIAWIKI_ACCESS_TOKEN='',
+        LOCAL_DEV_MEDIAWIKI_ACCESS_SECRET='',
+    )
+    @patch('social_django.views.auth', new_callable=Mock)
+    def test_mediawiki_login_route_delegates_to_social_auth_view(
         self,
-        oauth_credentials_mock,
-        create_wikidata_building_item_mock,
+        social_auth_mock,
     ):
-        self._authenticate()
-        payload = {
-            'label': 'Example Building',
-            'description': 'Historic building in test city',
-            'instance_of_p31': 'Q41176',
-            'country_p17': 'Q33',
-            'municipality_p131': 'Q1757',
-            'latitude': 60.1699,
-            'longitude': 24.9384,
-            'custom_properties': [
-                {'property_id': 'invalid', 'value': 'foo'},
-            ],
-            'source_url': 'https://example.org/article',
-        }
+        social_auth_mock.return_value = HttpResponseRedirect('/auth/complete/mediawiki/')
 
-        response = self.client.post(
-            reverse('wikidata-create-item'),
-            payload,
-            format='json',
-        )
+        response = self.client.get('/auth/login/mediawiki/?next=/')
 
-        self.assertEqual(response.status_code, 400)
-        self.assertIn('custom_properties', response.data)
-        create_wikidata_building_item_mock.assert_not_called()
-        oauth_credentials_mock.assert_called_once()
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.headers.get('Location'), '/auth/complete/mediawiki/')
+        social_auth_mock.assert_called_once()
 
-    @patch('locations.views.create_wikidata_building_item')
-    @patch(
-        'locations.views._mediawiki_oauth_credentials_for_request',
-        return_value=({'oauth_token': 'token', 'oauth_token_secret': 'secret'}, '', 200),
-    )
-    def test_wikidata_create_item_endpoint_enforces_source_for_architect(
+
+@override_settings(
+    SOCIAL_AUTH_MEDIAWIKI_KEY='oauth-key',
+    SOCIAL_AUTH_MEDIAWIKI_SECRET='oauth-secret',
+    DEBUG=True,
+    LOCAL_DEV_MEDIAWIKI_ACCESS_TOKEN='local-access-token',
+    LOCAL_DEV_MEDIAWIKI_ACCESS_SECRET='local-access-secret',
+)
+class MediaWikiLoginWithLocalTokensTests(LocationApiTestBase, APISimpleTestCase):
+    """Login routing when OAuth and local access tokens are both configured;
+    the settings permutation is shared, so it is applied once per class."""
+
+    def test_mediawiki_login_route_redirects_to_local_login_when_local_tokens_enabled(self):
+        response = self.client.get('/auth/login/mediawiki/?next=/dashboard/')
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.headers.get('Location'), '/auth/login/local/?next=%2Fdashboard%2F')
+
+    @patch('social_django.views.auth', new_callable=Mock)
+    def test_mediawiki_login_route_uses_oauth_for_non_local_ip_even_when_local_tokens_enabled(
         self,
-        oauth_credentials_mock,
-        create_wikidata_building_item_mock,
+        social_auth_mock,
     ):
-        self._authenticate()
-        payload = {
-            'label': 'Example Building',
-            'description': 'Historic building in test city',
-            'instance_of_p31': 'Q41176',
-            'country_p17': 'Q33',
-            'municipality_p131': 'Q1757',
-            'latitude': 60.1699,
-            'longitude': 24.9384,
-            'architect_p84': 'Q6313',
-            'source_url': 'https://example.org/article',
-        }
+        social_auth_mock.return_value = HttpResponseRedirect('/auth/complete/mediawiki/')
 
-        response = self.client.post(
-            reverse('wikidata-create-item'),
-            payload,
-            format='json',
-        )
+        response = self.client.get('/auth/login/mediawiki/?next=/', REMOTE_ADDR='10.0.0.55')
 
-        self.assertEqual(response.status_code, 400)
-        self.assertIn('architect_source_url', response.data)
-        create_wikidata_building_item_mock.assert_not_called()
-        oauth_credentials_mock.assert_called_once()
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.headers.get('Location'), '/auth/complete/mediawiki/')
+        social_auth_mock.assert_called_once()
+
+
+# Shared by both local access-token test classes below.
+_local_token_settings = override_settings(
+    SOCIAL_AUTH_MEDIAWIKI_KEY='',
+    SOCIAL_AUTH_MEDIAWIKI_SECRET='',
+    DEBUG=True,
+    LOCAL_DEV_MEDIAWIKI_ACCESS_TOKEN='local-access-token',
+    LOCAL_DEV_MEDIAWIKI_ACCESS_SECRET='local-access-secret',
+)
+
+
+@_local_token_settings
+class LocalAccessTokenAuthSimpleTests(LocationApiTestBase, APISimpleTestCase):
+    """Local access-token flows that stop before any user or session is
+    written; the settings overrides are applied once at class level."""
+
+    def test_auth_status_endpoint_reports_local_access_token_mode_without_session_login(self):
+        response = self.client.get(_AUTH_STATUS_URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['enabled'])
+        self.assertFalse(response.data['authenticated'])
+        self.assertEqual(response.data['auth_mode'], 'access_token')
+        self.assertEqual(response.data['username'], '')
+        self.assertEqual(response.data['login_url'], '/auth/login/local/?next=/')
+        self.assertEqual(response.data['logout_url'], '/auth/logout/?next=/')
+
+    def test_auth_status_endpoint_hides_local_access_token_mode_for_non_local_ip(self):
+        response = self.client.get(_AUTH_STATUS_URL, REMOTE_ADDR='10.0.0.55')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.data['enabled'])
+        self.assertEqual(response.data['auth_mode'], 'oauth')
+        self.assertEqual(response.data['login_url'], '/auth/login/mediawiki/?next=/')
 
-    @patch('locations.views.create_wikidata_building_item')
     @patch(
-        'locations.views._mediawiki_oauth_credentials_for_request',
-        return_value=({'oauth_token': 'token', 'oauth_token_secret': 'secret'}, '', 200),
+        'locations.views.fetch_wikidata_authenticated_username',
+        side_effect=_USERINFO_LOOKUP_ERROR,
+        new_callable=Mock,
     )
-    def test_wikidata_create_item_endpoint_enforces_source_for_official_closure_date(
+    def test_local_access_login_returns_502_when_username_lookup_fails(
         self,
-        oauth_credentials_mock,
-        create_wikidata_building_item_mock,
+        fetch_wikidata_authenticated_username_mock,
     ):
-        self._authenticate()
-        payload = {
-            'label': 'Example Building',
-            'description': 'Historic building in test city',
-            'instance_of_p31': 'Q41176',
-            'country_p17': 'Q33',
-            'municipality_p131': 'Q1757',
-            'latitude': 60.1699,
-            'longitude': 24.9384,
-            'official_closure_date_p3999': '1999-12-31',
-            'source_url': 'https://example.org/article',
-        }
+        response = self.client.get('/auth/login/local/?next=/')
 
-        response = self.client.post(
-            reverse('wikidata-create-item'),
-            payload,
-            format='json',
+        self.assertEqual(response.status_code, 502)
+        self.assertIn(b'"detail"', response.content)
+        fetch_wikidata_authenticated_username_mock.assert_called_once_with(
+            oauth_token='local-access-token',
+            oauth_token_secret='local-access-secret',
         )
 
-        self.assertEqual(response.status_code, 400)
-        self.assertIn('official_closure_date_source_url', response.data)
-        create_wikidata_building_item_mock.assert_not_called()
-        oauth_credentials_mock.assert_called_once()
+    def test_local_access_login_rejects_non_local_ip(self):
+        response = self.client.get('/auth/login/local/?next=/', REMOTE_ADDR='10.0.0.55')
 
-    def test_wikidata_write_endpoints_require_authentication(self):
-        image_file = SimpleUploadedFile('Example.jpg', b'test-image-bytes', content_type='image/jpeg')
-        add_existing_response = self.client.post(
-            reverse('wikidata-add-existing'),
-            {'wikidata_item': 'Q1757', 'source_url': 'https://example.org/article'},
-            format='json',
-        )
-        create_item_response = self.client.post(
-            reverse('wikidata-create-item'),
-            {
-                'label': 'Example Building',
-                'description': 'Historic building in test city',
-                'instance_of_p31': 'Q41176',
-                'country_p17': 'Q33',
-                'municipality_p131': 'Q1757',
-                'latitude': 60.1699,
-                'longitude': 24.9384,
-                'source_url': 'https://example.org/article',
-            },
-            format='json',
-        )
-        commons_upload_response = self.client.post(
-            reverse('commons-upload'),
-            {
-                'file': image_file,
-                'coordinate_source': 'exif',
-            },
-            format='multipart',
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(
+            response.data.get('detail'),
+            'Local development access token mode is only allowed from localhost.',
         )
 
-        self.assertEqual(add_existing_response.status_code, 401)
-        self.assertEqual(create_item_response.status_code, 401)
-        self.assertEqual(commons_upload_response.status_code, 401)
 
-    @patch('locations.views.fetch_wikidata_entity')
-    @patch('locations.views.fetch_location_detail')
-    def test_location_detail_omits_children_for_sparql_parent(
+@_local_token_settings
+class LocalAccessTokenAuthTests(LocationApiTestBase, APITestCase):
+    """Local access-token flows that log a user in and therefore need the
+    user and session tables."""
+    @patch(
+        'locations.views.fetch_wikidata_authenticated_username',
+        return_value='Zache',
+        new_callable=Mock,
+    )
+    def test_local_access_login_creates_user_and_sets_authenticated_session(
         self,
-        fetch_location_detail_mock,
-        fetch_wikidata_entity_mock,
+        fetch_wikidata_authenticated_username_mock,
     ):
-        parent_uri = 'https://www.wikidata.org/entity/Q1757'
-        encoded = quote(parent_uri, safe='')
-        fetch_location_detail_mock.return_value = {
-            'id': encoded,
-            'uri': parent_uri,
-            'name': 'Helsinki',
-            'description': 'From SPARQL',
-            'latitude': 60.1699,
-            'longitude': 24.9384,
-        }
-        fetch_wikidata_entity_mock.return_value = {
-            'id': 'Q1757',
-            'image_name': 'Helsinki city center.jpg',
-            'image_url': 'https://commons.wikimedia.org/wiki/Special:FilePath/Helsinki_city_center.jpg',
-        }
-
-        response = self.client.get(reverse('location-detail', kwargs={'location_id': encoded}), {'lang': 'fi'})
+        login_response = self.client.get('/auth/login/local/?next=/')
+        auth_response = self.client.get(_AUTH_STATUS_URL)
 
-        self.assertEqual(response.status_code, 200)
-        self.assertNotIn('children', response.data)
-        self.assertEqual(
-            response.data['image_url'],
-            'https://commons.wikimedia.org/wiki/Special:FilePath/Helsinki_city_center.jpg',
+        self.assertEqual(login_response.status_code, 302)
+        self.assertEqual(login_response.headers.get('Location'), '/')
+        self.assertEqual(auth_response.status_code, 200)
+        self.assertTrue(auth_response.data['authenticated'])
+        self.assertEqual(auth_response.data['username'], 'local_Zache')
+        self.assertEqual(auth_response.data['auth_mode'], 'access_token')
+        self.assertTrue(User.objects.filter(username='local_Zache').exists())
+        self.assertFalse(User.objects.filter(username='Zache').exists())
+        fetch_wikidata_authenticated_username_mock.assert_called_once_with(
+            oauth_token='local-access-token',
+            oauth_token_secret='local-access-secret',
         )
-        fetch_wikidata_entity_mock.assert_called_once_with('Q1757', lang='fi')
-        self.fetch_location_children_mock.assert_not_called()
 
-    def test_location_children_endpoint_includes_p361_and_p527_children(self):
-        parent_uri = 'https://www.wikidata.org/entity/Q1757'
-        encoded = quote(parent_uri, safe='')
-        self.fetch_location_children_mock.return_value = [
-            {
-                'id': quote('https://www.wikidata.org/entity/Q100', safe=''),
-                'uri': 'https://www.wikidata.org/entity/Q100',
-                'name': 'P361 child',
-                'source': 'sparql',
-                'commons_category': 'Helsinki districts',
-            },
-            {
-                'id': quote('https://www.wikidata.org/entity/Q200', safe=''),
-                'uri': 'https://www.wikidata.org/entity/Q200',
-                'name': 'P527 child',
-                'source': 'sparql',
-                'commons_category': 'Helsinki buildings',
-            },
-        ]
-
-        response = self.client.get(reverse('location-children'), {'lang': 'fi', 'location_id': encoded})
+    @patch('locations.views.ensure_wikidata_collection_membership', new_callable=Mock)
+    def test_wikidata_add_existing_endpoint_uses_local_access_token_fallback(
+        self,
+        ensure_wikidata_collection_membership_mock,
+    ):
+        with patch(
+            'locations.views.fetch_wikidata_authenticated_username',
+            return_value='Zache',
+            new_callable=Mock,
+        ) as username_mock:
+            login_response = self.client.get('/auth/login/local/?next=/')
 
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 2)
-        child_names = [item['name'] for item in response.data]
-        self.assertIn('P361 child', child_names)
-        self.assertIn('P527 child', child_names)
-        self.fetch_location_children_mock.assert_called_with(
-            uri='http://www.wikidata.org/entity/Q1757',
-            lang='fi',
+        self.assertEqual(login_response.status_code, 302)
+        self.assertEqual(login_response.headers.get('Location'), '/')
+        username_mock.assert_called_once_with(
+            oauth_token='local-access-token',
+            oauth_token_secret='local-access-secret',
         )
 
-    def test_location_children_endpoint_uses_http_wikidata_uri_when_given_http_id(self):
-        parent_uri = 'http://www.wikidata.org/entity/Q18660756'
-        encoded = quote(parent_uri, safe='')
-        self.fetch_location_children_mock.return_value = []
+        ensure_wikidata_collection_membership_mock.return_value = {
+            'qid': 'Q1757',
+            'uri': 'https://www.wikidata.org/entity/Q1757',
+            'already_listed': False,
+        }
 
-        response = self.client.get(reverse('location-children'), {'lang': 'fi', 'location_id': encoded})
+        response = self.client.post(
+            _WIKIDATA_ADD_EXISTING_URL,
+            {
+                'wikidata_item': 'Q1757',
+                'source_url': 'https://example.org/article',
+            },
+        )
 
         self.assertEqual(response.status_code, 200)
-        self.fetch_location_children_mock.assert_called_with(uri=parent_uri, lang='fi')
-
-    def test_location_children_endpoint_returns_404_for_removed_draft_uri(self):
-        encoded = quote('https://draft.local/location/123', safe='')
-
-        response = self.client.get(reverse('location-children'), {'lang': 'fi', 'location_id': encoded})
-
-        self.assertEqual(response.status_code, 404)
-        self.fetch_location_children_mock.assert_not_called()
-
-    def test_location_children_endpoint_returns_404_for_invalid_location_id(self):
-        response = self.client.get(reverse('location-children'), {'lang': 'fi', 'location_id': 'not-a-qid'})
-
-        self.assertEqual(response.status_code, 404)
-        self.fetch_location_children_mock.assert_not_called()
+        ensure_wikidata_collection_membership_mock.assert_called_once_with(
+            'Q1757',
+            oauth_token='local-access-token',
+            oauth_token_secret='local-access-secret',
+            source_url='https://example.org/article',
+            source_title='',
+            source_title_language='',
+            source_author='',
+            source_publication_date='',
+            source_publisher_p123='',
+            source_published_in_p1433='',
+            source_language_of_work_p407='',
+        )
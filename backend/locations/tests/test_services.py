@@ -28,6 +28,9 @@ from locations.services import (
 
 
 class WikidataWriteAuthTests(SimpleTestCase):
+    def setUp(self):
+        services._clear_wikidata_entity_caches()
+
     @override_settings(
         DEBUG=True,
         SOCIAL_AUTH_MEDIAWIKI_KEY='consumer-key',
@@ -209,14 +212,14 @@ class WikidataWriteAuthTests(SimpleTestCase):
         self.assertEqual(datavalue['amount'], '+12.5')
         self.assertEqual(datavalue['unit'], 'http://www.wikidata.org/entity/Q11573')
 
-    @patch('locations.services._set_claim_reference')
+    @patch('locations.services._wikidata_api_post')
     @patch('locations.services._wikidata_api_get')
     @patch('locations.services._wikidata_oauth_session')
     def test_ensure_collection_membership_adds_source_reference_to_existing_p5008_claim(
         self,
         wikidata_oauth_session_mock,
         wikidata_api_get_mock,
-        set_claim_reference_mock,
+        wikidata_api_post_mock,
     ):
         session = Mock()
         wikidata_oauth_session_mock.return_value = (session, 'csrf-token')
@@ -251,28 +254,33 @@ class WikidataWriteAuthTests(SimpleTestCase):
         )
 
         self.assertTrue(result['already_listed'])
-        set_claim_reference_mock.assert_called_once_with(
-            session,
-            'csrf-token',
-            'Q1757$P5008-claim',
-            'https://example.org/article',
-            source_title='Example article',
-            source_title_language='fi',
-            source_author='Example Author',
-            source_publication_date='2026-01-21',
-            source_publisher_p123='Q12321',
-            source_published_in_p1433='Q12345',
-            source_language_of_work_p407='Q1860',
-        )
+        wikidata_api_post_mock.assert_called_once()
+        self.assertIs(wikidata_api_post_mock.call_args.args[0], session)
+        post_params = wikidata_api_post_mock.call_args.args[1]
+        self.assertEqual(post_params['action'], 'wbeditentity')
+        self.assertEqual(post_params['id'], 'Q1757')
+        self.assertEqual(post_params['token'], 'csrf-token')
+        data = json.loads(post_params['data'])
+        self.assertEqual(len(data['claims']), 1)
+        patched_claim = data['claims'][0]
+        self.assertEqual(patched_claim['id'], 'Q1757$P5008-claim')
+        snaks = patched_claim['references'][-1]['snaks']
+        self.assertEqual(snaks['P854'][0]['datavalue']['value'], 'https://example.org/article')
+        self.assertEqual(snaks['P1476'][0]['datavalue']['value']['text'], 'Example article')
+        self.assertEqual(snaks['P1476'][0]['datavalue']['value']['language'], 'fi')
+        self.assertEqual(snaks['P2093'][0]['datavalue']['value'], 'Example Author')
+        self.assertEqual(snaks['P123'][0]['datavalue']['value']['numeric-id'], 12321)
+        self.assertEqual(snaks['P1433'][0]['datavalue']['value']['numeric-id'], 12345)
+        self.assertEqual(snaks['P407'][0]['datavalue']['value']['numeric-id'], 1860)
 
-    @patch('locations.services._set_claim_reference')
+    @patch('locations.services._wikidata_api_post')
     @patch('locations.services._wikidata_api_get')
     @patch('locations.services._wikidata_oauth_session')
     def test_ensure_collection_membership_skips_reference_when_same_source_url_exists(
         self,
         wikidata_oauth_session_mock,
         wikidata_api_get_mock,
-        set_claim_reference_mock,
+        wikidata_api_post_mock,
     ):
         session = Mock()
         wikidata_oauth_session_mock.return_value = (session, 'csrf-token')
@@ -313,16 +321,16 @@ class WikidataWriteAuthTests(SimpleTestCase):
         )
 
         self.assertTrue(result['already_listed'])
-        set_claim_reference_mock.assert_not_called()
+        wikidata_api_post_mock.assert_not_called()
 
-    @patch('locations.services._set_claim_reference')
+    @patch('locations.services._wikidata_api_post')
     @patch('locations.services._wikidata_api_get')
     @patch('locations.services._wikidata_oauth_session')
     def test_ensure_collection_membership_adds_reference_when_existing_url_lacks_new_entity_source_fields(
         self,
         wikidata_oauth_session_mock,
         wikidata_api_get_mock,
-        set_claim_reference_mock,
+        wikidata_api_post_mock,
     ):
         session = Mock()
         wikidata_oauth_session_mock.return_value = (session, 'csrf-token')
@@ -366,19 +374,23 @@ class WikidataWriteAuthTests(SimpleTestCase):
         )
 
         self.assertTrue(result['already_listed'])
-        set_claim_reference_mock.assert_called_once_with(
-            session,
-            'csrf-token',
-            'Q1757$P5008-claim',
-            'https://example.org/article',
-            source_title='',
-            source_title_language='',
-            source_author='',
-            source_publication_date='',
-            source_publisher_p123='Q12321',
-            source_published_in_p1433='Q12345',
-            source_language_of_work_p407='Q1860',
-        )
+        wikidata_api_post_mock.assert_called_once()
+        post_params = wikidata_api_post_mock.call_args.args[1]
+        self.assertEqual(post_params['action'], 'wbeditentity')
+        self.assertEqual(post_params['id'], 'Q1757')
+        data = json.loads(post_params['data'])
+        self.assertEqual(len(data['claims']), 1)
+        patched_claim = data['claims'][0]
+        self.assertEqual(patched_claim['id'], 'Q1757$P5008-claim')
+        # The existing reference is kept and the richer one appended.
+        self.assertEqual(len(patched_claim['references']), 2)
+        snaks = patched_claim['references'][-1]['snaks']
+        self.assertEqual(snaks['P854'][0]['datavalue']['value'], 'https://example.org/article')
+        self.assertNotIn('P1476', snaks)
+        self.assertNotIn('P2093', snaks)
+        self.assertEqual(snaks['P123'][0]['datavalue']['value']['numeric-id'], 12321)
+        self.assertEqual(snaks['P1433'][0]['datavalue']['value']['numeric-id'], 12345)
+        self.assertEqual(snaks['P407'][0]['datavalue']['value']['numeric-id'], 1860)
 
 
     @patch('locations.services._commons_api_get')
@@ -548,26 +560,24 @@ class WikidataWriteAuthTests(SimpleTestCase):
         self.assertEqual(commons_api_post_mock.call_count, 4)
         upload_call = commons_api_post_mock.call_args_list[0]
         point_of_view_call = commons_api_post_mock.call_args_list[1]
-        first_depict_call = commons_api_post_mock.call_args_list[2]
-        second_depict_call = commons_api_post_mock.call_args_list[3]
+        # The depicts claims are written concurrently, so their call order
+        # is not guaranteed.
+        depict_calls = commons_api_post_mock.call_args_list[2:]
 
         self.assertEqual(upload_call.kwargs['data']['action'], 'upload')
         self.assertEqual(point_of_view_call.kwargs['data']['action'], 'wbcreateclaim')
         self.assertEqual(point_of_view_call.kwargs['data']['entity'], 'M12345')
         self.assertEqual(point_of_view_call.kwargs['data']['property'], 'P1259')
-        self.assertEqual(first_depict_call.kwargs['data']['action'], 'wbcreateclaim')
-        self.assertEqual(first_depict_call.kwargs['data']['entity'], 'M12345')
-        self.assertEqual(first_depict_call.kwargs['data']['property'], 'P180')
-        self.assertEqual(second_depict_call.kwargs['data']['action'], 'wbcreateclaim')
-        self.assertEqual(second_depict_call.kwargs['data']['entity'], 'M12345')
-        self.assertEqual(second_depict_call.kwargs['data']['property'], 'P180')
-
-        first_depict_value = json.loads(first_depict_call.kwargs['data']['value'])
-        second_depict_value = json.loads(second_depict_call.kwargs['data']['value'])
-        self.assertEqual(first_depict_value['entity-type'], 'item')
-        self.assertEqual(first_depict_value['numeric-id'], 811979)
-        self.assertEqual(second_depict_value['entity-type'], 'item')
-        self.assertEqual(second_depict_value['numeric-id'], 16970)
+
+        depict_numeric_ids = set()
+        for depict_call in depict_calls:
+            self.assertEqual(depict_call.kwargs['data']['action'], 'wbcreateclaim')
+            self.assertEqual(depict_call.kwargs['data']['entity'], 'M12345')
+            self.assertEqual(depict_call.kwargs['data']['property'], 'P180')
+            depict_value = json.loads(depict_call.kwargs['data']['value'])
+            self.assertEqual(depict_value['entity-type'], 'item')
+            depict_numeric_ids.add(depict_value['numeric-id'])
+        self.assertEqual(depict_numeric_ids, {811979, 16970})
 
     @patch('locations.services._commons_api_get')
     @patch('locations.services._commons_api_post')
@@ -651,7 +661,11 @@ class WikidataWriteAuthTests(SimpleTestCase):
 
 
 class LocationServiceTests(SimpleTestCase):
-    @patch('locations.services.requests.get')
+    def setUp(self):
+        services._clear_wikidata_entity_caches()
+        services._clear_search_response_cache()
+
+    @patch('locations.services._READ_SESSION.get')
     def test_fetch_citoid_metadata_parses_response(self, requests_get_mock):
         response = Mock()
         response.raise_for_status.return_value = None
@@ -678,7 +692,7 @@ class LocationServiceTests(SimpleTestCase):
         self.assertEqual(result['source_language_of_work_p407'], 'Q1412')
 
     @patch('locations.services._resolve_wikidata_qid')
-    @patch('locations.services.requests.get')
+    @patch('locations.services._READ_SESSION.get')
     def test_fetch_citoid_metadata_autofills_p123_p1433_and_p407(
         self,
         requests_get_mock,
@@ -711,7 +725,7 @@ class LocationServiceTests(SimpleTestCase):
         with self.assertRaises(ExternalServiceError):
             services.fetch_citoid_metadata('example.org/article')
 
-    @patch('locations.services.requests.post')
+    @patch('locations.services._READ_SESSION.post')
     def test_query_sparql_raises_for_non_json_response(self, requests_post_mock):
         response = Mock()
         response.raise_for_status.return_value = None
@@ -730,7 +744,7 @@ class LocationServiceTests(SimpleTestCase):
         self.assertNotIn('SPARQL query:\n', message)
         self.assertNotIn(query, message)
 
-    @patch('locations.services.requests.post')
+    @patch('locations.services._READ_SESSION.post')
     def test_query_sparql_request_error_includes_query(self, requests_post_mock):
         requests_post_mock.side_effect = services.requests.RequestException('connection failed')
 
@@ -744,7 +758,7 @@ class LocationServiceTests(SimpleTestCase):
         self.assertNotIn(query, message)
 
     @override_settings(SPARQL_ENDPOINT='https://qlever.cs.uni-freiburg.de/api/wikidata')
-    @patch('locations.services.requests.post')
+    @patch('locations.services._READ_SESSION.post')
     def test_query_sparql_request_error_uses_qlever_ui_url(self, requests_post_mock):
         requests_post_mock.side_effect = services.requests.RequestException('connection failed')
 
@@ -758,7 +772,7 @@ class LocationServiceTests(SimpleTestCase):
         )
         self.assertIn(quote(query, safe=''), message)
 
-    @patch('locations.services.requests.post')
+    @patch('locations.services._READ_SESSION.post')
     def test_query_sparql_accepts_xml_response(self, requests_post_mock):
         response = Mock()
         response.raise_for_status.return_value = None
@@ -786,7 +800,7 @@ class LocationServiceTests(SimpleTestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]['itemLabel']['value'], 'Helsinki')
 
-    @patch('locations.services.requests.post')
+    @patch('locations.services._READ_SESSION.post')
     def test_wikidata_nearby_same_name_lookup_builds_valid_language_in_clause(self, requests_post_mock):
         response = Mock()
         response.raise_for_status.return_value = None
@@ -811,7 +825,7 @@ class LocationServiceTests(SimpleTestCase):
         self.assertIn('FILTER(LANG(?candidateLabel) IN ("fi", "en"))', query)
         self.assertNotIn('FILTER(LANG(?candidateLabel) IN ("fi" "en"))', query)
 
-    @patch('locations.services.requests.get')
+    @patch('locations.services._READ_SESSION.get')
     def test_fetch_latest_osm_feature_metadata_returns_osm_metadata(
         self,
         requests_get_mock,
@@ -854,7 +868,7 @@ class LocationServiceTests(SimpleTestCase):
         self.assertNotIn('wikidata_reverse_candidates', result)
         self.assertNotIn('wikidata_name_match_candidates', result)
 
-    @patch('locations.services.requests.get')
+    @patch('locations.services._READ_SESSION.get')
     def test_fetch_latest_osm_feature_metadata_keeps_name_empty_when_osm_name_missing(
         self,
         requests_get_mock,
@@ -893,7 +907,7 @@ class LocationServiceTests(SimpleTestCase):
         self.assertNotIn('wikidata_reverse_candidates', result)
         self.assertNotIn('wikidata_name_match_candidates', result)
 
-    @patch('locations.services.requests.get')
+    @patch('locations.services._READ_SESSION.get')
     def test_fetch_latest_osm_feature_metadata_returns_direct_wikidata_from_tags(
         self,
         requests_get_mock,
@@ -1843,6 +1857,9 @@ class LocationServiceTests(SimpleTestCase):
         self.assertEqual(args[1]['doit'], '1')
 
 class LocationImageCountCacheTests(TestCase):
+    def setUp(self):
+        services._clear_image_count_lrus()
+
     @patch('locations.services._queue_image_count_refresh')
     def test_enrich_locations_with_image_counts_returns_cached_values_and_queues_stale_entries(
         self,
@@ -1955,6 +1972,9 @@ class LocationImageCountCacheTests(TestCase):
 
 
 class ReverseGeocodeAdministrativeResolutionTests(SimpleTestCase):
+    def setUp(self):
+        services._clear_search_response_cache()
+
     def test_municipality_labels_prioritize_city_over_regional_grouping(self):
         labels = services._municipality_labels_from_address({
             'municipality': 'Helsingin seutukunta',